@@ -11,11 +11,16 @@ from typing import Any, Optional
 import asyncpg
 
 from ..models.cards import CardMode
+from .cache import INTRADAY_TTL_SECONDS
 
 
 class BaseCardHandler(ABC):
     """Abstract base class for card data handlers."""
 
+    # How long a payload for today's trading date may be served from cache;
+    # handlers over faster-moving data override it
+    CACHE_INTRADAY_TTL_SECONDS: float = INTRADAY_TTL_SECONDS
+
     def __init__(self, db_pool: asyncpg.Pool):
         """
         Initialize handler with database pool.
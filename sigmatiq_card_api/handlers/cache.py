@@ -0,0 +1,141 @@
+"""
+In-process response cache for card handlers.
+
+Handlers are instantiated per request, so caches live at module level in each
+handler module. Entries are keyed by whatever uniquely identifies a formatted
+payload (typically symbol, mode and trading date) and expire on a TTL.
+
+Concurrent misses for the same key are coalesced: only the first caller runs
+the fetch, the rest wait on a per-key lock and read the stored result.
+
+CardService keeps single-card responses in its shared KV cache with the same
+ttl_for_trading_date() TTLs (using the handler's CACHE_INTRADAY_TTL_SECONDS),
+so GET and batch requests go stale on the same schedule.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from datetime import date
+from typing import Any, Optional
+
+# TTLs for cached card payloads
+INTRADAY_TTL_SECONDS = 900  # 15 minutes while the trading date is still today
+SETTLED_TTL_SECONDS = 86400  # 24 hours once the trading date is in the past
+
+
+def ttl_for_trading_date(
+    trading_date: date,
+    intraday_ttl: float = INTRADAY_TTL_SECONDS,
+    settled_ttl: float = SETTLED_TTL_SECONDS,
+) -> float:
+    """
+    Pick a cache TTL based on whether the trading date can still change.
+
+    Args:
+        trading_date: Trading date the payload was built for
+        intraday_ttl: TTL for today's (still updating) data
+        settled_ttl: TTL for past trading dates
+
+    Returns:
+        TTL in seconds
+    """
+    return intraday_ttl if trading_date >= date.today() else settled_ttl
+
+
+class TTLCache:
+    """Bounded LRU cache with per-entry expiry and request coalescing."""
+
+    def __init__(self, maxsize: int = 2048):
+        """
+        Initialize cache.
+
+        Args:
+            maxsize: Maximum number of entries before least-recently-used eviction
+        """
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._locks: dict[Hashable, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a live entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Store an entry, evicting the least recently used one when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Time to live in seconds
+        """
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        ttl: float,
+    ) -> Any:
+        """
+        Return the cached value for key, computing it once on a miss.
+
+        A None result is returned but not cached, since get() cannot tell it
+        apart from a miss; it would only hold an LRU slot until it expired.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value on a miss
+            ttl: Time to live in seconds for a freshly computed value
+
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        try:
+            async with lock:
+                # Another waiter may have filled the entry while we queued
+                value = self.get(key)
+                if value is None:
+                    value = await factory()
+                    if value is not None:
+                        self.set(key, value, ttl)
+        finally:
+            if not lock.locked() and self._locks.get(key) is lock:
+                del self._locks[key]
+
+        return value
@@ -10,18 +10,217 @@ Shows insider trading patterns:
 Data source: sb.insider_transactions (expected table)
 """
 
+import asyncio
+from collections import Counter
+from collections.abc import Iterator
 from datetime import date, timedelta
-from typing import Any, Optional
+from itertools import groupby, islice
+from operator import itemgetter
+from typing import Any, Final, Optional
 
 from fastapi import HTTPException
 
 from ..models.cards import CardMode
 from .base import BaseCardHandler
+from .cache import TTLCache, ttl_for_trading_date
+
+# POSIX regex matched against the title for the executive aggregates ("vice president"
+# is covered by "president"); the query's ~* operator makes it case-insensitive
+_EXECUTIVE_PATTERN: Final[str] = "ceo|cfo|coo|president|chief|officer|vp"
+
+# Rows fetched in every mode; the 5 most recent buys/sells may sit behind awards and exercises
+_ROW_LIMIT: Final[int] = 50
+
+# Columns fetched per mode; beginner and intermediate skip fields they never render
+_COLUMNS_BY_MODE: dict[CardMode, tuple[str, ...]] = {
+    CardMode.beginner: (
+        "transaction_date",
+        "owner_name",
+        "owner_title",
+        "transaction_type",
+        "shares",
+        "value",
+    ),
+    CardMode.intermediate: (
+        "transaction_date",
+        "filing_date",
+        "owner_name",
+        "owner_title",
+        "transaction_type",
+        "shares",
+        "price_per_share",
+        "value",
+    ),
+    CardMode.advanced: (
+        "transaction_date",
+        "filing_date",
+        "owner_name",
+        "owner_title",
+        "transaction_type",
+        "shares",
+        "price_per_share",
+        "value",
+        "shares_owned_after",
+        "is_direct_ownership",
+    ),
+}
+
+# Recent insider transactions (last 6 months); transaction_type is 'P' (purchase),
+# 'S' (sale), 'A' (award) or 'M' (option exercise)
+_TRANSACTIONS_QUERIES: Final[dict[CardMode, str]] = {mode: f"""
+        SELECT {", ".join(columns)}
+        FROM sb.insider_transactions
+        WHERE symbol = $1
+          AND transaction_date >= $2
+          AND transaction_date <= $3
+        ORDER BY transaction_date DESC
+        LIMIT $4
+    """ for mode, columns in _COLUMNS_BY_MODE.items()}
+
+# Window-level counts and sums computed server-side in one pass; $4 is the
+# executive title pattern
+_AGGREGATE_COLUMNS: Final[str] = """
+        COUNT(*) AS transaction_count,
+        COUNT(*) FILTER (WHERE transaction_type = 'P') AS buy_count,
+        COUNT(*) FILTER (WHERE transaction_type = 'S') AS sell_count,
+        COUNT(*) FILTER (WHERE transaction_type = 'A') AS award_count,
+        COUNT(*) FILTER (WHERE transaction_type = 'M') AS exercise_count,
+        COUNT(*) FILTER (WHERE is_direct_ownership) AS direct_count,
+        COALESCE(SUM(value) FILTER (WHERE transaction_type = 'P'), 0) AS buy_value,
+        COALESCE(SUM(value) FILTER (WHERE transaction_type = 'S'), 0) AS sell_value,
+        COUNT(*) FILTER (WHERE owner_title ~* $4) AS exec_count,
+        COUNT(*) FILTER (WHERE transaction_type = 'P' AND owner_title ~* $4) AS exec_buy_count,
+        COUNT(*) FILTER (WHERE transaction_type = 'S' AND owner_title ~* $4) AS exec_sell_count,
+        COALESCE(
+            SUM(CASE transaction_type WHEN 'P' THEN value WHEN 'S' THEN -value END)
+                FILTER (WHERE owner_title ~* $4),
+            0
+        ) AS exec_net_value,
+        COUNT(*) FILTER (WHERE owner_title ILIKE '%director%') AS board_count,
+        (ARRAY_AGG(value ORDER BY transaction_date DESC, value DESC NULLS LAST)
+            FILTER (WHERE transaction_type = 'P'))[1] AS first_buy_value,
+        (ARRAY_AGG(owner_name ORDER BY transaction_date DESC, value DESC NULLS LAST)
+            FILTER (WHERE transaction_type = 'P'))[1] AS first_buy_owner,
+        MAX(transaction_date) FILTER (WHERE transaction_type = 'P') AS first_buy_date
+"""
+
+_AGGREGATES_QUERY: Final[str] = f"""
+    SELECT {_AGGREGATE_COLUMNS}
+    FROM sb.insider_transactions
+    WHERE symbol = $1
+      AND transaction_date >= $2
+      AND transaction_date <= $3
+"""
+
+# Batched variants for watchlists: one round-trip for all symbols, rows capped
+# per symbol and ordered so they group by symbol
+_BATCH_TRANSACTIONS_QUERIES: Final[dict[CardMode, str]] = {mode: f"""
+        SELECT symbol, {", ".join(columns)}
+        FROM (
+            SELECT *,
+                   ROW_NUMBER() OVER (PARTITION BY symbol ORDER BY transaction_date DESC) AS rn
+            FROM sb.insider_transactions
+            WHERE symbol = ANY($1::text[])
+              AND transaction_date >= $2
+              AND transaction_date <= $3
+        ) ranked
+        WHERE rn <= $4
+        ORDER BY symbol, transaction_date DESC
+    """ for mode, columns in _COLUMNS_BY_MODE.items()}
+
+_BATCH_AGGREGATES_QUERY: Final[str] = f"""
+    SELECT symbol, {_AGGREGATE_COLUMNS}
+    FROM sb.insider_transactions
+    WHERE symbol = ANY($1::text[])
+      AND transaction_date >= $2
+      AND transaction_date <= $3
+    GROUP BY symbol
+"""
+
+# Formatted payloads keyed by (symbol, mode, trading_date)
+_RESPONSE_CACHE = TTLCache(maxsize=2048)
 
 
 class InsiderTransactionsHandler(BaseCardHandler):
     """Handler for ticker_insider card - insider trading activity."""
 
+    # Transaction types shown in the beginner activity feed
+    _BUY_SELL: Final[frozenset[str]] = frozenset({"P", "S"})
+
+    # Fewer filings than this in the window are too thin for timing/pattern signals
+    _MIN_ANALYSIS_TRANSACTIONS: Final[int] = 3
+
+    # Beginner feed verbs for the buy/sell type codes
+    _ACTION_LABELS: Final[dict[str, str]] = {"P": "Bought", "S": "Sold"}
+
+    # Display labels for transaction type codes
+    _TXN_TYPE_LABELS: Final[dict[str, str]] = {
+        "P": "Purchase",
+        "S": "Sale",
+        "A": "Award",
+        "M": "Option Exercise",
+    }
+
+    # Static sentiment lookup tables (built once, not per request)
+    _SENTIMENT_EMOJI: Final[dict[str, str]] = {
+        "very_bullish": "🚀",
+        "bullish": "📈",
+        "neutral": "➡️",
+        "bearish": "📉",
+        "very_bearish": "⚠️",
+    }
+
+    _SUMMARY_TEMPLATES: Final[dict[str, str]] = {
+        "very_bullish": (
+            "Insiders are buying heavily! {b} buy transactions vs {s} sales. Very bullish signal."
+        ),
+        "bullish": "Insiders are buying. {b} buys vs {s} sales. Bullish signal.",
+        "neutral": "Mixed insider activity. {b} buys, {s} sales. No clear signal.",
+        "bearish": "More insider selling than buying. {b} buys vs {s} sales. Caution.",
+        "very_bearish": "Heavy insider selling. {b} buys vs {s} sales. Warning sign.",
+    }
+
+    _SENTIMENT_EXPLANATIONS: Final[dict[str, str]] = {
+        "very_bullish": (
+            "Multiple insiders buying = they think stock is undervalued. Strong bullish signal."
+        ),
+        "bullish": "Net insider buying = positive signal. Insiders think stock will go up.",
+        "neutral": (
+            "Balanced activity. Some routine selling (compensation), some buying. No clear signal."
+        ),
+        "bearish": "More selling than buying. May be normal compensation sales OR bearish signal.",
+        "very_bearish": (
+            "Heavy insider selling = insiders may see problems or overvaluation. "
+            "Proceed with caution."
+        ),
+    }
+
+    _BEGINNER_ADVICE: Final[dict[str, str]] = {
+        "very_bullish": (
+            "Strong buy signal. "
+            "Consider buying, but verify other factors (fundamentals, technicals)."
+        ),
+        "bullish": "Positive signal. Can add to conviction if considering purchase.",
+        "neutral": "No clear signal from insiders. Make decision based on other factors.",
+        "bearish": "Caution. Wait for more data or avoid unless you have strong contrarian thesis.",
+        "very_bearish": (
+            "Warning sign. Insiders know something. Avoid or consider selling if you own."
+        ),
+    }
+
+    # Signal/action by sentiment; "very_bullish" only maps to a buy with 2+ clusters
+    _TRADING_SIGNALS: Final[dict[str, str]] = {
+        "bullish": "BUY - Net insider buying",
+        "neutral": "HOLD - Mixed activity",
+        "bearish": "CAUTION - More selling than buying",
+    }
+
+    _RECOMMENDED_ACTIONS: Final[dict[str, str]] = {
+        "bullish": "Positive signal - can support buy thesis",
+        "neutral": "No action based on insiders - use other factors",
+        "bearish": "Wait for clarity - insider activity concerning",
+    }
+
     async def fetch(
         self,
         mode: CardMode,
@@ -48,95 +247,193 @@ class InsiderTransactionsHandler(BaseCardHandler):
                 detail="Symbol is required for ticker_insider card",
             )
 
-        # Fetch recent insider transactions (last 6 months)
-        transactions_query = """
-            SELECT
-                filing_date,
-                transaction_date,
-                owner_name,
-                owner_title,
-                transaction_type,  -- 'P' (purchase), 'S' (sale), 'A' (award), 'M' (option exercise)
-                shares,
-                price_per_share,
-                value,
-                shares_owned_after,
-                is_direct_ownership
-            FROM sb.insider_transactions
-            WHERE symbol = $1
-              AND transaction_date >= $2
-              AND transaction_date <= $3
-            ORDER BY transaction_date DESC
-            LIMIT 50
-        """
+        return await _RESPONSE_CACHE.get_or_set(
+            (symbol, mode, trading_date),
+            lambda: self._fetch_uncached(mode, symbol, trading_date),
+            ttl_for_trading_date(trading_date),
+        )
 
+    async def _fetch_uncached(
+        self,
+        mode: CardMode,
+        symbol: str,
+        trading_date: date,
+    ) -> dict[str, Any]:
+        """Query and format insider data, bypassing the response cache."""
         start_date = trading_date - timedelta(days=180)  # Last 6 months
 
-        transactions = await self._fetch_all(
-            transactions_query,
-            {"symbol": symbol, "start_date": start_date, "end_date": trading_date}
+        transactions, totals = await asyncio.gather(
+            self._fetch_all(
+                _TRANSACTIONS_QUERIES[mode],
+                {
+                    "symbol": symbol,
+                    "start_date": start_date,
+                    "end_date": trading_date,
+                    "row_limit": _ROW_LIMIT,
+                },
+            ),
+            self._fetch_one(
+                _AGGREGATES_QUERY,
+                {
+                    "symbol": symbol,
+                    "start_date": start_date,
+                    "end_date": trading_date,
+                    "exec_pattern": _EXECUTIVE_PATTERN,
+                },
+            ),
         )
 
-        if not transactions:
+        if not transactions or not totals or not totals["transaction_count"]:
             raise HTTPException(
                 status_code=404,
                 detail=f"No insider transaction data for {symbol} in the past 6 months",
             )
 
-        # Calculate aggregate metrics
-        buys = [t for t in transactions if t.get("transaction_type") == "P"]
-        sales = [t for t in transactions if t.get("transaction_type") == "S"]
+        return self._build_card(mode, symbol, transactions, totals, trading_date)
+
+    async def fetch_many(
+        self,
+        mode: CardMode,
+        symbols: list[str],
+        trading_date: date,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch insider transaction data for several symbols in one round-trip.
+
+        Args:
+            mode: Response complexity level
+            symbols: Stock symbols
+            trading_date: Current trading date
+
+        Returns:
+            Formatted card data keyed by symbol; symbols without insider
+            activity in the past 6 months are omitted
+        """
+        cards: dict[str, dict[str, Any]] = {}
+        ttl = ttl_for_trading_date(trading_date)
+
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            cached = _RESPONSE_CACHE.get((symbol, mode, trading_date))
+            if cached is not None:
+                cards[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return cards
+
+        start_date = trading_date - timedelta(days=180)  # Last 6 months
+
+        rows, totals_rows = await asyncio.gather(
+            self._fetch_all(
+                _BATCH_TRANSACTIONS_QUERIES[mode],
+                {
+                    "symbols": missing,
+                    "start_date": start_date,
+                    "end_date": trading_date,
+                    "row_limit": _ROW_LIMIT,
+                },
+            ),
+            self._fetch_all(
+                _BATCH_AGGREGATES_QUERY,
+                {
+                    "symbols": missing,
+                    "start_date": start_date,
+                    "end_date": trading_date,
+                    "exec_pattern": _EXECUTIVE_PATTERN,
+                },
+            ),
+        )
 
-        total_buy_value = sum(float(t["value"]) for t in buys if t.get("value"))
-        total_sell_value = sum(float(t["value"]) for t in sales if t.get("value"))
+        totals_by_symbol = {t["symbol"]: t for t in totals_rows}
+        for symbol, group in groupby(rows, key=itemgetter("symbol")):
+            totals = totals_by_symbol.get(symbol)
+            if not totals or not totals["transaction_count"]:
+                continue
+            card = self._build_card(mode, symbol, list(group), totals, trading_date)
+            _RESPONSE_CACHE.set((symbol, mode, trading_date), card, ttl)
+            cards[symbol] = card
 
-        net_value = total_buy_value - total_sell_value
-        sentiment = self._assess_sentiment(total_buy_value, total_sell_value, len(buys), len(sales))
+        return cards
+
+    def _build_card(
+        self,
+        mode: CardMode,
+        symbol: str,
+        transactions: list[dict],
+        totals: Any,
+        trading_date: date,
+    ) -> dict[str, Any]:
+        """Aggregate fetched rows and totals and format them for the mode."""
+        # Combine SQL totals with the row-level breakdowns
+        agg = self._aggregate(totals, transactions)
+
+        net_value = agg["buy_value"] - agg["sell_value"]
+        sentiment = self._assess_sentiment(
+            agg["buy_value"], agg["sell_value"], agg["buy_count"], agg["sell_count"]
+        )
 
         # Format based on mode
         if mode == CardMode.beginner:
-            return self._format_beginner(symbol, transactions, buys, sales, sentiment, net_value)
+            return self._format_beginner(symbol, agg, sentiment, net_value)
         elif mode == CardMode.intermediate:
-            return self._format_intermediate(symbol, transactions, buys, sales, sentiment, net_value, total_buy_value, total_sell_value)
+            return self._format_intermediate(symbol, agg, sentiment, net_value)
         else:
-            return self._format_advanced(symbol, transactions, buys, sales, sentiment, total_buy_value, total_sell_value)
+            return self._format_advanced(symbol, agg, sentiment, trading_date)
 
     def _format_beginner(
         self,
         symbol: str,
-        transactions: list[dict],
-        buys: list[dict],
-        sales: list[dict],
+        agg: dict[str, Any],
         sentiment: str,
         net_value: float,
     ) -> dict[str, Any]:
         """Format for beginner mode - simplified insider activity."""
-        sentiment_emoji = {
-            "very_bullish": "🚀",
-            "bullish": "📈",
-            "neutral": "➡️",
-            "bearish": "📉",
-            "very_bearish": "⚠️",
-        }.get(sentiment, "❓")
+        cols = agg["columns"]
+        types, dates, owners, titles = (
+            cols["transaction_type"],
+            cols["transaction_date"],
+            cols["owner_name"],
+            cols["owner_title"],
+        )
+        shares, values = cols["shares"], cols["value"]
+
+        sentiment_emoji = self._SENTIMENT_EMOJI.get(sentiment, "❓")
+
+        action_labels = self._ACTION_LABELS
+
+        def fmt_row(i: int) -> dict[str, Any]:
+            v = values[i]
+            return {
+                "date": dates[i],
+                "insider": owners[i],
+                "title": titles[i],
+                "action": action_labels[types[i]],
+                "shares": f"{shares[i]:,}" if shares[i] else None,
+                "value": f"${v/1e3:.0f}K" if v and v < 1e6 else f"${v/1e6:.1f}M" if v else None,
+            }
 
         return {
             "symbol": symbol,
             "insider_sentiment": sentiment,
             "sentiment_emoji": sentiment_emoji,
-            "simple_summary": self._get_beginner_summary(sentiment, len(buys), len(sales)),
-            "buy_transactions": len(buys),
-            "sell_transactions": len(sales),
-            "net_activity": "Net Buying" if net_value > 0 else "Net Selling" if net_value < 0 else "Balanced",
-            "net_value": f"${abs(net_value)/1e6:.1f}M" if abs(net_value) >= 1e6 else f"${abs(net_value)/1e3:.0f}K",
+            "simple_summary": self._get_beginner_summary(
+                sentiment, agg["buy_count"], agg["sell_count"]
+            ),
+            "buy_transactions": agg["buy_count"],
+            "sell_transactions": agg["sell_count"],
+            "net_activity": (
+                "Net Buying" if net_value > 0 else "Net Selling" if net_value < 0 else "Balanced"
+            ),
+            "net_value": (
+                f"${abs(net_value)/1e6:.1f}M"
+                if abs(net_value) >= 1e6
+                else f"${abs(net_value)/1e3:.0f}K"
+            ),
             "recent_activity": [
-                {
-                    "date": str(t["transaction_date"]) if t.get("transaction_date") else None,
-                    "insider": t.get("owner_name"),
-                    "title": t.get("owner_title"),
-                    "action": "Bought" if t.get("transaction_type") == "P" else "Sold",
-                    "shares": f"{int(t['shares']):,}" if t.get("shares") else None,
-                    "value": f"${float(t['value'])/1e3:.0f}K" if t.get("value") and float(t["value"]) < 1e6 else f"${float(t['value'])/1e6:.1f}M" if t.get("value") else None,
-                }
-                for t in transactions[:5] if t.get("transaction_type") in ["P", "S"]
+                fmt_row(i)
+                for i in islice((i for i, tt in enumerate(types) if tt in self._BUY_SELL), 5)
             ],
             "what_it_means": self._explain_sentiment(sentiment),
             "educational_tip": "Insiders are company executives and board members. They have inside information. Consistent insider buying = bullish signal. Heavy selling may be normal (compensation) or bearish.",
@@ -146,117 +443,135 @@ class InsiderTransactionsHandler(BaseCardHandler):
     def _format_intermediate(
         self,
         symbol: str,
-        transactions: list[dict],
-        buys: list[dict],
-        sales: list[dict],
+        agg: dict[str, Any],
         sentiment: str,
         net_value: float,
-        total_buy_value: float,
-        total_sell_value: float,
     ) -> dict[str, Any]:
         """Format for intermediate mode - detailed insider metrics."""
-        # Calculate clusters (multiple insiders buying within short period)
-        buy_clusters = self._find_clusters(buys)
+        total_buy_value = agg["buy_value"]
+        total_sell_value = agg["sell_value"]
+        first_buy = agg["first_buy"]
+        cols = agg["columns"]
+        types, dates, filing_dates = (
+            cols["transaction_type"],
+            cols["transaction_date"],
+            cols["filing_date"],
+        )
+        owners, titles = cols["owner_name"], cols["owner_title"]
+        shares, prices, values = cols["shares"], cols["price_per_share"], cols["value"]
+        type_labels = self._TXN_TYPE_LABELS
 
-        # Separate by insider type
-        exec_buys = [t for t in buys if self._is_executive(t.get("owner_title"))]
-        exec_sales = [t for t in sales if self._is_executive(t.get("owner_title"))]
+        # Calculate clusters (multiple insiders buying within short period)
+        buy_clusters = self._find_clusters(agg["buy_dates"], agg["buy_values"])
 
         return {
             "symbol": symbol,
             "summary": {
                 "insider_sentiment": sentiment,
                 "timeframe": "6 months",
-                "total_transactions": len(transactions),
-                "buy_transactions": len(buys),
-                "sell_transactions": len(sales),
+                "total_transactions": agg["transaction_count"],
+                "buy_transactions": agg["buy_count"],
+                "sell_transactions": agg["sell_count"],
             },
             "financial_metrics": {
                 "total_buy_value": round(total_buy_value, 2),
                 "total_sell_value": round(total_sell_value, 2),
                 "net_insider_value": round(net_value, 2),
-                "buy_sell_ratio": round(total_buy_value / total_sell_value, 2) if total_sell_value > 0 else None,
+                "buy_sell_ratio": (
+                    round(total_buy_value / total_sell_value, 2) if total_sell_value > 0 else None
+                ),
             },
             "activity_breakdown": {
-                "executive_buys": len(exec_buys),
-                "executive_sells": len(exec_sales),
+                "executive_buys": agg["exec_buy_count"],
+                "executive_sells": agg["exec_sell_count"],
                 "buy_clusters_detected": len(buy_clusters),
-                "largest_buy": {
-                    "value": round(float(buys[0]["value"]), 2),
-                    "insider": buys[0].get("owner_name"),
-                    "date": str(buys[0]["transaction_date"]),
-                } if buys and buys[0].get("value") else None,
+                "largest_buy": (
+                    {
+                        "value": round(float(first_buy["value"]), 2),
+                        "insider": first_buy.get("owner_name"),
+                        "date": first_buy["transaction_date"].isoformat(),
+                    }
+                    if first_buy is not None and first_buy.get("value")
+                    else None
+                ),
             },
             "recent_transactions": [
                 {
-                    "transaction_date": str(t["transaction_date"]) if t.get("transaction_date") else None,
-                    "filing_date": str(t["filing_date"]) if t.get("filing_date") else None,
-                    "owner_name": t.get("owner_name"),
-                    "owner_title": t.get("owner_title"),
-                    "transaction_type": "Purchase" if t.get("transaction_type") == "P" else "Sale" if t.get("transaction_type") == "S" else t.get("transaction_type"),
-                    "shares": int(t["shares"]) if t.get("shares") else None,
-                    "price_per_share": round(float(t["price_per_share"]), 2) if t.get("price_per_share") else None,
-                    "total_value": round(float(t["value"]), 2) if t.get("value") else None,
+                    "transaction_date": dates[i],
+                    "filing_date": filing_dates[i],
+                    "owner_name": owners[i],
+                    "owner_title": titles[i],
+                    "transaction_type": type_labels.get(types[i], types[i]),
+                    "shares": shares[i],
+                    "price_per_share": round(prices[i], 2) if prices[i] else None,
+                    "total_value": round(values[i], 2) if values[i] else None,
                 }
-                for t in transactions[:15]
+                for i in range(min(15, len(types)))
             ],
-            "interpretation": self._get_intermediate_interpretation(sentiment, len(buy_clusters), len(exec_buys)),
+            "interpretation": self._get_intermediate_interpretation(
+                sentiment, len(buy_clusters), agg["exec_buy_count"]
+            ),
             "trading_signal": self._get_trading_signal(sentiment, len(buy_clusters)),
         }
 
     def _format_advanced(
         self,
         symbol: str,
-        transactions: list[dict],
-        buys: list[dict],
-        sales: list[dict],
+        agg: dict[str, Any],
         sentiment: str,
-        total_buy_value: float,
-        total_sell_value: float,
+        trading_date: date,
     ) -> dict[str, Any]:
         """Format for advanced mode - comprehensive insider analysis."""
-        # Advanced analytics
-        buy_clusters = self._find_clusters(buys)
-        timing_analysis = self._analyze_timing(buys, sales)
-        insider_patterns = self._analyze_patterns(transactions)
-
-        # Breakdown by transaction type
-        purchases = [t for t in transactions if t.get("transaction_type") == "P"]
-        sales_trans = [t for t in transactions if t.get("transaction_type") == "S"]
-        awards = [t for t in transactions if t.get("transaction_type") == "A"]
-        exercises = [t for t in transactions if t.get("transaction_type") == "M"]
-
-        # Breakdown by insider role
-        exec_trans = [t for t in transactions if self._is_executive(t.get("owner_title"))]
-        board_trans = [t for t in transactions if "director" in (t.get("owner_title") or "").lower()]
+        total_buy_value = agg["buy_value"]
+        total_sell_value = agg["sell_value"]
+        buy_count = agg["buy_count"]
+        sell_count = agg["sell_count"]
+
+        # Advanced analytics (clusters already short-circuit below two buys)
+        buy_clusters = self._find_clusters(agg["buy_dates"], agg["buy_values"])
+        if agg["transaction_count"] < self._MIN_ANALYSIS_TRANSACTIONS:
+            timing_analysis = {"pattern": "insufficient_data"}
+            insider_patterns = {
+                "pattern_type": "insufficient_data",
+                "unique_insiders": len(agg["unique_insiders"]),
+            }
+        else:
+            timing_analysis = self._analyze_timing(
+                agg["buy_dates"], agg["sale_dates"], trading_date
+            )
+            insider_patterns = self._analyze_patterns(agg)
 
         return {
             "symbol": symbol,
             "sentiment_analysis": {
                 "overall_sentiment": sentiment,
-                "sentiment_score": self._calculate_sentiment_score(total_buy_value, total_sell_value),
-                "confidence": self._assess_confidence(len(buys), len(sales), buy_clusters),
+                "sentiment_score": self._calculate_sentiment_score(
+                    total_buy_value, total_sell_value
+                ),
+                "confidence": self._assess_confidence(buy_count, sell_count, buy_clusters),
             },
             "transaction_breakdown": {
-                "purchases": len(purchases),
-                "sales": len(sales_trans),
-                "awards": len(awards),
-                "option_exercises": len(exercises),
-                "direct_ownership": len([t for t in transactions if t.get("is_direct_ownership")]),
-                "indirect_ownership": len([t for t in transactions if not t.get("is_direct_ownership")]),
+                "purchases": buy_count,
+                "sales": sell_count,
+                "awards": agg["award_count"],
+                "option_exercises": agg["exercise_count"],
+                "direct_ownership": agg["direct_count"],
+                "indirect_ownership": agg["transaction_count"] - agg["direct_count"],
             },
             "financial_analysis": {
                 "total_buy_value": round(total_buy_value, 2),
                 "total_sell_value": round(total_sell_value, 2),
                 "net_value": round(total_buy_value - total_sell_value, 2),
-                "buy_sell_ratio": round(total_buy_value / total_sell_value, 2) if total_sell_value > 0 else None,
-                "avg_buy_size": round(total_buy_value / len(buys), 2) if buys else None,
-                "avg_sell_size": round(total_sell_value / len(sales), 2) if sales else None,
+                "buy_sell_ratio": (
+                    round(total_buy_value / total_sell_value, 2) if total_sell_value > 0 else None
+                ),
+                "avg_buy_size": round(total_buy_value / buy_count, 2) if buy_count else None,
+                "avg_sell_size": round(total_sell_value / sell_count, 2) if sell_count else None,
             },
             "insider_role_breakdown": {
-                "executive_transactions": len(exec_trans),
-                "board_transactions": len(board_trans),
-                "executive_net_value": round(self._calculate_net_value(exec_trans), 2),
+                "executive_transactions": agg["exec_count"],
+                "board_transactions": agg["board_count"],
+                "executive_net_value": round(agg["exec_net_value"], 2),
             },
             "cluster_analysis": {
                 "buy_clusters": len(buy_clusters),
@@ -271,39 +586,181 @@ class InsiderTransactionsHandler(BaseCardHandler):
             },
             "timing_analysis": timing_analysis,
             "patterns": insider_patterns,
-            "all_transactions": [
-                {
-                    "transaction_date": str(t["transaction_date"]) if t.get("transaction_date") else None,
-                    "filing_date": str(t["filing_date"]) if t.get("filing_date") else None,
-                    "owner_name": t.get("owner_name"),
-                    "owner_title": t.get("owner_title"),
-                    "transaction_type": t.get("transaction_type"),
-                    "shares": int(t["shares"]) if t.get("shares") else None,
-                    "price_per_share": round(float(t["price_per_share"]), 4) if t.get("price_per_share") else None,
-                    "value": round(float(t["value"]), 2) if t.get("value") else None,
-                    "shares_owned_after": int(t["shares_owned_after"]) if t.get("shares_owned_after") else None,
-                    "is_direct": t.get("is_direct_ownership"),
-                }
-                for t in transactions
-            ],
+            "all_transactions": list(self._iter_transaction_rows(agg["columns"])),
             "trading_implications": {
-                "signal_strength": self._assess_signal_strength(sentiment, len(buy_clusters), len(buys)),
+                "signal_strength": self._assess_signal_strength(
+                    sentiment, len(buy_clusters), buy_count
+                ),
                 "recommended_action": self._get_recommended_action(sentiment, len(buy_clusters)),
                 "risk_factors": self._get_risk_factors(total_sell_value, total_buy_value),
             },
         }
 
     @staticmethod
-    def _assess_sentiment(buy_value: float, sell_value: float, buy_count: int, sell_count: int) -> str:
+    def _iter_transaction_rows(cols: dict[str, list]) -> Iterator[dict[str, Any]]:
+        """
+        Yield advanced-mode transaction rows straight from the column lists.
+
+        Numerics were coerced once in _aggregate (and come from fixed-scale
+        NUMERIC columns), so values pass through without further rounding.
+        """
+        for d, fd, owner, title, tt, sh, px, v, sa, direct in zip(
+            cols["transaction_date"],
+            cols["filing_date"],
+            cols["owner_name"],
+            cols["owner_title"],
+            cols["transaction_type"],
+            cols["shares"],
+            cols["price_per_share"],
+            cols["value"],
+            cols["shares_owned_after"],
+            cols["is_direct_ownership"],
+        ):
+            yield {
+                "transaction_date": d,
+                "filing_date": fd,
+                "owner_name": owner,
+                "owner_title": title,
+                "transaction_type": tt,
+                "shares": sh,
+                "price_per_share": px,
+                "value": v,
+                "shares_owned_after": sa,
+                "is_direct": direct,
+            }
+
+    @staticmethod
+    def _aggregate(totals: Any, transactions: list[dict]) -> dict[str, Any]:
+        """
+        Combine SQL window totals with row-level breakdowns.
+
+        Rows are converted once into parallel column lists (numerics coerced to
+        float/int, zero and NULL mapped to None, dates rendered as ISO strings)
+        so formatters index into plain lists instead of re-reading and
+        re-converting record fields. Columns a mode does not select come back
+        as lists of None.
+
+        Args:
+            totals: Aggregate row covering the whole 6-month window
+            transactions: Fetched insider transaction rows (most recent first)
+
+        Returns:
+            Dictionary of counts and value sums, row columns, buy/sell date and
+            value lists, unique insiders and per-buyer counts
+        """
+        types: list[Optional[str]] = []
+        dates: list[Optional[str]] = []
+        filing_dates: list[Optional[str]] = []
+        owners: list[Optional[str]] = []
+        titles: list[Optional[str]] = []
+        shares: list[Optional[int]] = []
+        prices: list[Optional[float]] = []
+        values: list[Optional[float]] = []
+        shares_after: list[Optional[int]] = []
+        direct: list[Optional[bool]] = []
+
+        buy_dates: list[Optional[date]] = []
+        buy_values: list[Optional[float]] = []
+        sale_dates: list[Optional[date]] = []
+        unique_insiders: set[str] = set()
+        buyer_counts: Counter[str] = Counter()
+
+        for t in transactions:
+            tt = t["transaction_type"]
+            name = t["owner_name"]
+            d = t["transaction_date"]
+            v = t["value"]
+            vf = float(v) if v else None
+            sh = t["shares"]
+            px = t.get("price_per_share")
+            sa = t.get("shares_owned_after")
+
+            fd = t.get("filing_date")
+
+            types.append(tt)
+            dates.append(d.isoformat() if d else None)
+            filing_dates.append(fd.isoformat() if fd else None)
+            owners.append(name)
+            titles.append(t["owner_title"])
+            shares.append(int(sh) if sh else None)
+            prices.append(float(px) if px else None)
+            values.append(vf)
+            shares_after.append(int(sa) if sa else None)
+            direct.append(t.get("is_direct_ownership"))
+
+            if name:
+                unique_insiders.add(name)
+            if tt == "P":
+                buy_dates.append(d)
+                buy_values.append(vf)
+                if name:
+                    buyer_counts[name] += 1
+            elif tt == "S":
+                sale_dates.append(d)
+
+        first_buy = None
+        if totals["first_buy_date"] is not None:
+            first_buy = {
+                "value": totals["first_buy_value"],
+                "owner_name": totals["first_buy_owner"],
+                "transaction_date": totals["first_buy_date"],
+            }
+
+        return {
+            "transaction_count": totals["transaction_count"],
+            "columns": {
+                "transaction_type": types,
+                "transaction_date": dates,
+                "filing_date": filing_dates,
+                "owner_name": owners,
+                "owner_title": titles,
+                "shares": shares,
+                "price_per_share": prices,
+                "value": values,
+                "shares_owned_after": shares_after,
+                "is_direct_ownership": direct,
+            },
+            "buy_dates": buy_dates,
+            "buy_values": buy_values,
+            "sale_dates": sale_dates,
+            "first_buy": first_buy,
+            "buy_count": totals["buy_count"],
+            "sell_count": totals["sell_count"],
+            "buy_value": float(totals["buy_value"]),
+            "sell_value": float(totals["sell_value"]),
+            "exec_buy_count": totals["exec_buy_count"],
+            "exec_sell_count": totals["exec_sell_count"],
+            "exec_count": totals["exec_count"],
+            "exec_net_value": float(totals["exec_net_value"]),
+            "board_count": totals["board_count"],
+            "award_count": totals["award_count"],
+            "exercise_count": totals["exercise_count"],
+            "direct_count": totals["direct_count"],
+            "unique_insiders": unique_insiders,
+            "buyer_counts": buyer_counts,
+        }
+
+    @staticmethod
+    def _assess_sentiment(
+        buy_value: float, sell_value: float, buy_count: int, sell_count: int
+    ) -> str:
         """Assess overall insider sentiment."""
         if buy_value == 0 and sell_value == 0:
             return "neutral"
 
         # Net value ratio
-        net_ratio = (buy_value - sell_value) / (buy_value + sell_value) if (buy_value + sell_value) > 0 else 0
+        net_ratio = (
+            (buy_value - sell_value) / (buy_value + sell_value)
+            if (buy_value + sell_value) > 0
+            else 0
+        )
 
         # Transaction count ratio
-        count_ratio = (buy_count - sell_count) / (buy_count + sell_count) if (buy_count + sell_count) > 0 else 0
+        count_ratio = (
+            (buy_count - sell_count) / (buy_count + sell_count)
+            if (buy_count + sell_count) > 0
+            else 0
+        )
 
         # Combined score
         combined_score = (net_ratio * 0.7) + (count_ratio * 0.3)
@@ -320,61 +777,76 @@ class InsiderTransactionsHandler(BaseCardHandler):
             return "neutral"
 
     @staticmethod
-    def _is_executive(title: Optional[str]) -> bool:
-        """Check if insider is an executive."""
-        if not title:
-            return False
-        title_lower = title.lower()
-        exec_keywords = ["ceo", "cfo", "coo", "president", "chief", "officer", "vp", "vice president"]
-        return any(keyword in title_lower for keyword in exec_keywords)
-
-    @staticmethod
-    def _find_clusters(transactions: list[dict]) -> list[dict]:
+    def _find_clusters(dates: list[Optional[date]], values: list[Optional[float]]) -> list[dict]:
         """Find clusters of buying activity (multiple insiders buying within 30 days)."""
-        if len(transactions) < 2:
+        if len(dates) < 2:
             return []
 
-        clusters = []
-        sorted_trans = sorted(transactions, key=lambda t: t.get("transaction_date") or date.min)
+        # (ordinal, date, value) tuples so the sweep compares plain ints;
+        # stable sort on the ordinal alone via the C-level itemgetter
+        dated = [(d.toordinal(), d, v or 0.0) for d, v in zip(dates, values) if d]
+        dated.sort(key=itemgetter(0))
 
+        clusters = []
+        n = len(dated)
         i = 0
-        while i < len(sorted_trans):
-            cluster_start = sorted_trans[i]["transaction_date"]
-            cluster_end = cluster_start + timedelta(days=30)
-
-            cluster_trans = []
-            j = i
-            while j < len(sorted_trans) and sorted_trans[j]["transaction_date"] <= cluster_end:
-                cluster_trans.append(sorted_trans[j])
+        while i < n:
+            start_ord, start_date, window_value = dated[i]
+            cutoff = start_ord + 30
+
+            # Advance j over the 30-day window, keeping a running value sum
+            end_date = start_date
+            j = i + 1
+            while j < n:
+                ordinal, txn_date, value = dated[j]
+                if ordinal > cutoff:
+                    break
+                window_value += value
+                end_date = txn_date
                 j += 1
 
-            if len(cluster_trans) >= 2:  # At least 2 insiders
-                cluster_value = sum(float(t["value"]) for t in cluster_trans if t.get("value"))
-                clusters.append({
-                    "start_date": str(cluster_start),
-                    "end_date": str(sorted_trans[j-1]["transaction_date"]) if j > i else str(cluster_start),
-                    "count": len(cluster_trans),
-                    "value": cluster_value,
-                })
+            if j - i >= 2:  # At least 2 insiders
+                clusters.append(
+                    {
+                        "start_date": start_date.isoformat(),
+                        "end_date": end_date.isoformat(),
+                        "count": j - i,
+                        "value": window_value,
+                    }
+                )
 
-            i = j if j > i else i + 1
+            i = j
 
         return clusters
 
     @staticmethod
-    def _analyze_timing(buys: list[dict], sales: list[dict]) -> dict:
-        """Analyze timing patterns of insider transactions."""
-        if not buys and not sales:
+    def _analyze_timing(
+        buy_dates: list[Optional[date]],
+        sale_dates: list[Optional[date]],
+        as_of: date,
+    ) -> dict:
+        """Analyze timing patterns of insider transactions relative to the trading date."""
+        if not buy_dates and not sale_dates:
             return {"pattern": "no_activity"}
 
-        recent_30d = date.today() - timedelta(days=30)
-        recent_90d = date.today() - timedelta(days=90)
-
-        recent_buys_30d = len([b for b in buys if b.get("transaction_date") and b["transaction_date"] >= recent_30d])
-        recent_sales_30d = len([s for s in sales if s.get("transaction_date") and s["transaction_date"] >= recent_30d])
-
-        recent_buys_90d = len([b for b in buys if b.get("transaction_date") and b["transaction_date"] >= recent_90d])
-        recent_sales_90d = len([s for s in sales if s.get("transaction_date") and s["transaction_date"] >= recent_90d])
+        cutoff_30d = (as_of - timedelta(days=30)).toordinal()
+        cutoff_90d = (as_of - timedelta(days=90)).toordinal()
+
+        def count_recent(dates: list[Optional[date]]) -> tuple[int, int]:
+            """Count dates inside the 30- and 90-day windows in one pass."""
+            within_30d = within_90d = 0
+            for d in dates:
+                if not d:
+                    continue
+                ordinal = d.toordinal()
+                if ordinal >= cutoff_90d:
+                    within_90d += 1
+                    if ordinal >= cutoff_30d:
+                        within_30d += 1
+            return within_30d, within_90d
+
+        recent_buys_30d, recent_buys_90d = count_recent(buy_dates)
+        recent_sales_30d, recent_sales_90d = count_recent(sale_dates)
 
         pattern = "unknown"
         if recent_buys_30d > 3:
@@ -395,28 +867,28 @@ class InsiderTransactionsHandler(BaseCardHandler):
         }
 
     @staticmethod
-    def _analyze_patterns(transactions: list[dict]) -> dict:
-        """Analyze insider trading patterns."""
-        if not transactions:
+    def _analyze_patterns(agg: dict[str, Any]) -> dict:
+        """
+        Analyze insider trading patterns.
+
+        Uses the row-level counters built in the single pass over the fetched
+        rows, so insider, buyer and buy/sell counts all describe the same rows.
+        """
+        if not agg["transaction_count"]:
             return {"pattern_type": "no_data"}
 
-        # Count unique insiders
-        unique_insiders = len(set(t.get("owner_name") for t in transactions if t.get("owner_name")))
+        unique_insiders = len(agg["unique_insiders"])
+        purchases = len(agg["buy_dates"])
+        sales = len(agg["sale_dates"])
 
         # Check for repeated buyers
-        buyer_counts = {}
-        for t in transactions:
-            if t.get("transaction_type") == "P" and t.get("owner_name"):
-                buyer_counts[t["owner_name"]] = buyer_counts.get(t["owner_name"], 0) + 1
-
-        repeat_buyers = sum(1 for count in buyer_counts.values() if count > 1)
+        repeat_buyers = sum(1 for count in agg["buyer_counts"].values() if count > 1)
 
-        pattern_type = "unknown"
         if repeat_buyers > 2:
             pattern_type = "consistent_accumulation"
-        elif unique_insiders > 5 and len([t for t in transactions if t.get("transaction_type") == "P"]) > 7:
+        elif unique_insiders > 5 and purchases > 7:
             pattern_type = "broad_buying"
-        elif len([t for t in transactions if t.get("transaction_type") == "S"]) > len([t for t in transactions if t.get("transaction_type") == "P"]) * 2:
+        elif sales > purchases * 2:
             pattern_type = "heavy_selling"
         else:
             pattern_type = "mixed"
@@ -427,13 +899,6 @@ class InsiderTransactionsHandler(BaseCardHandler):
             "repeat_buyers": repeat_buyers,
         }
 
-    @staticmethod
-    def _calculate_net_value(transactions: list[dict]) -> float:
-        """Calculate net transaction value."""
-        buys = sum(float(t["value"]) for t in transactions if t.get("transaction_type") == "P" and t.get("value"))
-        sales = sum(float(t["value"]) for t in transactions if t.get("transaction_type") == "S" and t.get("value"))
-        return buys - sales
-
     @staticmethod
     def _calculate_sentiment_score(buy_value: float, sell_value: float) -> int:
         """Calculate sentiment score (0-100)."""
@@ -453,41 +918,23 @@ class InsiderTransactionsHandler(BaseCardHandler):
         else:
             return "low"
 
-    @staticmethod
-    def _get_beginner_summary(sentiment: str, buy_count: int, sell_count: int) -> str:
+    @classmethod
+    def _get_beginner_summary(cls, sentiment: str, buy_count: int, sell_count: int) -> str:
         """Get beginner summary."""
-        summaries = {
-            "very_bullish": f"Insiders are buying heavily! {buy_count} buy transactions vs {sell_count} sales. Very bullish signal.",
-            "bullish": f"Insiders are buying. {buy_count} buys vs {sell_count} sales. Bullish signal.",
-            "neutral": f"Mixed insider activity. {buy_count} buys, {sell_count} sales. No clear signal.",
-            "bearish": f"More insider selling than buying. {buy_count} buys vs {sell_count} sales. Caution.",
-            "very_bearish": f"Heavy insider selling. {buy_count} buys vs {sell_count} sales. Warning sign.",
-        }
-        return summaries.get(sentiment, "Insider activity unclear")
+        template = cls._SUMMARY_TEMPLATES.get(sentiment)
+        if template is None:
+            return "Insider activity unclear"
+        return template.format(b=buy_count, s=sell_count)
 
-    @staticmethod
-    def _explain_sentiment(sentiment: str) -> str:
+    @classmethod
+    def _explain_sentiment(cls, sentiment: str) -> str:
         """Explain what sentiment means."""
-        explanations = {
-            "very_bullish": "Multiple insiders buying = they think stock is undervalued. Strong bullish signal.",
-            "bullish": "Net insider buying = positive signal. Insiders think stock will go up.",
-            "neutral": "Balanced activity. Some routine selling (compensation), some buying. No clear signal.",
-            "bearish": "More selling than buying. May be normal compensation sales OR bearish signal.",
-            "very_bearish": "Heavy insider selling = insiders may see problems or overvaluation. Proceed with caution.",
-        }
-        return explanations.get(sentiment, "Unclear")
+        return cls._SENTIMENT_EXPLANATIONS.get(sentiment, "Unclear")
 
-    @staticmethod
-    def _get_beginner_advice(sentiment: str) -> str:
+    @classmethod
+    def _get_beginner_advice(cls, sentiment: str) -> str:
         """Get beginner advice."""
-        advice = {
-            "very_bullish": "Strong buy signal. Consider buying, but verify other factors (fundamentals, technicals).",
-            "bullish": "Positive signal. Can add to conviction if considering purchase.",
-            "neutral": "No clear signal from insiders. Make decision based on other factors.",
-            "bearish": "Caution. Wait for more data or avoid unless you have strong contrarian thesis.",
-            "very_bearish": "Warning sign. Insiders know something. Avoid or consider selling if you own.",
-        }
-        return advice.get(sentiment, "Evaluate carefully")
+        return cls._BEGINNER_ADVICE.get(sentiment, "Evaluate carefully")
 
     @staticmethod
     def _get_intermediate_interpretation(sentiment: str, clusters: int, exec_buys: int) -> str:
@@ -509,19 +956,12 @@ class InsiderTransactionsHandler(BaseCardHandler):
 
         return base
 
-    @staticmethod
-    def _get_trading_signal(sentiment: str, clusters: int) -> str:
+    @classmethod
+    def _get_trading_signal(cls, sentiment: str, clusters: int) -> str:
         """Get trading signal."""
         if sentiment == "very_bullish" and clusters >= 2:
             return "STRONG BUY - Multiple insiders buying in clusters"
-        elif sentiment == "bullish":
-            return "BUY - Net insider buying"
-        elif sentiment == "neutral":
-            return "HOLD - Mixed activity"
-        elif sentiment == "bearish":
-            return "CAUTION - More selling than buying"
-        else:
-            return "AVOID - Heavy insider selling"
+        return cls._TRADING_SIGNALS.get(sentiment, "AVOID - Heavy insider selling")
 
     @staticmethod
     def _assess_signal_strength(sentiment: str, clusters: int, buy_count: int) -> str:
@@ -536,19 +976,14 @@ class InsiderTransactionsHandler(BaseCardHandler):
         else:
             return "weak"
 
-    @staticmethod
-    def _get_recommended_action(sentiment: str, clusters: int) -> str:
+    @classmethod
+    def _get_recommended_action(cls, sentiment: str, clusters: int) -> str:
         """Get recommended action."""
         if sentiment == "very_bullish" and clusters >= 2:
             return "Consider buying - strong insider confidence"
-        elif sentiment == "bullish":
-            return "Positive signal - can support buy thesis"
-        elif sentiment == "neutral":
-            return "No action based on insiders - use other factors"
-        elif sentiment == "bearish":
-            return "Wait for clarity - insider activity concerning"
-        else:
-            return "Avoid or consider selling - heavy insider selling"
+        return cls._RECOMMENDED_ACTIONS.get(
+            sentiment, "Avoid or consider selling - heavy insider selling"
+        )
 
     @staticmethod
     def _get_risk_factors(sell_value: float, buy_value: float) -> list[str]:
@@ -10,18 +10,79 @@ Shows institutional ownership data:
 Data source: sb.institutional_ownership (expected table)
 """
 
+from collections.abc import Callable
 from datetime import date
-from typing import Any, Optional
+from operator import itemgetter
+from typing import Any, Final, Optional
 
 from fastapi import HTTPException
 
 from ..models.cards import CardMode
 from .base import BaseCardHandler
+from .cache import TTLCache, ttl_for_trading_date
+
+# Institutional ownership % above 40 is moderate, above 70 high
+_OWNERSHIP_MODERATE_PCT: Final[int] = 40
+_OWNERSHIP_HIGH_PCT: Final[int] = 70
+_OWNERSHIP_LEVELS: Final[tuple[str, str, str]] = ("Low", "Moderate", "High")
+
+# Holder row fields, unpacked in one C-level call per row (every row shares the
+# latest report_date, which is rendered once per request instead)
+_HOLDING_FIELDS: Final = itemgetter(
+    "institution_name", "shares_held", "pct_of_shares", "change_in_shares", "change_pct"
+)
+
+# Top holders of the latest report on or before the trading date, with
+# report-wide totals, concentration and position-change counts computed
+# in SQL and attached to every row (one round-trip)
+_HOLDINGS_QUERY: Final[str] = """
+    WITH latest AS (
+        SELECT MAX(report_date) AS report_date
+        FROM sb.institutional_ownership
+        WHERE symbol = $1 AND report_date <= $2
+    ),
+    report AS (
+        SELECT
+            report_date,
+            institution_name,
+            shares_held::bigint AS shares_held,
+            pct_of_shares::double precision AS pct_of_shares,
+            change_in_shares::bigint AS change_in_shares,
+            change_pct::double precision AS change_pct,
+            ROW_NUMBER() OVER (ORDER BY shares_held DESC) AS rn
+        FROM sb.institutional_ownership
+        WHERE symbol = $1 AND report_date = (SELECT report_date FROM latest)
+    ),
+    summary AS (
+        SELECT
+            SUM(shares_held)::bigint as total_institutional_shares,
+            COUNT(DISTINCT institution_name) as institution_count,
+            COUNT(*) as position_count,
+            COALESCE(SUM(pct_of_shares), 0)::double precision as total_pct,
+            COALESCE(SUM(pct_of_shares) FILTER (WHERE rn <= 5), 0)::double precision as top_5_pct,
+            COALESCE(SUM(pct_of_shares) FILTER (WHERE rn <= 10), 0)::double precision as top_10_pct,
+            COUNT(*) FILTER (WHERE change_in_shares > 0) as increasing,
+            COUNT(*) FILTER (WHERE change_in_shares < 0) as decreasing,
+            CURRENT_DATE - (SELECT report_date FROM latest) as data_age_days
+        FROM report
+    )
+    SELECT r.*, s.*
+    FROM report r
+    CROSS JOIN summary s
+    WHERE r.rn <= 20
+    ORDER BY r.rn
+"""
+
+# Formatted payloads keyed by (symbol, mode, trading_date)
+_RESPONSE_CACHE = TTLCache(maxsize=4096)
 
 
 class InstitutionalOwnershipHandler(BaseCardHandler):
     """Handler for ticker_institutional card - institutional ownership analysis."""
 
+    # 13F holdings only change quarterly, so even today's card can live for an hour
+    CACHE_INTRADAY_TTL_SECONDS = 3600
+
     async def fetch(
         self,
         mode: CardMode,
@@ -31,120 +92,169 @@ class InstitutionalOwnershipHandler(BaseCardHandler):
         if not symbol:
             raise HTTPException(400, "Symbol required for ticker_institutional")
 
-        # Fetch latest institutional holdings
-        holdings_query = """
-            SELECT
-                report_date,
-                institution_name,
-                shares_held,
-                pct_of_shares,
-                change_in_shares,
-                change_pct
-            FROM sb.institutional_ownership
-            WHERE symbol = $1 AND report_date <= $2
-            ORDER BY report_date DESC, shares_held DESC
-            LIMIT 20
-        """
-
-        # Aggregate summary
-        summary_query = """
-            SELECT
-                report_date,
-                SUM(shares_held) as total_institutional_shares,
-                COUNT(DISTINCT institution_name) as institution_count
-            FROM sb.institutional_ownership
-            WHERE symbol = $1 AND report_date <= $2
-            GROUP BY report_date
-            ORDER BY report_date DESC
-            LIMIT 1
-        """
-
-        holdings = await self._fetch_all(holdings_query, {"symbol": symbol, "report_date": trading_date})
-        summary = await self._fetch_one(summary_query, {"symbol": symbol, "report_date": trading_date})
-
-        if not holdings and not summary:
+        return await _RESPONSE_CACHE.get_or_set(
+            (symbol, mode, trading_date),
+            lambda: self._fetch_uncached(mode, symbol, trading_date),
+            ttl_for_trading_date(trading_date, intraday_ttl=self.CACHE_INTRADAY_TTL_SECONDS),
+        )
+
+    async def _fetch_uncached(
+        self,
+        mode: CardMode,
+        symbol: str,
+        trading_date: date,
+    ) -> dict[str, Any]:
+        """Query and format institutional holdings, bypassing the response cache."""
+        holdings = await self._fetch_all(
+            _HOLDINGS_QUERY, {"symbol": symbol, "report_date": trading_date}
+        )
+
+        if not holdings:
             raise HTTPException(404, f"No institutional data for {symbol}")
 
-        latest_report_date = holdings[0]["report_date"] if holdings else summary["report_date"]
-
-        # Calculate metrics
-        total_pct = sum(float(h["pct_of_shares"]) for h in holdings if h.get("pct_of_shares")) if holdings else 0
-        increasing = sum(1 for h in holdings if h.get("change_in_shares") and float(h["change_in_shares"]) > 0)
-        decreasing = sum(1 for h in holdings if h.get("change_in_shares") and float(h["change_in_shares"]) < 0)
-
-        if mode == CardMode.beginner:
-            return {
-                "symbol": symbol,
-                "institutional_ownership_pct": round(total_pct, 1),
-                "ownership_level": "High" if total_pct > 70 else "Moderate" if total_pct > 40 else "Low",
-                "top_holders": [
-                    {"name": h["institution_name"], "shares_pct": round(float(h["pct_of_shares"]), 2)}
-                    for h in holdings[:5]
-                ],
-                "recent_trend": "Increasing" if increasing > decreasing else "Decreasing" if decreasing > increasing else "Stable",
-                "what_it_means": f"{total_pct:.0f}% owned by institutions (mutual funds, hedge funds). High ownership = professional confidence.",
-                "educational_tip": "Institutional ownership shows how many 'smart money' investors own the stock. High ownership often means good fundamentals.",
-                "report_date": str(latest_report_date),
-            }
-        elif mode == CardMode.intermediate:
-            return {
-                "symbol": symbol,
-                "ownership_metrics": {
-                    "total_institutional_pct": round(total_pct, 2),
-                    "institution_count": int(summary["institution_count"]) if summary else len(holdings),
-                    "top_10_concentration": round(sum(float(h["pct_of_shares"]) for h in holdings[:10] if h.get("pct_of_shares")), 2),
-                },
-                "recent_activity": {
-                    "institutions_increasing": increasing,
-                    "institutions_decreasing": decreasing,
-                    "net_sentiment": "Bullish" if increasing > decreasing else "Bearish" if decreasing > increasing else "Neutral",
-                },
-                "top_holders": [
-                    {
-                        "institution": h["institution_name"],
-                        "shares_held": int(h["shares_held"]) if h.get("shares_held") else None,
-                        "pct_of_shares": round(float(h["pct_of_shares"]), 3) if h.get("pct_of_shares") else None,
-                        "change_shares": int(h["change_in_shares"]) if h.get("change_in_shares") else None,
-                        "change_pct": round(float(h["change_pct"]), 2) if h.get("change_pct") else None,
-                    }
-                    for h in holdings[:10]
-                ],
-                "report_date": str(latest_report_date),
-                "interpretation": f"Institutional ownership: {total_pct:.1f}%. {increasing} increasing, {decreasing} decreasing positions.",
-            }
-        else:
-            return {
-                "symbol": symbol,
-                "summary_metrics": {
-                    "total_institutional_ownership_pct": round(total_pct, 4),
-                    "total_institutions": int(summary["institution_count"]) if summary else len(holdings),
-                    "total_shares_held": int(summary["total_institutional_shares"]) if summary and summary.get("total_institutional_shares") else None,
-                },
-                "concentration_analysis": {
-                    "top_5_pct": round(sum(float(h["pct_of_shares"]) for h in holdings[:5] if h.get("pct_of_shares")), 4),
-                    "top_10_pct": round(sum(float(h["pct_of_shares"]) for h in holdings[:10] if h.get("pct_of_shares")), 4),
-                    "concentration_level": "High" if len(holdings) > 0 and float(holdings[0]["pct_of_shares"]) > 10 else "Moderate",
-                },
-                "activity_analysis": {
-                    "increasing_positions": increasing,
-                    "decreasing_positions": decreasing,
-                    "stable_positions": len(holdings) - increasing - decreasing,
-                    "net_flow": "accumulation" if increasing > decreasing else "distribution" if decreasing > increasing else "neutral",
-                },
-                "institutional_holders": [
-                    {
-                        "institution_name": h["institution_name"],
-                        "shares_held": int(h["shares_held"]) if h.get("shares_held") else None,
-                        "pct_of_shares": round(float(h["pct_of_shares"]), 6) if h.get("pct_of_shares") else None,
-                        "change_in_shares": int(h["change_in_shares"]) if h.get("change_in_shares") else None,
-                        "change_pct": round(float(h["change_pct"]), 4) if h.get("change_pct") else None,
-                        "report_date": str(h["report_date"]),
-                    }
-                    for h in holdings
-                ],
-                "data_quality": {
-                    "report_date": str(latest_report_date),
-                    "data_age_days": (date.today() - latest_report_date).days,
-                    "reporting_lag": "Quarterly filings (13F) - data is delayed",
-                },
-            }
+        summary = holdings[0]
+        report_date_str = summary["report_date"].isoformat()
+
+        return self._FORMATTERS[mode](self, symbol, holdings, summary, report_date_str)
+
+    def _format_beginner(
+        self,
+        symbol: str,
+        holdings: list[Any],
+        summary: Any,
+        report_date_str: str,
+    ) -> dict[str, Any]:
+        """Format for beginner mode - ownership level and top holders."""
+        total_pct = summary["total_pct"]
+        increasing = summary["increasing"]
+        decreasing = summary["decreasing"]
+
+        return {
+            "symbol": symbol,
+            "institutional_ownership_pct": round(total_pct, 1),
+            "ownership_level": _OWNERSHIP_LEVELS[
+                (total_pct > _OWNERSHIP_MODERATE_PCT) + (total_pct > _OWNERSHIP_HIGH_PCT)
+            ],
+            "top_holders": [
+                {"name": name, "shares_pct": round(pct, 2)}
+                for name, _, pct, _, _ in map(_HOLDING_FIELDS, holdings[:5])
+            ],
+            "recent_trend": (
+                "Increasing"
+                if increasing > decreasing
+                else "Decreasing" if decreasing > increasing else "Stable"
+            ),
+            "what_it_means": (
+                f"{total_pct:.0f}% owned by institutions (mutual funds, hedge funds). "
+                "High ownership = professional confidence."
+            ),
+            "educational_tip": (
+                "Institutional ownership shows how many 'smart money' investors own the stock. "
+                "High ownership often means good fundamentals."
+            ),
+            "report_date": report_date_str,
+        }
+
+    def _format_intermediate(
+        self,
+        symbol: str,
+        holdings: list[Any],
+        summary: Any,
+        report_date_str: str,
+    ) -> dict[str, Any]:
+        """Format for intermediate mode - ownership metrics and recent activity."""
+        total_pct = summary["total_pct"]
+        increasing = summary["increasing"]
+        decreasing = summary["decreasing"]
+
+        return {
+            "symbol": symbol,
+            "ownership_metrics": {
+                "total_institutional_pct": round(total_pct, 2),
+                "institution_count": summary["institution_count"],
+                "top_10_concentration": round(summary["top_10_pct"], 2),
+            },
+            "recent_activity": {
+                "institutions_increasing": increasing,
+                "institutions_decreasing": decreasing,
+                "net_sentiment": (
+                    "Bullish"
+                    if increasing > decreasing
+                    else "Bearish" if decreasing > increasing else "Neutral"
+                ),
+            },
+            "top_holders": [
+                {
+                    "institution": name,
+                    "shares_held": shares or None,
+                    "pct_of_shares": round(pct, 3) if pct else None,
+                    "change_shares": chg or None,
+                    "change_pct": round(chg_pct, 2) if chg_pct else None,
+                }
+                for name, shares, pct, chg, chg_pct in map(_HOLDING_FIELDS, holdings[:10])
+            ],
+            "report_date": report_date_str,
+            "interpretation": (
+                f"Institutional ownership: {total_pct:.1f}%. "
+                f"{increasing} increasing, {decreasing} decreasing positions."
+            ),
+        }
+
+    def _format_advanced(
+        self,
+        symbol: str,
+        holdings: list[Any],
+        summary: Any,
+        report_date_str: str,
+    ) -> dict[str, Any]:
+        """Format for advanced mode - full holder list and concentration analysis."""
+        total_pct = summary["total_pct"]
+        increasing = summary["increasing"]
+        decreasing = summary["decreasing"]
+
+        return {
+            "symbol": symbol,
+            "summary_metrics": {
+                "total_institutional_ownership_pct": round(total_pct, 4),
+                "total_institutions": summary["institution_count"],
+                "total_shares_held": summary["total_institutional_shares"] or None,
+            },
+            "concentration_analysis": {
+                "top_5_pct": round(summary["top_5_pct"], 4),
+                "top_10_pct": round(summary["top_10_pct"], 4),
+                "concentration_level": "High" if holdings[0]["pct_of_shares"] > 10 else "Moderate",
+            },
+            "activity_analysis": {
+                "increasing_positions": increasing,
+                "decreasing_positions": decreasing,
+                "stable_positions": summary["position_count"] - increasing - decreasing,
+                "net_flow": (
+                    "accumulation"
+                    if increasing > decreasing
+                    else "distribution" if decreasing > increasing else "neutral"
+                ),
+            },
+            "institutional_holders": [
+                {
+                    "institution_name": name,
+                    "shares_held": shares or None,
+                    "pct_of_shares": pct or None,
+                    "change_in_shares": chg or None,
+                    "change_pct": chg_pct or None,
+                    "report_date": report_date_str,
+                }
+                for name, shares, pct, chg, chg_pct in map(_HOLDING_FIELDS, holdings)
+            ],
+            "data_quality": {
+                "report_date": report_date_str,
+                "data_age_days": summary["data_age_days"],
+                "reporting_lag": "Quarterly filings (13F) - data is delayed",
+            },
+        }
+
+    # Mode -> formatter, resolved once at class creation
+    _FORMATTERS: Final[dict[CardMode, Callable[..., dict[str, Any]]]] = {
+        CardMode.beginner: _format_beginner,
+        CardMode.intermediate: _format_intermediate,
+        CardMode.advanced: _format_advanced,
+    }
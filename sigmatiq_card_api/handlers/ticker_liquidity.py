@@ -12,17 +12,109 @@ Data sources:
 """
 
 from datetime import date
-from typing import Any, Optional
+from operator import itemgetter
+from typing import Any, Final, Optional
 
 from fastapi import HTTPException
 
 from ..models.cards import CardMode
 from .base import BaseCardHandler
 
+# Dollar-volume rank (percentile) cut-offs and the classes they separate:
+# rank < 40 is low, 40-80 moderate, 80+ high
+_LIQ_MODERATE_RANK: Final[int] = 40
+_LIQ_HIGH_RANK: Final[int] = 80
+_LIQ_CLASSES: Final[tuple[str, str, str]] = ("low", "moderate", "high")
+
+# (threshold, divisor, template) for dollar-volume labels, largest scale first
+_DOLLAR_VOLUME_SCALES: Final[tuple[tuple[float, float, str], ...]] = (
+    (1_000_000_000, 1_000_000_000, "${:.2f}B daily volume"),
+    (1_000_000, 1_000_000, "${:.1f}M daily volume"),
+    (1_000, 1_000, "${:.0f}K daily volume"),
+)
+
+# Metric fields read from the joined row in one call
+_LIQUIDITY_FIELDS: Final = itemgetter(
+    "liq_dollar_rank_20",
+    "rvol_pctile_20",
+    "volume",
+    "rvol",
+    "close",
+)
+
+# Liquidity ranks joined with the day's volume/price for dollar volume
+_LIQUIDITY_QUERY: Final[str] = """
+    SELECT
+        x.trading_date,
+        x.symbol,
+        x.liq_dollar_rank_20::double precision AS liq_dollar_rank_20,
+        x.rvol_pctile_20::double precision AS rvol_pctile_20,
+        d.volume::bigint AS volume,
+        d.rvol::double precision AS rvol,
+        d.close::double precision AS close
+    FROM sb.symbol_cross_sectional_eod x
+    JOIN sb.symbol_derived_eod d ON d.symbol = x.symbol AND d.trading_date = x.trading_date
+    WHERE x.symbol = $1 AND x.trading_date = $2
+    LIMIT 1
+"""
+
+# Batched variant for watchlists: one row per symbol in a single round-trip
+_BATCH_LIQUIDITY_QUERY: Final[str] = """
+    SELECT DISTINCT ON (x.symbol)
+        x.trading_date,
+        x.symbol,
+        x.liq_dollar_rank_20::double precision AS liq_dollar_rank_20,
+        x.rvol_pctile_20::double precision AS rvol_pctile_20,
+        d.volume::bigint AS volume,
+        d.rvol::double precision AS rvol,
+        d.close::double precision AS close
+    FROM sb.symbol_cross_sectional_eod x
+    JOIN sb.symbol_derived_eod d ON d.symbol = x.symbol AND d.trading_date = x.trading_date
+    WHERE x.symbol = ANY($1::text[]) AND x.trading_date = $2
+    ORDER BY x.symbol
+"""
+
 
 class LiquidityHandler(BaseCardHandler):
     """Handler for ticker_liquidity card - trading liquidity metrics."""
 
+    # Static lookup tables keyed by liquidity class (built once, not per request)
+    _LIQUIDITY_LABELS: Final[dict[str, str]] = {
+        "high": "High Liquidity",
+        "moderate": "Moderate Liquidity",
+        "low": "Low Liquidity",
+        "unknown": "Unknown",
+    }
+
+    _SIZING_HINTS: Final[dict[str, str]] = {
+        "high": "Normal sizing",
+        "moderate": "Moderate size; watch spreads",
+    }
+
+    _BEGINNER_DESCRIPTIONS: Final[dict[str, str]] = {
+        "high": (
+            "Easy to trade with tight spreads. "
+            "You can enter and exit positions quickly at fair prices."
+        ),
+        "moderate": "Decent liquidity for most traders. Use limit orders for larger positions.",
+        "low": (
+            "Hard to trade - wide spreads and potential slippage. "
+            "Use small positions and limit orders only."
+        ),
+        "unknown": "Liquidity data unavailable for this stock.",
+    }
+
+    _TRADING_ADVICE: Final[dict[str, str]] = {
+        "high": "Safe for all position sizes. Market orders acceptable for normal-sized trades.",
+        "moderate": "Use limit orders for positions. Consider impact on spreads for larger trades.",
+        "low": (
+            "Always use limit orders. Keep position sizes small. "
+            "Avoid during low-volume periods (open/close). "
+            "Consider alternatives with better liquidity."
+        ),
+        "unknown": "Exercise caution - verify liquidity before trading.",
+    }
+
     async def fetch(
         self,
         mode: CardMode,
@@ -49,22 +141,9 @@ class LiquidityHandler(BaseCardHandler):
                 detail="Symbol is required for ticker_liquidity card",
             )
 
-        # Fetch liquidity data
-        query = """
-            SELECT
-                x.trading_date,
-                x.symbol,
-                x.liq_dollar_rank_20,
-                x.rvol_pctile_20,
-                d.volume,
-                d.rvol,
-                d.close
-            FROM sb.symbol_cross_sectional_eod x
-            JOIN sb.symbol_derived_eod d ON d.symbol = x.symbol AND d.trading_date = x.trading_date
-            WHERE x.symbol = $1 AND x.trading_date = $2
-            LIMIT 1
-        """
-        row = await self._fetch_one(query, {"symbol": symbol, "trading_date": trading_date})
+        row = await self._fetch_one(
+            _LIQUIDITY_QUERY, {"symbol": symbol, "trading_date": trading_date}
+        )
 
         if not row:
             raise HTTPException(
@@ -72,25 +151,48 @@ class LiquidityHandler(BaseCardHandler):
                 detail=f"No liquidity data for {symbol} on {trading_date}",
             )
 
-        # Extract values
-        liq_rank = float(row["liq_dollar_rank_20"]) if row["liq_dollar_rank_20"] is not None else None
-        rvol_pct = float(row["rvol_pctile_20"]) if row["rvol_pctile_20"] is not None else None
-        volume = int(row["volume"]) if row["volume"] else 0
-        rvol = float(row["rvol"]) if row["rvol"] is not None else None
-        close = float(row["close"]) if row["close"] else 0
+        return self._build_card(mode, symbol, row)
+
+    async def fetch_many(
+        self,
+        mode: CardMode,
+        symbols: list[str],
+        trading_date: date,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch liquidity metrics for several symbols in one round-trip.
+
+        Args:
+            mode: Response complexity level
+            symbols: Stock symbols
+            trading_date: Trading date to fetch data for
+
+        Returns:
+            Formatted card data keyed by symbol; symbols without data are omitted
+        """
+        rows = await self._fetch_all(
+            _BATCH_LIQUIDITY_QUERY,
+            {"symbols": list(dict.fromkeys(symbols)), "trading_date": trading_date},
+        )
+        return {row["symbol"]: self._build_card(mode, row["symbol"], row) for row in rows}
+
+    def _build_card(self, mode: CardMode, symbol: str, row: Any) -> dict[str, Any]:
+        """Classify a liquidity row and format it for the mode."""
+        # Extract values (cast to float/bigint in SQL)
+        liq_rank, rvol_pct, volume, rvol, close = _LIQUIDITY_FIELDS(row)
+        volume = volume or 0
+        close = close or 0.0
 
         # Calculate dollar volume
         dollar_volume = volume * close if volume and close else 0
 
-        # Classify liquidity
+        # Classify liquidity (each threshold passed moves one class up)
         if liq_rank is None:
             liquidity_class = "unknown"
-        elif liq_rank >= 80:
-            liquidity_class = "high"
-        elif liq_rank >= 40:
-            liquidity_class = "moderate"
         else:
-            liquidity_class = "low"
+            liquidity_class = _LIQ_CLASSES[
+                (liq_rank >= _LIQ_MODERATE_RANK) + (liq_rank >= _LIQ_HIGH_RANK)
+            ]
 
         # Format based on mode
         if mode == CardMode.beginner:
@@ -130,14 +232,6 @@ class LiquidityHandler(BaseCardHandler):
         rvol: Optional[float],
     ) -> dict[str, Any]:
         """Format for beginner mode - simple classification and guidance."""
-        # Get emoji for liquidity class
-        emoji = {
-            "high": "✅",
-            "moderate": "⚠️",
-            "low": "❌",
-            "unknown": "❓",
-        }.get(liquidity_class, "➡️")
-
         return {
             "symbol": symbol,
             "liquidity": liquidity_class,
@@ -145,10 +239,8 @@ class LiquidityHandler(BaseCardHandler):
             "dollar_volume": round(dollar_volume),
             "dollar_volume_label": self._format_dollar_volume(dollar_volume),
             "relative_volume": round(rvol, 2) if rvol is not None else None,
-            "sizing_hint": (
-                "Normal sizing" if liquidity_class == "high" else
-                "Moderate size; watch spreads" if liquidity_class == "moderate" else
-                "Small size only; illiquid conditions"
+            "sizing_hint": self._SIZING_HINTS.get(
+                liquidity_class, "Small size only; illiquid conditions"
             ),
             "description": self._get_beginner_description(liquidity_class),
             "trading_advice": self._get_trading_advice(liquidity_class),
@@ -193,25 +285,27 @@ class LiquidityHandler(BaseCardHandler):
         close: float,
     ) -> dict[str, Any]:
         """Format for advanced mode - full liquidity analysis."""
+        # Column values are already float8 from SQL and pass through at full
+        # precision; only the derived dollar volume is rounded
         return {
             "symbol": symbol,
             "classification": liquidity_class,
             "raw_metrics": {
-                "dollar_volume_rank_20d": round(liq_rank, 2) if liq_rank is not None else None,
-                "rvol_percentile_20d": round(rvol_pct, 2) if rvol_pct is not None else None,
+                "dollar_volume_rank_20d": liq_rank,
+                "rvol_percentile_20d": rvol_pct,
                 "dollar_volume": round(dollar_volume, 2),
                 "share_volume": volume,
-                "relative_volume": round(rvol, 4) if rvol is not None else None,
-                "close_price": round(close, 2),
+                "relative_volume": rvol,
+                "close_price": close,
             },
             "derived_metrics": {
                 "volume_vs_average": f"{round((rvol - 1) * 100)}%" if rvol else None,
-                "dollars_per_share": round(close, 2),
+                "dollars_per_share": close,
             },
             "thresholds": {
-                "high_liquidity": "80+ percentile",
-                "moderate_liquidity": "40-80 percentile",
-                "low_liquidity": "<40 percentile",
+                "high_liquidity": f"{_LIQ_HIGH_RANK}+ percentile",
+                "moderate_liquidity": f"{_LIQ_MODERATE_RANK}-{_LIQ_HIGH_RANK} percentile",
+                "low_liquidity": f"<{_LIQ_MODERATE_RANK} percentile",
             },
             "risk_assessment": {
                 "slippage_risk": "Low" if liquidity_class == "high" else "Moderate" if liquidity_class == "moderate" else "High",
@@ -219,50 +313,28 @@ class LiquidityHandler(BaseCardHandler):
             },
         }
 
-    @staticmethod
-    def _get_liquidity_label(liquidity_class: str) -> str:
+    @classmethod
+    def _get_liquidity_label(cls, liquidity_class: str) -> str:
         """Get human-readable label for liquidity class."""
-        labels = {
-            "high": "High Liquidity",
-            "moderate": "Moderate Liquidity",
-            "low": "Low Liquidity",
-            "unknown": "Unknown",
-        }
-        return labels.get(liquidity_class, liquidity_class)
+        return cls._LIQUIDITY_LABELS.get(liquidity_class, liquidity_class)
 
     @staticmethod
     def _format_dollar_volume(dollar_volume: float) -> str:
         """Format dollar volume for display."""
-        if dollar_volume >= 1_000_000_000:
-            return f"${dollar_volume / 1_000_000_000:.2f}B daily volume"
-        elif dollar_volume >= 1_000_000:
-            return f"${dollar_volume / 1_000_000:.1f}M daily volume"
-        elif dollar_volume >= 1_000:
-            return f"${dollar_volume / 1_000:.0f}K daily volume"
-        else:
-            return f"${dollar_volume:.0f} daily volume"
+        for threshold, divisor, template in _DOLLAR_VOLUME_SCALES:
+            if dollar_volume >= threshold:
+                return template.format(dollar_volume / divisor)
+        return f"${dollar_volume:.0f} daily volume"
 
-    @staticmethod
-    def _get_beginner_description(liquidity_class: str) -> str:
+    @classmethod
+    def _get_beginner_description(cls, liquidity_class: str) -> str:
         """Get beginner-friendly description."""
-        descriptions = {
-            "high": "Easy to trade with tight spreads. You can enter and exit positions quickly at fair prices.",
-            "moderate": "Decent liquidity for most traders. Use limit orders for larger positions.",
-            "low": "Hard to trade - wide spreads and potential slippage. Use small positions and limit orders only.",
-            "unknown": "Liquidity data unavailable for this stock.",
-        }
-        return descriptions.get(liquidity_class, "Unknown liquidity")
+        return cls._BEGINNER_DESCRIPTIONS.get(liquidity_class, "Unknown liquidity")
 
-    @staticmethod
-    def _get_trading_advice(liquidity_class: str) -> str:
+    @classmethod
+    def _get_trading_advice(cls, liquidity_class: str) -> str:
         """Get trading advice based on liquidity."""
-        advice = {
-            "high": "Safe for all position sizes. Market orders acceptable for normal-sized trades.",
-            "moderate": "Use limit orders for positions. Consider impact on spreads for larger trades.",
-            "low": "Always use limit orders. Keep position sizes small. Avoid during low-volume periods (open/close). Consider alternatives with better liquidity.",
-            "unknown": "Exercise caution - verify liquidity before trading.",
-        }
-        return advice.get(liquidity_class, "Assess liquidity carefully")
+        return cls._TRADING_ADVICE.get(liquidity_class, "Assess liquidity carefully")
 
     @staticmethod
     def _get_intermediate_interpretation(
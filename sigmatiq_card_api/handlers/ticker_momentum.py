@@ -10,18 +10,214 @@ Shows key momentum indicators:
 Data source: sb.symbol_indicators_daily
 """
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date
-from typing import Any, Optional
+from itertools import product
+from operator import itemgetter
+from typing import Any, Final, Optional
 
 from fastapi import HTTPException
 
 from ..models.cards import CardMode
 from .base import BaseCardHandler
+from .cache import TTLCache, ttl_for_trading_date
+
+# RSI and Stochastic %K vote bullish above 60 and bearish below 40; the MACD
+# histogram votes bullish when positive and bearish otherwise
+_VOTE_BULLISH_ABOVE: Final[float] = 60
+_VOTE_BEARISH_BELOW: Final[float] = 40
+
+# RSI bands: oversold below 30, weak 30-40, neutral 40-60, strong 60-70 and
+# overbought above 70 (the 40/60 cut-offs are the vote thresholds above)
+_RSI_OVERSOLD: Final[float] = 30
+_RSI_OVERBOUGHT: Final[float] = 70
+
+# Stochastic %K bands: oversold below 20, overbought above 80
+_STOCH_OVERSOLD: Final[float] = 20
+_STOCH_OVERBOUGHT: Final[float] = 80
+
+
+def _classify_votes(votes: tuple[int, int, int]) -> str:
+    """Classify one (rsi, macd, stochastic) vote combination, each -1/0/+1."""
+    bullish_signals = votes.count(1)
+    bearish_signals = votes.count(-1)
+
+    if bullish_signals >= 2 and bearish_signals == 0:
+        return "Strong Bullish"
+    elif bullish_signals > bearish_signals:
+        return "Moderate Bullish"
+    elif bearish_signals >= 2 and bullish_signals == 0:
+        return "Bearish"
+    elif bearish_signals > bullish_signals:
+        return "Weak"
+    else:
+        return "Neutral"
+
+
+# Every vote combination classified once at import (3^3 = 27 entries)
+_CLASSIFICATION_BY_VOTES: Final[dict[tuple[int, int, int], str]] = {
+    votes: _classify_votes(votes) for votes in product((-1, 0, 1), repeat=3)
+}
+
+# Classification and score when RSI, MACD histogram and %K are all missing
+_NO_DATA_CLASSIFICATION: Final[str] = _CLASSIFICATION_BY_VOTES[(0, 0, 0)]
+_NO_DATA_SCORE: Final[int] = 50
+
+# Indicator fields read from the row in one call (cast to float in SQL)
+_INDICATOR_FIELDS: Final = itemgetter(
+    "rsi_14",
+    "macd",
+    "macd_signal",
+    "macd_histogram",
+    "stoch_k",
+    "stoch_d",
+)
+
+# Daily momentum indicators for one symbol
+_MOMENTUM_QUERY: Final[str] = """
+    SELECT
+        rsi_14::double precision AS rsi_14,
+        macd::double precision AS macd,
+        macd_signal::double precision AS macd_signal,
+        macd_histogram::double precision AS macd_histogram,
+        stoch_k::double precision AS stoch_k,
+        stoch_d::double precision AS stoch_d
+    FROM sb.symbol_indicators_daily
+    WHERE trading_date = $1 AND symbol = $2
+    LIMIT 1
+"""
+
+# Batched indicator query for watchlists: one row per symbol in a single round-trip
+_BATCH_MOMENTUM_QUERY: Final[str] = """
+    SELECT DISTINCT ON (symbol)
+        symbol,
+        rsi_14::double precision AS rsi_14,
+        macd::double precision AS macd,
+        macd_signal::double precision AS macd_signal,
+        macd_histogram::double precision AS macd_histogram,
+        stoch_k::double precision AS stoch_k,
+        stoch_d::double precision AS stoch_d
+    FROM sb.symbol_indicators_daily
+    WHERE symbol = ANY($1::text[]) AND trading_date = $2
+    ORDER BY symbol
+"""
+
+# Indicator rows keyed by (symbol, trading_date) and shared by all modes
+_ROW_CACHE = TTLCache(maxsize=4096)
+
+
+@dataclass(frozen=True, slots=True)
+class _IndicatorState:
+    """Indicator values for one row plus everything derived from them, computed once."""
+
+    rsi: Optional[float]
+    macd: Optional[float]
+    macd_signal: Optional[float]
+    macd_hist: Optional[float]
+    stoch_k: Optional[float]
+    stoch_d: Optional[float]
+    rsi_band: Optional[int]  # 0 (oversold) to 4 (overbought); None without RSI
+    stoch_band: Optional[int]  # 0 (oversold) to 2 (overbought); None without %K
+    macd_trend: Optional[str]  # Bearish/Neutral/Bullish; None without histogram
+    classification: str
+    score: int
 
 
 class MomentumPulseHandler(BaseCardHandler):
     """Handler for ticker_momentum card - momentum indicators."""
 
+    # Today's row is rewritten by the intraday indicator job, so it goes stale after a minute
+    CACHE_INTRADAY_TTL_SECONDS = 60
+
+    # Static lookup tables keyed by classification (built once, not per request)
+    _MOMENTUM_LABELS: Final[dict[str, str]] = {
+        classification: f"{classification} Momentum"
+        for classification in _CLASSIFICATION_BY_VOTES.values()
+    }
+
+    _BEGINNER_SUMMARIES: Final[dict[str, str]] = {
+        "Strong Bullish": (
+            "Strong upward momentum. Multiple indicators confirm buying pressure. "
+            "Good for trend-following strategies."
+        ),
+        "Moderate Bullish": (
+            "Positive momentum but not all indicators aligned. "
+            "Watch for confirmation before entering positions."
+        ),
+        "Neutral": "Mixed signals. Momentum unclear. Wait for clearer direction before trading.",
+        "Weak": (
+            "Weakening momentum. Some bearish signals present. "
+            "Consider reducing position size or tightening stops."
+        ),
+        "Bearish": (
+            "Negative momentum. Multiple indicators show selling pressure. "
+            "Avoid longs or consider shorts."
+        ),
+    }
+
+    _TRADING_GUIDANCE: Final[dict[str, str]] = {
+        "Strong Bullish": (
+            "Consider long positions or adding to existing longs. Momentum favors continuation."
+        ),
+        "Moderate Bullish": "Selective longs on pullbacks. Wait for confirmation on breakouts.",
+        "Neutral": "Stand aside or use tight stops. No clear edge in either direction.",
+        "Weak": "Reduce position size. Tighten stops on longs. Consider profit-taking.",
+        "Bearish": "Avoid new longs. Consider shorts or defensive positioning.",
+    }
+
+    # (entry, invalidation, confidence) for the beginner action block
+    _ACTION_PLANS: Final[dict[str, tuple[str, str, int]]] = {
+        "Strong Bullish": (
+            "Buy first pullback with RSI>50 and MACD>0",
+            "RSI<45 or MACD histogram < 0",
+            80,
+        ),
+        "Moderate Bullish": (
+            "Buy pullback; wait for higher low or MACD turn",
+            "RSI<45 or price loses 20-day",
+            65,
+        ),
+        "Weak": ("Avoid longs; consider waiting or small mean-reversion only", "N/A", 35),
+        "Bearish": ("Avoid longs; if shorting, use defined risk", "N/A", 25),
+    }
+    _DEFAULT_ACTION_PLAN: Final[tuple[str, str, int]] = ("Wait for clearer momentum", "N/A", 50)
+
+    # Advanced-mode thresholds block; read-only, shared by every payload
+    _ADVANCED_THRESHOLDS: Final[dict[str, dict[str, float]]] = {
+        "rsi": {"overbought": _RSI_OVERBOUGHT, "oversold": _RSI_OVERSOLD},
+        "stochastic": {"overbought": _STOCH_OVERBOUGHT, "oversold": _STOCH_OVERSOLD},
+    }
+
+    # MACD trend indexed by histogram sign + 1 (negative, zero, positive)
+    _MACD_TRENDS: Final[tuple[str, str, str]] = ("Bearish", "Neutral", "Bullish")
+
+    # Labels indexed by RSI band (oversold, weak, neutral, strong, overbought)
+    _RSI_SIGNALS: Final[tuple[str, ...]] = ("Oversold", "Weak", "Neutral", "Strong", "Overbought")
+    _RSI_INTERPRETATIONS: Final[tuple[str, ...]] = (
+        "Deeply oversold, potential bounce",
+        "Weak momentum, avoid longs",
+        "Neutral zone, wait for clearer signal",
+        "Positive momentum, trend likely continues",
+        "May be overextended, watch for reversal",
+    )
+    _RSI_STRENGTHS: Final[tuple[str, ...]] = ("Weak", "Weak", "Moderate", "Strong", "Strong")
+    _RSI_KEY_SIGNALS: Final[tuple[Optional[str], ...]] = (
+        "RSI oversold - stock may be due for bounce",
+        "RSI weak - momentum declining",
+        None,
+        "RSI strong - good momentum",
+        "RSI overbought - stock may be overextended",
+    )
+
+    # Labels indexed by Stochastic band (oversold, neutral, overbought)
+    _STOCH_SIGNALS: Final[tuple[str, ...]] = ("Oversold", "Neutral", "Overbought")
+    _STOCH_KEY_SIGNALS: Final[tuple[Optional[str], ...]] = (
+        "Stochastic oversold - potential reversal setup",
+        None,
+        "Stochastic overbought - caution on new longs",
+    )
+
     async def fetch(
         self,
         mode: CardMode,
@@ -48,15 +244,13 @@ class MomentumPulseHandler(BaseCardHandler):
                 detail="Symbol is required for ticker_momentum card",
             )
 
-        # Fetch momentum indicators from database
-        query = """
-            SELECT rsi_14, macd, macd_signal, macd_histogram,
-                   stoch_k, stoch_d
-            FROM sb.symbol_indicators_daily
-            WHERE trading_date = $1 AND symbol = $2
-            LIMIT 1
-        """
-        row = await self._fetch_one(query, {"trading_date": trading_date, "symbol": symbol})
+        row = await _ROW_CACHE.get_or_set(
+            (symbol, trading_date),
+            lambda: self._fetch_one(
+                _MOMENTUM_QUERY, {"trading_date": trading_date, "symbol": symbol}
+            ),
+            ttl_for_trading_date(trading_date, intraday_ttl=self.CACHE_INTRADAY_TTL_SECONDS),
+        )
 
         if not row:
             raise HTTPException(
@@ -64,55 +258,90 @@ class MomentumPulseHandler(BaseCardHandler):
                 detail=f"No momentum data for {symbol} on {trading_date}",
             )
 
-        # Extract indicator values
-        rsi = float(row["rsi_14"]) if row["rsi_14"] is not None else None
-        macd = float(row["macd"]) if row["macd"] is not None else None
-        macd_signal = float(row["macd_signal"]) if row["macd_signal"] is not None else None
-        macd_histogram = float(row["macd_histogram"]) if row["macd_histogram"] is not None else None
-        stoch_k = float(row["stoch_k"]) if row["stoch_k"] is not None else None
-        stoch_d = float(row["stoch_d"]) if row["stoch_d"] is not None else None
-
-        # Classify momentum based on indicators
-        momentum_classification = self._classify_momentum(rsi, macd_histogram, stoch_k)
-        momentum_score = self._calculate_momentum_score(rsi, macd_histogram, stoch_k)
-
-        # Format based on mode
-        if mode == CardMode.beginner:
-            return self._format_beginner(
-                symbol,
-                momentum_classification,
-                momentum_score,
-                rsi,
-                macd_histogram,
-                stoch_k,
-            )
-        elif mode == CardMode.intermediate:
-            return self._format_intermediate(
-                symbol,
-                momentum_classification,
-                momentum_score,
-                rsi,
-                macd,
-                macd_signal,
-                macd_histogram,
-                stoch_k,
-                stoch_d,
-            )
-        else:
-            return self._format_advanced(
-                symbol,
-                momentum_classification,
-                momentum_score,
-                rsi,
-                macd,
-                macd_signal,
-                macd_histogram,
-                stoch_k,
-                stoch_d,
+        return self._build_card(mode, symbol, row)
+
+    async def fetch_many(
+        self,
+        mode: CardMode,
+        symbols: list[str],
+        trading_date: date,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Fetch momentum indicators for several symbols in one round-trip.
+
+        Args:
+            mode: Response complexity level
+            symbols: Stock symbols
+            trading_date: Trading date to fetch data for
+
+        Returns:
+            Formatted card data keyed by symbol; symbols without data are omitted
+        """
+        rows_by_symbol = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            row = _ROW_CACHE.get((symbol, trading_date))
+            if row is not None:
+                rows_by_symbol[symbol] = row
+            else:
+                missing.append(symbol)
+
+        if missing:
+            ttl = ttl_for_trading_date(trading_date, intraday_ttl=self.CACHE_INTRADAY_TTL_SECONDS)
+            for row in await self._fetch_all(
+                _BATCH_MOMENTUM_QUERY,
+                {"symbols": missing, "trading_date": trading_date},
+            ):
+                _ROW_CACHE.set((row["symbol"], trading_date), row, ttl)
+                rows_by_symbol[row["symbol"]] = row
+
+        return {
+            symbol: self._build_card(mode, symbol, row) for symbol, row in rows_by_symbol.items()
+        }
+
+    def _build_card(self, mode: CardMode, symbol: str, row: Any) -> dict[str, Any]:
+        """Classify an indicator row and format it for the mode."""
+        return self._FORMATTERS[mode](self, symbol, self._indicator_state(row))
+
+    @classmethod
+    def _indicator_state(cls, row: Any) -> _IndicatorState:
+        """Evaluate every indicator threshold for a row once."""
+        # Extract indicator values (cast to float in SQL, NULLs pass through)
+        rsi, macd, macd_signal, macd_hist, stoch_k, stoch_d = _INDICATOR_FIELDS(row)
+
+        if rsi is None and macd_hist is None and stoch_k is None:
+            # Nothing to classify (e.g. a new listing still in indicator warm-up)
+            return _IndicatorState(
+                rsi=None,
+                macd=macd,
+                macd_signal=macd_signal,
+                macd_hist=None,
+                stoch_k=None,
+                stoch_d=stoch_d,
+                rsi_band=None,
+                stoch_band=None,
+                macd_trend=None,
+                classification=_NO_DATA_CLASSIFICATION,
+                score=_NO_DATA_SCORE,
             )
 
-    @staticmethod
+        return _IndicatorState(
+            rsi=rsi,
+            macd=macd,
+            macd_signal=macd_signal,
+            macd_hist=macd_hist,
+            stoch_k=stoch_k,
+            stoch_d=stoch_d,
+            rsi_band=None if rsi is None else cls._rsi_band(rsi),
+            stoch_band=None if stoch_k is None else cls._stoch_band(stoch_k),
+            macd_trend=cls._macd_trend(macd_hist),
+            classification=cls._classify_momentum(rsi, macd_hist, stoch_k),
+            score=cls._calculate_momentum_score(rsi, macd_hist, stoch_k),
+        )
+
+    @classmethod
     def _classify_momentum(
+        cls,
         rsi: Optional[float],
         macd_hist: Optional[float],
         stoch_k: Optional[float],
@@ -128,45 +357,31 @@ class MomentumPulseHandler(BaseCardHandler):
         Returns:
             Momentum classification: Strong Bullish, Moderate Bullish, Neutral, Weak, or Bearish
         """
-        # Count bullish and bearish signals
-        bullish_signals = 0
-        bearish_signals = 0
-
-        # RSI signals
-        if rsi is not None:
-            if rsi > 60:
-                bullish_signals += 1
-            elif rsi < 40:
-                bearish_signals += 1
-
-        # MACD histogram signals
-        if macd_hist is not None:
-            if macd_hist > 0:
-                bullish_signals += 1
-            else:
-                bearish_signals += 1
+        return _CLASSIFICATION_BY_VOTES[
+            (
+                cls._oscillator_vote(rsi),
+                cls._macd_vote(macd_hist),
+                cls._oscillator_vote(stoch_k),
+            )
+        ]
 
-        # Stochastic signals
-        if stoch_k is not None:
-            if stoch_k > 60:
-                bullish_signals += 1
-            elif stoch_k < 40:
-                bearish_signals += 1
-
-        # Classify based on signal counts
-        if bullish_signals >= 2 and bearish_signals == 0:
-            return "Strong Bullish"
-        elif bullish_signals > bearish_signals:
-            return "Moderate Bullish"
-        elif bearish_signals >= 2 and bullish_signals == 0:
-            return "Bearish"
-        elif bearish_signals > bullish_signals:
-            return "Weak"
-        else:
-            return "Neutral"
+    @staticmethod
+    def _oscillator_vote(value: Optional[float]) -> int:
+        """Vote of a 0-100 oscillator: +1 above 60, -1 below 40, else (or no data) 0."""
+        if value is None:
+            return 0
+        return (value > _VOTE_BULLISH_ABOVE) - (value < _VOTE_BEARISH_BELOW)
 
     @staticmethod
+    def _macd_vote(macd_hist: Optional[float]) -> int:
+        """Vote of the MACD histogram: +1 when positive, -1 otherwise, 0 with no data."""
+        if macd_hist is None:
+            return 0
+        return 1 if macd_hist > 0 else -1
+
+    @classmethod
     def _calculate_momentum_score(
+        cls,
         rsi: Optional[float],
         macd_hist: Optional[float],
         stoch_k: Optional[float],
@@ -192,66 +407,29 @@ class MomentumPulseHandler(BaseCardHandler):
         if stoch_k is not None:
             score = (score + stoch_k) / 2
 
-        # MACD histogram contribution (normalize to 0-100)
-        if macd_hist is not None:
-            # Positive histogram boosts score, negative reduces it
-            if macd_hist > 0:
-                score = min(100, score + 10)
-            else:
-                score = max(0, score - 10)
+        # MACD histogram shifts the score 10 points in the direction of its vote
+        macd_vote = cls._macd_vote(macd_hist)
+        if macd_vote:
+            score = min(100, max(0, score + 10 * macd_vote))
 
         return round(score)
 
-    def _format_beginner(
-        self,
-        symbol: str,
-        classification: str,
-        score: int,
-        rsi: Optional[float],
-        macd_hist: Optional[float],
-        stoch_k: Optional[float],
-    ) -> dict[str, Any]:
+    def _format_beginner(self, symbol: str, state: _IndicatorState) -> dict[str, Any]:
         """Format for beginner mode - simple classification and guidance."""
-        # Get emoji for classification
-        emoji = {
-            "Strong Bullish": "🚀",
-            "Moderate Bullish": "📈",
-            "Neutral": "➡️",
-            "Weak": "📉",
-            "Bearish": "🔻",
-        }.get(classification, "➡️")
-
         return {
             "symbol": symbol,
-            "momentum_score": score,
-            "momentum_label": f"{classification} Momentum",
-            "simple_summary": self._get_beginner_summary(classification, rsi, macd_hist, stoch_k),
-            "key_signals": self._get_key_signals_beginner(rsi, macd_hist, stoch_k),
-            "action_block": self._build_action_block_beginner(symbol, classification),
+            "momentum_score": state.score,
+            "momentum_label": self._MOMENTUM_LABELS[state.classification],
+            "simple_summary": self._get_beginner_summary(state.classification),
+            "key_signals": self._get_key_signals_beginner(state),
+            "action_block": self._build_action_block_beginner(symbol, state.classification),
         }
 
     def _build_action_block_beginner(self, symbol: str, classification: str) -> dict[str, Any]:
         """Action guidance based on momentum classification."""
-        if classification == "Strong Bullish":
-            entry = "Buy first pullback with RSI>50 and MACD>0"
-            invalidation = "RSI<45 or MACD histogram < 0"
-            confidence = 80
-        elif classification == "Moderate Bullish":
-            entry = "Buy pullback; wait for higher low or MACD turn"
-            invalidation = "RSI<45 or price loses 20-day"
-            confidence = 65
-        elif classification == "Weak":
-            entry = "Avoid longs; consider waiting or small mean-reversion only"
-            invalidation = "N/A"
-            confidence = 35
-        elif classification == "Bearish":
-            entry = "Avoid longs; if shorting, use defined risk"
-            invalidation = "N/A"
-            confidence = 25
-        else:
-            entry = "Wait for clearer momentum"
-            invalidation = "N/A"
-            confidence = 50
+        entry, invalidation, confidence = self._ACTION_PLANS.get(
+            classification, self._DEFAULT_ACTION_PLAN
+        )
         return {
             "entry": entry,
             "invalidation": invalidation,
@@ -260,222 +438,178 @@ class MomentumPulseHandler(BaseCardHandler):
             "confidence": confidence,
         }
 
-    def _format_intermediate(
-        self,
-        symbol: str,
-        classification: str,
-        score: int,
-        rsi: Optional[float],
-        macd: Optional[float],
-        macd_signal: Optional[float],
-        macd_hist: Optional[float],
-        stoch_k: Optional[float],
-        stoch_d: Optional[float],
-    ) -> dict[str, Any]:
+    def _format_intermediate(self, symbol: str, state: _IndicatorState) -> dict[str, Any]:
         """Format for intermediate mode - indicator breakdown."""
         return {
             "symbol": symbol,
-            "momentum_score": score,
-            "momentum_classification": classification,
+            "momentum_score": state.score,
+            "momentum_classification": state.classification,
             "indicators": {
                 "rsi": {
-                    "value": round(rsi, 2) if rsi is not None else None,
-                    "signal": self._get_rsi_signal(rsi),
-                    "interpretation": self._get_rsi_interpretation(rsi),
+                    "value": round(state.rsi, 2) if state.rsi is not None else None,
+                    "signal": self._get_rsi_signal(state.rsi_band),
+                    "interpretation": self._get_rsi_interpretation(state.rsi_band),
                 },
                 "macd": {
-                    "macd": round(macd, 4) if macd is not None else None,
-                    "signal": round(macd_signal, 4) if macd_signal is not None else None,
-                    "histogram": round(macd_hist, 4) if macd_hist is not None else None,
-                    "signal_type": "Bullish" if macd_hist and macd_hist > 0 else "Bearish" if macd_hist else "Neutral",
+                    "macd": round(state.macd, 4) if state.macd is not None else None,
+                    "signal": (
+                        round(state.macd_signal, 4) if state.macd_signal is not None else None
+                    ),
+                    "histogram": round(state.macd_hist, 4) if state.macd_hist is not None else None,
+                    "signal_type": state.macd_trend or "Neutral",
                 },
                 "stochastic": {
-                    "k": round(stoch_k, 2) if stoch_k is not None else None,
-                    "d": round(stoch_d, 2) if stoch_d is not None else None,
-                    "signal": self._get_stoch_signal(stoch_k),
+                    "k": round(state.stoch_k, 2) if state.stoch_k is not None else None,
+                    "d": round(state.stoch_d, 2) if state.stoch_d is not None else None,
+                    "signal": self._get_stoch_signal(state.stoch_band),
                 },
             },
-            "trading_guidance": self._get_trading_guidance(classification),
+            "trading_guidance": self._get_trading_guidance(state.classification),
         }
 
-    def _format_advanced(
-        self,
-        symbol: str,
-        classification: str,
-        score: int,
-        rsi: Optional[float],
-        macd: Optional[float],
-        macd_signal: Optional[float],
-        macd_hist: Optional[float],
-        stoch_k: Optional[float],
-        stoch_d: Optional[float],
-    ) -> dict[str, Any]:
+    def _format_advanced(self, symbol: str, state: _IndicatorState) -> dict[str, Any]:
         """Format for advanced mode - full indicator details and divergence analysis."""
         return {
             "symbol": symbol,
-            "composite_score": score,
-            "classification": classification,
+            "composite_score": state.score,
+            "classification": state.classification,
             "raw_indicators": {
-                "rsi_14": round(rsi, 4) if rsi is not None else None,
+                "rsi_14": state.rsi,
                 "macd": {
-                    "value": round(macd, 6) if macd is not None else None,
-                    "signal_line": round(macd_signal, 6) if macd_signal is not None else None,
-                    "histogram": round(macd_hist, 6) if macd_hist is not None else None,
-                    "crossover": "Bullish" if macd_hist and macd_hist > 0 else "Bearish" if macd_hist else None,
+                    "value": state.macd,
+                    "signal_line": state.macd_signal,
+                    "histogram": state.macd_hist,
+                    "crossover": state.macd_trend,
                 },
                 "stochastic": {
-                    "percent_k": round(stoch_k, 4) if stoch_k is not None else None,
-                    "percent_d": round(stoch_d, 4) if stoch_d is not None else None,
-                    "crossover": self._detect_stoch_crossover(stoch_k, stoch_d),
+                    "percent_k": state.stoch_k,
+                    "percent_d": state.stoch_d,
+                    "crossover": self._detect_stoch_crossover(state.stoch_k, state.stoch_d),
                 },
             },
             "signal_analysis": {
                 "rsi": {
-                    "zone": self._get_rsi_zone(rsi),
-                    "signal": self._get_rsi_signal(rsi),
-                    "strength": self._get_rsi_strength(rsi),
+                    "zone": self._get_rsi_zone(state.rsi, state.rsi_band),
+                    "signal": self._get_rsi_signal(state.rsi_band),
+                    "strength": self._get_rsi_strength(state.rsi_band),
                 },
                 "macd": {
-                    "trend": "Bullish" if macd_hist and macd_hist > 0 else "Bearish" if macd_hist else "Neutral",
-                    "strength": abs(macd_hist) if macd_hist else 0,
+                    "trend": state.macd_trend or "Neutral",
+                    "strength": abs(state.macd_hist) if state.macd_hist else 0,
                 },
                 "stochastic": {
-                    "zone": self._get_stoch_zone(stoch_k),
-                    "signal": self._get_stoch_signal(stoch_k),
+                    "zone": self._get_stoch_zone(state.stoch_k, state.stoch_band),
+                    "signal": self._get_stoch_signal(state.stoch_band),
                 },
             },
-            "thresholds": {
-                "rsi": {"overbought": 70, "oversold": 30},
-                "stochastic": {"overbought": 80, "oversold": 20},
-            },
+            "thresholds": self._ADVANCED_THRESHOLDS,
         }
 
-    @staticmethod
-    def _get_beginner_summary(
-        classification: str,
-        rsi: Optional[float],
-        macd_hist: Optional[float],
-        stoch_k: Optional[float],
-    ) -> str:
+    # Mode -> formatter, resolved once at class creation
+    _FORMATTERS: Final[dict[CardMode, Callable[..., dict[str, Any]]]] = {
+        CardMode.beginner: _format_beginner,
+        CardMode.intermediate: _format_intermediate,
+        CardMode.advanced: _format_advanced,
+    }
+
+    @classmethod
+    def _get_beginner_summary(cls, classification: str) -> str:
         """Get plain-language summary for beginners."""
-        summaries = {
-            "Strong Bullish": "Strong upward momentum. Multiple indicators confirm buying pressure. Good for trend-following strategies.",
-            "Moderate Bullish": "Positive momentum but not all indicators aligned. Watch for confirmation before entering positions.",
-            "Neutral": "Mixed signals. Momentum unclear. Wait for clearer direction before trading.",
-            "Weak": "Weakening momentum. Some bearish signals present. Consider reducing position size or tightening stops.",
-            "Bearish": "Negative momentum. Multiple indicators show selling pressure. Avoid longs or consider shorts.",
-        }
-        return summaries.get(classification, "Momentum direction unclear.")
+        return cls._BEGINNER_SUMMARIES.get(classification, "Momentum direction unclear.")
+
+    @classmethod
+    def _macd_trend(cls, macd_hist: Optional[float]) -> Optional[str]:
+        """MACD trend from the histogram sign, or None with no data."""
+        if macd_hist is None:
+            return None
+        return cls._MACD_TRENDS[(macd_hist > 0) - (macd_hist < 0) + 1]
 
     @staticmethod
-    def _get_key_signals_beginner(
-        rsi: Optional[float],
-        macd_hist: Optional[float],
-        stoch_k: Optional[float],
-    ) -> list[str]:
+    def _rsi_band(rsi: float) -> int:
+        """RSI band index, 0 (oversold) to 4 (overbought), one step per threshold passed."""
+        return (
+            (rsi >= _RSI_OVERSOLD)
+            + (rsi >= _VOTE_BEARISH_BELOW)
+            + (rsi > _VOTE_BULLISH_ABOVE)
+            + (rsi > _RSI_OVERBOUGHT)
+        )
+
+    @staticmethod
+    def _stoch_band(stoch_k: float) -> int:
+        """Stochastic band index, 0 (oversold) to 2 (overbought)."""
+        return (stoch_k >= _STOCH_OVERSOLD) + (stoch_k > _STOCH_OVERBOUGHT)
+
+    @classmethod
+    def _get_key_signals_beginner(cls, state: _IndicatorState) -> list[str]:
         """Get key signals in plain language for beginners."""
         signals = []
 
-        if rsi is not None:
-            if rsi > 70:
-                signals.append("RSI overbought - stock may be overextended")
-            elif rsi > 60:
-                signals.append("RSI strong - good momentum")
-            elif rsi < 30:
-                signals.append("RSI oversold - stock may be due for bounce")
-            elif rsi < 40:
-                signals.append("RSI weak - momentum declining")
-
-        if macd_hist is not None:
-            if macd_hist > 0:
+        if state.rsi_band is not None:
+            rsi_signal = cls._RSI_KEY_SIGNALS[state.rsi_band]
+            if rsi_signal:
+                signals.append(rsi_signal)
+
+        if state.macd_hist is not None:
+            if state.macd_hist > 0:
                 signals.append("MACD bullish - buyers in control")
             else:
                 signals.append("MACD bearish - sellers in control")
 
-        if stoch_k is not None:
-            if stoch_k > 80:
-                signals.append("Stochastic overbought - caution on new longs")
-            elif stoch_k < 20:
-                signals.append("Stochastic oversold - potential reversal setup")
+        if state.stoch_band is not None:
+            stoch_signal = cls._STOCH_KEY_SIGNALS[state.stoch_band]
+            if stoch_signal:
+                signals.append(stoch_signal)
 
         return signals if signals else ["No clear signals - wait for better setup"]
 
-    @staticmethod
-    def _get_rsi_signal(rsi: Optional[float]) -> str:
+    @classmethod
+    def _get_rsi_signal(cls, rsi_band: Optional[int]) -> str:
         """Get RSI signal classification."""
-        if rsi is None:
+        if rsi_band is None:
             return "No data"
-        if rsi > 70:
-            return "Overbought"
-        elif rsi > 60:
-            return "Strong"
-        elif rsi < 30:
-            return "Oversold"
-        elif rsi < 40:
-            return "Weak"
-        else:
-            return "Neutral"
+        return cls._RSI_SIGNALS[rsi_band]
 
-    @staticmethod
-    def _get_rsi_interpretation(rsi: Optional[float]) -> str:
+    @classmethod
+    def _get_rsi_interpretation(cls, rsi_band: Optional[int]) -> str:
         """Get RSI interpretation."""
-        if rsi is None:
+        if rsi_band is None:
             return "No data"
-        if rsi > 70:
-            return "May be overextended, watch for reversal"
-        elif rsi > 60:
-            return "Positive momentum, trend likely continues"
-        elif rsi < 30:
-            return "Deeply oversold, potential bounce"
-        elif rsi < 40:
-            return "Weak momentum, avoid longs"
-        else:
-            return "Neutral zone, wait for clearer signal"
+        return cls._RSI_INTERPRETATIONS[rsi_band]
 
     @staticmethod
-    def _get_rsi_zone(rsi: Optional[float]) -> str:
+    def _get_rsi_zone(rsi: Optional[float], rsi_band: Optional[int]) -> str:
         """Get RSI zone classification."""
         if rsi is None:
             return "Unknown"
-        if rsi > 70:
+        if rsi_band == 4:
             return "Overbought (>70)"
-        elif rsi < 30:
+        elif rsi_band == 0:
             return "Oversold (<30)"
         else:
             return f"Neutral ({round(rsi)})"
 
-    @staticmethod
-    def _get_rsi_strength(rsi: Optional[float]) -> str:
+    @classmethod
+    def _get_rsi_strength(cls, rsi_band: Optional[int]) -> str:
         """Get RSI strength assessment."""
-        if rsi is None:
+        if rsi_band is None:
             return "Unknown"
-        if rsi > 60:
-            return "Strong"
-        elif rsi < 40:
-            return "Weak"
-        else:
-            return "Moderate"
+        return cls._RSI_STRENGTHS[rsi_band]
 
-    @staticmethod
-    def _get_stoch_signal(stoch_k: Optional[float]) -> str:
+    @classmethod
+    def _get_stoch_signal(cls, stoch_band: Optional[int]) -> str:
         """Get Stochastic signal classification."""
-        if stoch_k is None:
+        if stoch_band is None:
             return "No data"
-        if stoch_k > 80:
-            return "Overbought"
-        elif stoch_k < 20:
-            return "Oversold"
-        else:
-            return "Neutral"
+        return cls._STOCH_SIGNALS[stoch_band]
 
     @staticmethod
-    def _get_stoch_zone(stoch_k: Optional[float]) -> str:
+    def _get_stoch_zone(stoch_k: Optional[float], stoch_band: Optional[int]) -> str:
         """Get Stochastic zone classification."""
         if stoch_k is None:
             return "Unknown"
-        if stoch_k > 80:
+        if stoch_band == 2:
             return "Overbought (>80)"
-        elif stoch_k < 20:
+        elif stoch_band == 0:
             return "Oversold (<20)"
         else:
             return f"Neutral ({round(stoch_k)})"
@@ -490,14 +624,9 @@ class MomentumPulseHandler(BaseCardHandler):
         else:
             return "Bearish (K<D)"
 
-    @staticmethod
-    def _get_trading_guidance(classification: str) -> str:
+    @classmethod
+    def _get_trading_guidance(cls, classification: str) -> str:
         """Get trading guidance based on momentum classification."""
-        guidance = {
-            "Strong Bullish": "Consider long positions or adding to existing longs. Momentum favors continuation.",
-            "Moderate Bullish": "Selective longs on pullbacks. Wait for confirmation on breakouts.",
-            "Neutral": "Stand aside or use tight stops. No clear edge in either direction.",
-            "Weak": "Reduce position size. Tighten stops on longs. Consider profit-taking.",
-            "Bearish": "Avoid new longs. Consider shorts or defensive positioning.",
-        }
-        return guidance.get(classification, "No clear guidance - assess risk carefully.")
+        return cls._TRADING_GUIDANCE.get(
+            classification, "No clear guidance - assess risk carefully."
+        )
@@ -10,18 +10,132 @@ Shows news sentiment metrics:
 Data source: sb.news_sentiment (expected table)
 """
 
+import heapq
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Any, Optional
+from operator import itemgetter
+from typing import Any, Final, Optional
 
 from fastapi import HTTPException
 
 from ..models.cards import CardMode
 from .base import BaseCardHandler
+from .cache import TTLCache, ttl_for_trading_date
+
+# Most recent articles in the 7-day window (the card never shows more than 20),
+# each carrying the sentiment average, relevance-weighted average and label
+# counts over those articles plus the article count and average sentiment of
+# its source - one scan, one round-trip. Scores are cast to float in SQL.
+_NEWS_QUERY: Final[str] = """
+    WITH recent AS (
+        SELECT
+            published_at,
+            title,
+            source,
+            sentiment_score::double precision AS sentiment_score,  -- -1 to +1
+            sentiment_label,  -- 'negative', 'neutral', 'positive'
+            relevance_score::double precision AS relevance_score,  -- 0 to 1
+            url,
+            ROW_NUMBER() OVER (ORDER BY published_at DESC) AS rn
+        FROM sb.news_sentiment
+        WHERE symbol = $1
+          AND published_at >= $2
+          AND published_at <= $3
+        ORDER BY published_at DESC
+        LIMIT 20
+    ),
+    summary AS (
+        SELECT
+            COALESCE(AVG(sentiment_score), 0)::double precision AS avg_sentiment,
+            COALESCE(
+                SUM(sentiment_score * relevance_score)
+                    / NULLIF(SUM(relevance_score) FILTER (WHERE sentiment_score IS NOT NULL), 0),
+                0
+            )::double precision AS weighted_sentiment,
+            COUNT(*) FILTER (WHERE sentiment_label = 'positive') AS positive,
+            COUNT(*) FILTER (WHERE sentiment_label = 'neutral') AS neutral,
+            COUNT(*) FILTER (WHERE sentiment_label = 'negative') AS negative
+        FROM recent
+    ),
+    by_source AS (
+        SELECT
+            source,
+            COUNT(*) AS source_article_count,
+            AVG(sentiment_score)::double precision AS source_avg_sentiment
+        FROM recent
+        GROUP BY source
+    )
+    SELECT r.*, s.*, b.source_article_count, b.source_avg_sentiment
+    FROM recent r
+    CROSS JOIN summary s
+    JOIN by_source b ON b.source IS NOT DISTINCT FROM r.source
+    ORDER BY r.rn
+"""
+
+# Formatted payloads keyed by (symbol, mode, trading_date)
+_RESPONSE_CACHE = TTLCache(maxsize=2048)
+
+# Articles above this relevance count as high-relevance in advanced mode
+_HIGH_RELEVANCE: Final[float] = 0.7
+
+# Most sources any mode lists (advanced shows ten, intermediate five)
+_TOP_SOURCES: Final[int] = 10
+
+
+@dataclass(frozen=True, slots=True)
+class _NewsStats:
+    """Window aggregates from SQL plus what one pass over the rows collects."""
+
+    avg_sentiment: float
+    sentiment_label: str
+    weighted_sentiment: float
+    sentiment_counts: dict[str, int]
+    labeled_count: int  # articles with one of the three labels
+    max_label_count: int  # count of the most common label
+    sources: list[Any]  # first article of the busiest sources, busiest first
+    scores: list[Optional[float]]  # sentiment score per article, newest first
+    published: list[Optional[str]]  # published_at rendered once per article
+    high_relevance: list[tuple[Any, Optional[str]]]  # (article, published) pairs
 
 
 class NewsSentimentHandler(BaseCardHandler):
     """Handler for ticker_news card - news sentiment analysis."""
 
+    # Articles keep arriving during the day, so today's card goes stale after five minutes
+    CACHE_INTRADAY_TTL_SECONDS = 300
+
+    # Sentiment labels by band, one step per threshold in _classify_sentiment
+    _SENTIMENT_LABELS: Final[tuple[str, ...]] = (
+        "very_negative",
+        "negative",
+        "neutral",
+        "positive",
+        "very_positive",
+    )
+
+    _SENTIMENT_EMOJIS: Final[dict[str, str]] = {
+        "very_positive": "🚀",
+        "positive": "📈",
+        "neutral": "➡️",
+        "negative": "📉",
+        "very_negative": "⚠️",
+    }
+
+    _SENTIMENT_EXPLANATIONS: Final[dict[str, str]] = {
+        "very_positive": (
+            "News is very positive. Market is excited about this stock. "
+            "Watch for overenthusiasm."
+        ),
+        "positive": "News is mostly positive. Good momentum, but verify fundamentals.",
+        "neutral": "News is balanced. No strong catalyst either way.",
+        "negative": (
+            "News is mostly negative. Exercise caution. "
+            "May present buying opportunity if oversold."
+        ),
+        "very_negative": "News is very negative. High risk. Wait for situation to stabilize.",
+    }
+
     async def fetch(
         self,
         mode: CardMode,
@@ -48,32 +162,25 @@ class NewsSentimentHandler(BaseCardHandler):
                 detail="Symbol is required for ticker_news card",
             )
 
-        # Fetch recent news articles
-        news_query = """
-            SELECT
-                published_at,
-                title,
-                source,
-                sentiment_score,  -- -1 to +1
-                sentiment_label,  -- 'negative', 'neutral', 'positive'
-                relevance_score,  -- 0 to 1
-                url
-            FROM sb.news_sentiment
-            WHERE symbol = $1
-              AND published_at >= $2
-              AND published_at <= $3
-            ORDER BY published_at DESC
-            LIMIT 20
-        """
+        return await _RESPONSE_CACHE.get_or_set(
+            (symbol, mode, trading_date),
+            lambda: self._fetch_uncached(mode, symbol, trading_date),
+            ttl_for_trading_date(trading_date, intraday_ttl=self.CACHE_INTRADAY_TTL_SECONDS),
+        )
 
+    async def _fetch_uncached(
+        self,
+        mode: CardMode,
+        symbol: str,
+        trading_date: date,
+    ) -> dict[str, Any]:
+        """Query and format news sentiment, bypassing the response cache."""
         # Date range: last 7 days
         end_date = trading_date
         start_date = trading_date - timedelta(days=7)
+        window = {"symbol": symbol, "start_date": start_date, "end_date": end_date}
 
-        articles = await self._fetch_all(
-            news_query,
-            {"symbol": symbol, "start_date": start_date, "end_date": end_date}
-        )
+        articles = await self._fetch_all(_NEWS_QUERY, window)
 
         if not articles:
             raise HTTPException(
@@ -81,47 +188,61 @@ class NewsSentimentHandler(BaseCardHandler):
                 detail=f"No recent news for {symbol}",
             )
 
-        # Calculate aggregate metrics
-        sentiment_scores = [float(a["sentiment_score"]) for a in articles if a.get("sentiment_score") is not None]
-        avg_sentiment = sum(sentiment_scores) / len(sentiment_scores) if sentiment_scores else 0.0
-
-        # Count sentiment labels
-        sentiment_counts = {"positive": 0, "neutral": 0, "negative": 0}
+        # One pass over the rows: first article per source (it carries the
+        # source totals), sentiment scores and publish times in list order,
+        # the high-relevance articles
+        first_by_source: dict[Any, Any] = {}
+        scores = []
+        published = []
+        high_relevance = []
         for article in articles:
-            label = article.get("sentiment_label", "neutral")
-            if label in sentiment_counts:
-                sentiment_counts[label] += 1
-
-        # Format based on mode
-        if mode == CardMode.beginner:
-            return self._format_beginner(symbol, articles, avg_sentiment, sentiment_counts)
-        elif mode == CardMode.intermediate:
-            return self._format_intermediate(symbol, articles, avg_sentiment, sentiment_counts)
-        else:
-            return self._format_advanced(symbol, articles, avg_sentiment, sentiment_counts)
+            first_by_source.setdefault(article["source"], article)
+            scores.append(article["sentiment_score"])
+            published_at = str(article["published_at"]) if article["published_at"] else None
+            published.append(published_at)
+            if (article["relevance_score"] or 0) > _HIGH_RELEVANCE:
+                high_relevance.append((article, published_at))
+
+        # Aggregates are repeated on every row; read them from the first
+        summary = articles[0]
+        sentiment_counts = {
+            "positive": summary["positive"],
+            "neutral": summary["neutral"],
+            "negative": summary["negative"],
+        }
+        stats = _NewsStats(
+            avg_sentiment=summary["avg_sentiment"],
+            sentiment_label=self._classify_sentiment(summary["avg_sentiment"]),
+            weighted_sentiment=summary["weighted_sentiment"],
+            sentiment_counts=sentiment_counts,
+            labeled_count=sum(sentiment_counts.values()),
+            max_label_count=max(sentiment_counts.values()),
+            # Busiest sources first; nlargest keeps ties in list order like a stable sort
+            sources=heapq.nlargest(
+                _TOP_SOURCES, first_by_source.values(), key=itemgetter("source_article_count")
+            ),
+            scores=scores,
+            published=published,
+            high_relevance=high_relevance,
+        )
+
+        return self._FORMATTERS[mode](self, symbol, articles, stats)
 
     def _format_beginner(
         self,
         symbol: str,
-        articles: list[dict],
-        avg_sentiment: float,
-        sentiment_counts: dict,
+        articles: list[Any],
+        stats: _NewsStats,
     ) -> dict[str, Any]:
         """Format for beginner mode - simple news sentiment overview."""
-        sentiment_label = self._classify_sentiment(avg_sentiment)
-
-        emoji_map = {
-            "very_positive": "🚀",
-            "positive": "📈",
-            "neutral": "➡️",
-            "negative": "📉",
-            "very_negative": "⚠️",
-        }
+        avg_sentiment = stats.avg_sentiment
+        sentiment_counts = stats.sentiment_counts
+        sentiment_label = stats.sentiment_label
 
         return {
             "symbol": symbol,
             "overall_sentiment": sentiment_label,
-            "sentiment_emoji": emoji_map.get(sentiment_label, "❓"),
+            "sentiment_emoji": self._SENTIMENT_EMOJIS.get(sentiment_label, "❓"),
             "sentiment_score": round(avg_sentiment * 100),  # Convert -1/+1 to -100/+100
             "simple_explanation": self._get_sentiment_explanation(sentiment_label),
             "article_count": len(articles),
@@ -134,42 +255,37 @@ class NewsSentimentHandler(BaseCardHandler):
                 {
                     "title": a["title"],
                     "sentiment": a.get("sentiment_label", "neutral"),
-                    "date": str(a["published_at"].date()) if a.get("published_at") else None,
+                    "date": published[:10] if published else None,  # YYYY-MM-DD
                 }
-                for a in articles[:5]
+                for a, published in zip(articles[:5], stats.published)
             ],
-            "advice": self._get_beginner_advice(sentiment_label, sentiment_counts),
+            "advice": self._get_beginner_advice(
+                sentiment_label, sentiment_counts["positive"], stats.labeled_count
+            ),
             "educational_tip": "News sentiment shows market mood. Positive news doesn't guarantee price increase, but extreme negative news often predicts volatility.",
         }
 
     def _format_intermediate(
         self,
         symbol: str,
-        articles: list[dict],
-        avg_sentiment: float,
-        sentiment_counts: dict,
+        articles: list[Any],
+        stats: _NewsStats,
     ) -> dict[str, Any]:
         """Format for intermediate mode - detailed news analysis."""
-        sentiment_label = self._classify_sentiment(avg_sentiment)
+        avg_sentiment = stats.avg_sentiment
+        sentiment_counts = stats.sentiment_counts
+        sentiment_label = stats.sentiment_label
 
         # Calculate sentiment trend (comparing recent vs older articles)
-        mid_point = len(articles) // 2
-        recent_articles = articles[:mid_point] if mid_point > 0 else articles
-        older_articles = articles[mid_point:] if mid_point > 0 else []
+        mid_point = len(stats.scores) // 2
+        recent_scores = stats.scores[:mid_point] if mid_point > 0 else stats.scores
+        older_scores = stats.scores[mid_point:] if mid_point > 0 else []
 
-        recent_sentiment = self._calculate_avg_sentiment(recent_articles)
-        older_sentiment = self._calculate_avg_sentiment(older_articles) if older_articles else recent_sentiment
+        recent_sentiment = self._average_score(recent_scores)
+        older_sentiment = self._average_score(older_scores) if older_scores else recent_sentiment
 
         sentiment_trend = "improving" if recent_sentiment > older_sentiment + 0.1 else "declining" if recent_sentiment < older_sentiment - 0.1 else "stable"
 
-        # Source analysis
-        sources = {}
-        for article in articles:
-            source = article.get("source", "Unknown")
-            if source not in sources:
-                sources[source] = 0
-            sources[source] += 1
-
         return {
             "symbol": symbol,
             "sentiment_metrics": {
@@ -179,15 +295,10 @@ class NewsSentimentHandler(BaseCardHandler):
                 "article_count_7d": len(articles),
                 "sentiment_trend": sentiment_trend,
             },
-            "sentiment_distribution": {
-                "positive": sentiment_counts["positive"],
-                "positive_pct": round(sentiment_counts["positive"] / len(articles) * 100, 1),
-                "neutral": sentiment_counts["neutral"],
-                "neutral_pct": round(sentiment_counts["neutral"] / len(articles) * 100, 1),
-                "negative": sentiment_counts["negative"],
-                "negative_pct": round(sentiment_counts["negative"] / len(articles) * 100, 1),
-            },
-            "sources": [{"name": source, "count": count} for source, count in sorted(sources.items(), key=lambda x: x[1], reverse=True)[:5]],
+            "sentiment_distribution": self._distribution(sentiment_counts, len(articles), 1),
+            "sources": [
+                {"name": s["source"], "count": s["source_article_count"]} for s in stats.sources[:5]
+            ],
             "recent_articles": [
                 {
                     "title": a["title"],
@@ -195,129 +306,127 @@ class NewsSentimentHandler(BaseCardHandler):
                     "sentiment_label": a.get("sentiment_label"),
                     "sentiment_score": round(a["sentiment_score"], 2) if a.get("sentiment_score") is not None else None,
                     "relevance": round(a["relevance_score"], 2) if a.get("relevance_score") is not None else None,
-                    "published_at": str(a["published_at"]) if a.get("published_at") else None,
+                    "published_at": published,
                 }
-                for a in articles[:10]
+                for a, published in zip(articles[:10], stats.published)
             ],
-            "interpretation": self._get_intermediate_interpretation(sentiment_label, sentiment_trend, sentiment_counts),
+            "interpretation": self._get_intermediate_interpretation(
+                sentiment_label, sentiment_trend, stats.max_label_count, stats.labeled_count
+            ),
         }
 
     def _format_advanced(
         self,
         symbol: str,
-        articles: list[dict],
-        avg_sentiment: float,
-        sentiment_counts: dict,
+        articles: list[Any],
+        stats: _NewsStats,
     ) -> dict[str, Any]:
         """Format for advanced mode - comprehensive sentiment analysis."""
-        sentiment_label = self._classify_sentiment(avg_sentiment)
+        avg_sentiment = stats.avg_sentiment
+        weighted_sentiment = stats.weighted_sentiment
+        sentiment_counts = stats.sentiment_counts
+        high_relevance = stats.high_relevance
+        sentiment_label = stats.sentiment_label
 
         # Detailed trend analysis
-        trend_analysis = self._analyze_sentiment_trend(articles)
-
-        # Source credibility weighting
-        weighted_sentiment = self._calculate_weighted_sentiment(articles)
-
-        # High-relevance articles
-        high_relevance = [a for a in articles if a.get("relevance_score", 0) > 0.7]
-
-        # Source distribution
-        sources = {}
-        for article in articles:
-            source = article.get("source", "Unknown")
-            if source not in sources:
-                sources[source] = {"count": 0, "avg_sentiment": []}
-            sources[source]["count"] += 1
-            if article.get("sentiment_score") is not None:
-                sources[source]["avg_sentiment"].append(article["sentiment_score"])
-
-        source_analysis = [
-            {
-                "source": source,
-                "article_count": data["count"],
-                "avg_sentiment": round(sum(data["avg_sentiment"]) / len(data["avg_sentiment"]), 4) if data["avg_sentiment"] else None,
-            }
-            for source, data in sources.items()
-        ]
+        trend_analysis = self._analyze_sentiment_trend(stats.scores)
 
         return {
             "symbol": symbol,
             "sentiment_analysis": {
                 "overall_sentiment": sentiment_label,
-                "raw_sentiment_score": round(avg_sentiment, 6),
+                "raw_sentiment_score": avg_sentiment,
                 "sentiment_score_pct": round(avg_sentiment * 100, 2),
-                "weighted_sentiment_score": round(weighted_sentiment, 6),
-                "sentiment_strength": self._assess_sentiment_strength(avg_sentiment, sentiment_counts, len(articles)),
-            },
-            "distribution": {
-                "positive": sentiment_counts["positive"],
-                "positive_pct": round(sentiment_counts["positive"] / len(articles) * 100, 2),
-                "neutral": sentiment_counts["neutral"],
-                "neutral_pct": round(sentiment_counts["neutral"] / len(articles) * 100, 2),
-                "negative": sentiment_counts["negative"],
-                "negative_pct": round(sentiment_counts["negative"] / len(articles) * 100, 2),
+                "weighted_sentiment_score": weighted_sentiment,
+                "sentiment_strength": self._assess_sentiment_strength(
+                    avg_sentiment, stats.max_label_count, len(articles)
+                ),
             },
+            "distribution": self._distribution(sentiment_counts, len(articles), 2),
             "trend_analysis": trend_analysis,
-            "source_analysis": sorted(source_analysis, key=lambda x: x["article_count"], reverse=True)[:10],
+            "source_analysis": [
+                {
+                    "source": s["source"],
+                    "article_count": s["source_article_count"],
+                    "avg_sentiment": (
+                        round(s["source_avg_sentiment"], 4)
+                        if s["source_avg_sentiment"] is not None
+                        else None
+                    ),
+                }
+                for s in stats.sources[:10]
+            ],
             "high_relevance_articles": [
                 {
                     "title": a["title"],
                     "source": a.get("source"),
                     "sentiment_score": round(a["sentiment_score"], 4) if a.get("sentiment_score") is not None else None,
                     "relevance_score": round(a["relevance_score"], 4) if a.get("relevance_score") is not None else None,
-                    "published_at": str(a["published_at"]) if a.get("published_at") else None,
+                    "published_at": published,
                     "url": a.get("url"),
                 }
-                for a in high_relevance[:5]
+                for a, published in high_relevance[:5]
             ],
             "all_articles": [
                 {
                     "title": a["title"],
                     "source": a.get("source"),
-                    "sentiment_score": round(a["sentiment_score"], 6) if a.get("sentiment_score") is not None else None,
-                    "relevance_score": round(a["relevance_score"], 6) if a.get("relevance_score") is not None else None,
-                    "published_at": str(a["published_at"]) if a.get("published_at") else None,
+                    "sentiment_score": a["sentiment_score"],
+                    "relevance_score": a["relevance_score"],
+                    "published_at": published,
                 }
-                for a in articles
+                for a, published in zip(articles, stats.published)
             ],
             "trading_implications": {
-                "sentiment_divergence": self._assess_divergence(avg_sentiment, sentiment_counts),
+                "sentiment_divergence": self._assess_divergence(
+                    avg_sentiment, sentiment_counts, stats.labeled_count
+                ),
                 "news_intensity": "high" if len(articles) > 15 else "moderate" if len(articles) > 5 else "low",
                 "actionability": self._assess_actionability(avg_sentiment, weighted_sentiment, high_relevance),
             },
         }
 
-    @staticmethod
-    def _classify_sentiment(avg_sentiment: float) -> str:
+    # Mode -> formatter, resolved once at class creation
+    _FORMATTERS: Final[dict[CardMode, Callable[..., dict[str, Any]]]] = {
+        CardMode.beginner: _format_beginner,
+        CardMode.intermediate: _format_intermediate,
+        CardMode.advanced: _format_advanced,
+    }
+
+    @classmethod
+    def _classify_sentiment(cls, avg_sentiment: float) -> str:
         """Classify average sentiment."""
-        if avg_sentiment > 0.5:
-            return "very_positive"
-        elif avg_sentiment > 0.15:
-            return "positive"
-        elif avg_sentiment > -0.15:
-            return "neutral"
-        elif avg_sentiment > -0.5:
-            return "negative"
-        else:
-            return "very_negative"
+        band = (
+            (avg_sentiment > -0.5)
+            + (avg_sentiment > -0.15)
+            + (avg_sentiment > 0.15)
+            + (avg_sentiment > 0.5)
+        )
+        return cls._SENTIMENT_LABELS[band]
 
-    @staticmethod
-    def _get_sentiment_explanation(sentiment_label: str) -> str:
+    @classmethod
+    def _get_sentiment_explanation(cls, sentiment_label: str) -> str:
         """Get beginner explanation of sentiment."""
-        explanations = {
-            "very_positive": "News is very positive. Market is excited about this stock. Watch for overenthusiasm.",
-            "positive": "News is mostly positive. Good momentum, but verify fundamentals.",
-            "neutral": "News is balanced. No strong catalyst either way.",
-            "negative": "News is mostly negative. Exercise caution. May present buying opportunity if oversold.",
-            "very_negative": "News is very negative. High risk. Wait for situation to stabilize.",
-        }
-        return explanations.get(sentiment_label, "Sentiment unclear.")
+        return cls._SENTIMENT_EXPLANATIONS.get(sentiment_label, "Sentiment unclear.")
 
     @staticmethod
-    def _get_beginner_advice(sentiment_label: str, sentiment_counts: dict) -> str:
+    def _distribution(
+        sentiment_counts: dict[str, int],
+        total: int,
+        ndigits: int,
+    ) -> dict[str, Any]:
+        """Label counts with their share of the articles in percent."""
+        distribution: dict[str, Any] = {}
+        for label in ("positive", "neutral", "negative"):
+            count = sentiment_counts[label]
+            distribution[label] = count
+            distribution[f"{label}_pct"] = round(count / total * 100, ndigits)
+        return distribution
+
+    @staticmethod
+    def _get_beginner_advice(sentiment_label: str, positive: int, total: int) -> str:
         """Get beginner trading advice."""
-        total = sum(sentiment_counts.values())
-        positive_ratio = sentiment_counts["positive"] / total if total > 0 else 0
+        positive_ratio = positive / total if total > 0 else 0
 
         if sentiment_label == "very_positive" and positive_ratio > 0.7:
             return "Strong positive news, but don't chase highs. Wait for pullback or confirmation."
@@ -331,7 +440,9 @@ class NewsSentimentHandler(BaseCardHandler):
             return "Very negative sentiment. High risk - stay away unless you have strong conviction."
 
     @staticmethod
-    def _get_intermediate_interpretation(sentiment_label: str, trend: str, counts: dict) -> str:
+    def _get_intermediate_interpretation(
+        sentiment_label: str, trend: str, max_count: int, total: int
+    ) -> str:
         """Get intermediate interpretation."""
         base = f"Overall sentiment: {sentiment_label}. "
 
@@ -342,9 +453,8 @@ class NewsSentimentHandler(BaseCardHandler):
         else:
             base += "Sentiment stable."
 
-        total = sum(counts.values())
         if total > 0:
-            consensus = max(counts.values()) / total
+            consensus = max_count / total
             if consensus > 0.7:
                 base += " Strong consensus in news."
             else:
@@ -353,27 +463,23 @@ class NewsSentimentHandler(BaseCardHandler):
         return base
 
     @staticmethod
-    def _calculate_avg_sentiment(articles: list[dict]) -> float:
-        """Calculate average sentiment for a list of articles."""
-        scores = [float(a["sentiment_score"]) for a in articles if a.get("sentiment_score") is not None]
-        return sum(scores) / len(scores) if scores else 0.0
+    def _average_score(scores: list[Optional[float]]) -> float:
+        """Average of the non-missing sentiment scores (0.0 if there are none)."""
+        present = [score for score in scores if score is not None]
+        return sum(present) / len(present) if present else 0.0
 
     @staticmethod
-    def _analyze_sentiment_trend(articles: list[dict]) -> dict:
+    def _analyze_sentiment_trend(scores: list[Optional[float]]) -> dict:
         """Analyze sentiment trend over time."""
-        if len(articles) < 4:
+        if len(scores) < 4:
             return {"trend": "insufficient_data"}
 
         # Split into quarters
-        quarter_size = len(articles) // 4
-        quarters = [
-            articles[i*quarter_size:(i+1)*quarter_size]
-            for i in range(4)
-        ]
+        quarter_size = len(scores) // 4
+        quarters = [scores[i * quarter_size : (i + 1) * quarter_size] for i in range(4)]
 
         quarter_sentiments = [
-            sum(float(a["sentiment_score"]) for a in q if a.get("sentiment_score") is not None) / len(q) if q else 0
-            for q in quarters
+            sum(score for score in q if score is not None) / len(q) if q else 0 for q in quarters
         ]
 
         # Determine trend
@@ -396,23 +502,7 @@ class NewsSentimentHandler(BaseCardHandler):
         }
 
     @staticmethod
-    def _calculate_weighted_sentiment(articles: list[dict]) -> float:
-        """Calculate sentiment weighted by relevance score."""
-        weighted_sum = 0.0
-        weight_total = 0.0
-
-        for article in articles:
-            sentiment = article.get("sentiment_score")
-            relevance = article.get("relevance_score", 0.5)
-
-            if sentiment is not None:
-                weighted_sum += float(sentiment) * float(relevance)
-                weight_total += float(relevance)
-
-        return weighted_sum / weight_total if weight_total > 0 else 0.0
-
-    @staticmethod
-    def _assess_sentiment_strength(avg_sentiment: float, counts: dict, total: int) -> str:
+    def _assess_sentiment_strength(avg_sentiment: float, max_count: int, total: int) -> str:
         """Assess strength of sentiment signal."""
         if abs(avg_sentiment) > 0.6:
             strength = "very_strong"
@@ -425,7 +515,6 @@ class NewsSentimentHandler(BaseCardHandler):
 
         # Adjust for consensus
         if total > 0:
-            max_count = max(counts.values())
             consensus = max_count / total
             if consensus < 0.5:
                 strength = "weak"  # Downgrade if no consensus
@@ -433,9 +522,8 @@ class NewsSentimentHandler(BaseCardHandler):
         return strength
 
     @staticmethod
-    def _assess_divergence(avg_sentiment: float, counts: dict) -> str:
+    def _assess_divergence(avg_sentiment: float, counts: dict, total: int) -> str:
         """Assess if there's divergence in sentiment."""
-        total = sum(counts.values())
         if total == 0:
             return "unknown"
 
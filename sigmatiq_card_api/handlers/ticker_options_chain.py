@@ -7,21 +7,154 @@ Shows critical options data:
 - Put/Call ratio
 - Open interest distribution
 
-Data source: sb.options_chain_summary (aggregated view)
+Data sources: sb.options_chain (per-strike quotes), sb.equity_bars_daily (close)
 """
 
-from datetime import date, timedelta
-from typing import Any, Optional
+from collections.abc import Callable
+from datetime import date
+from operator import itemgetter
+from typing import Any, Final, Optional
 
 from fastapi import HTTPException
 
 from ..models.cards import CardMode
 from .base import BaseCardHandler
+from .cache import TTLCache, ttl_for_trading_date
+
+# Closing price of the underlying plus, in the same round-trip, the ATM options
+# for the nearest expirations (strikes within 5% of that price) and volume and
+# open interest totals for the first five expirations. ATM and summary rows are
+# told apart by kind and ordered by rn; every row carries the close. With no
+# price row the result is empty; with no options it is a single close-only row.
+# Prices and IVs come back as floats and volumes/open interest as ints.
+_CHAIN_QUERY: Final[str] = """
+    WITH px AS (
+        SELECT close
+        FROM sb.equity_bars_daily
+        WHERE symbol = $1 AND trading_date = $2
+        LIMIT 1
+    ),
+    atm AS (
+        SELECT
+            o.expiration_date,
+            o.strike_price,
+            o.call_bid, o.call_ask, o.call_volume, o.call_open_interest, o.call_iv,
+            o.put_bid, o.put_ask, o.put_volume, o.put_open_interest, o.put_iv,
+            ROW_NUMBER() OVER (
+                ORDER BY o.expiration_date ASC, ABS(o.strike_price - px.close) ASC
+            ) AS rn
+        FROM sb.options_chain o
+        CROSS JOIN px
+        WHERE o.symbol = $1
+          AND o.quote_date = $2
+          AND o.expiration_date > $2
+          -- |strike - close| < 5% of close, as a range the strike_price index can seek
+          AND o.strike_price > px.close * 0.95
+          AND o.strike_price < px.close * 1.05
+        ORDER BY rn
+        LIMIT 10
+    ),
+    summary AS (
+        SELECT
+            expiration_date,
+            SUM(call_volume)::bigint as total_call_volume,
+            SUM(put_volume)::bigint as total_put_volume,
+            SUM(call_open_interest)::bigint as total_call_oi,
+            SUM(put_open_interest)::bigint as total_put_oi,
+            ROW_NUMBER() OVER (ORDER BY expiration_date ASC) AS rn
+        FROM sb.options_chain
+        WHERE symbol = $1 AND quote_date = $2
+        GROUP BY expiration_date
+        ORDER BY expiration_date ASC
+        LIMIT 5
+    ),
+    chain AS (
+        SELECT
+            'atm' AS kind, rn, expiration_date,
+            strike_price::double precision AS strike_price,
+            call_bid::double precision AS call_bid,
+            call_ask::double precision AS call_ask,
+            call_volume::bigint AS call_volume,
+            call_open_interest::bigint AS call_open_interest,
+            call_iv::double precision AS call_iv,
+            put_bid::double precision AS put_bid,
+            put_ask::double precision AS put_ask,
+            put_volume::bigint AS put_volume,
+            put_open_interest::bigint AS put_open_interest,
+            put_iv::double precision AS put_iv,
+            NULL::bigint AS total_call_volume, NULL::bigint AS total_put_volume,
+            NULL::bigint AS total_call_oi, NULL::bigint AS total_put_oi
+        FROM atm
+        UNION ALL
+        SELECT
+            'summary', rn, expiration_date, NULL,
+            NULL, NULL, NULL, NULL, NULL,
+            NULL, NULL, NULL, NULL, NULL,
+            total_call_volume, total_put_volume,
+            total_call_oi, total_put_oi
+        FROM summary
+    )
+    SELECT px.close::double precision AS close, c.*
+    FROM px
+    LEFT JOIN chain c ON TRUE
+    ORDER BY c.kind, c.rn
+"""
+
+# Option and expiration-summary fields read from a chain row in one call
+_ATM_FIELDS: Final = itemgetter(
+    "expiration_date",
+    "strike_price",
+    "call_bid",
+    "call_ask",
+    "call_volume",
+    "call_open_interest",
+    "call_iv",
+    "put_bid",
+    "put_ask",
+    "put_volume",
+    "put_open_interest",
+    "put_iv",
+)
+_SUMMARY_FIELDS: Final = itemgetter(
+    "expiration_date",
+    "total_call_volume",
+    "total_put_volume",
+    "total_call_oi",
+    "total_put_oi",
+)
+
+# Formatted payloads keyed by (symbol, mode, trading_date)
+_RESPONSE_CACHE = TTLCache(maxsize=2048)
 
 
 class OptionsChainHandler(BaseCardHandler):
     """Handler for ticker_options_chain card - options chain summary."""
 
+    # Quotes move all day, so today's chain goes stale after a minute
+    CACHE_INTRADAY_TTL_SECONDS = 60
+
+    # PCR readings by band, one step per threshold passed in the helpers below
+    _PCR_BEGINNER_LABELS: Final[tuple[str, ...]] = (
+        "Bullish - more calls than puts (optimism)",
+        "Neutral - balanced put/call activity",
+        "Bearish - more puts than calls (fear/hedging)",
+        "Very bearish - many more puts than calls being traded",
+    )
+    _PCR_INTERPRETATIONS: Final[tuple[str, ...]] = (
+        "Very bullish/speculative positioning",
+        "Moderately bullish sentiment",
+        "Neutral market sentiment",
+        "Bearish/defensive positioning",
+        "Extremely bearish sentiment or heavy hedging",
+    )
+    _PCR_CLASSES: Final[tuple[str, ...]] = (
+        "very_bullish",
+        "bullish",
+        "neutral",
+        "bearish",
+        "very_bearish",
+    )
+
     async def fetch(
         self,
         mode: CardMode,
@@ -31,204 +164,207 @@ class OptionsChainHandler(BaseCardHandler):
         if not symbol:
             raise HTTPException(400, "Symbol required for ticker_options_chain")
 
-        # Get ATM options for next expiration
-        atm_query = """
-            SELECT
-                expiration_date,
-                strike_price,
-                call_bid, call_ask, call_volume, call_open_interest, call_iv,
-                put_bid, put_ask, put_volume, put_open_interest, put_iv
-            FROM sb.options_chain
-            WHERE symbol = $1
-              AND quote_date = $2
-              AND expiration_date >= $3
-              AND ABS(strike_price - $4) < $5
-            ORDER BY expiration_date ASC, ABS(strike_price - $4) ASC
-            LIMIT 10
-        """
-
-        # Get current stock price
-        price_query = """
-            SELECT close
-            FROM sb.equity_bars_daily
-            WHERE symbol = $1 AND trading_date = $2
-            LIMIT 1
-        """
-
-        # Get summary metrics
-        summary_query = """
-            SELECT
-                expiration_date,
-                SUM(call_volume) as total_call_volume,
-                SUM(put_volume) as total_put_volume,
-                SUM(call_open_interest) as total_call_oi,
-                SUM(put_open_interest) as total_put_oi
-            FROM sb.options_chain
-            WHERE symbol = $1 AND quote_date = $2
-            GROUP BY expiration_date
-            ORDER BY expiration_date ASC
-            LIMIT 5
-        """
-
-        price_row = await self._fetch_one(price_query, {"symbol": symbol, "trading_date": trading_date})
-        current_price = float(price_row["close"]) if price_row and price_row.get("close") else None
+        return await _RESPONSE_CACHE.get_or_set(
+            (symbol, mode, trading_date),
+            lambda: self._fetch_uncached(mode, symbol, trading_date),
+            ttl_for_trading_date(trading_date, intraday_ttl=self.CACHE_INTRADAY_TTL_SECONDS),
+        )
+
+    async def _fetch_uncached(
+        self,
+        mode: CardMode,
+        symbol: str,
+        trading_date: date,
+    ) -> dict[str, Any]:
+        """Query and format the options chain, bypassing the response cache."""
+        rows = await self._fetch_all(_CHAIN_QUERY, {"symbol": symbol, "trading_date": trading_date})
+        current_price = rows[0]["close"] if rows and rows[0]["close"] else None
 
         if not current_price:
             raise HTTPException(404, f"No price data for {symbol}")
 
-        # Strike range for ATM (within 5% of current price)
-        strike_range = current_price * 0.05
-
-        atm_options = await self._fetch_all(atm_query, {
-            "symbol": symbol,
-            "quote_date": trading_date,
-            "min_expiration": trading_date + timedelta(days=1),
-            "current_price": current_price,
-            "strike_range": strike_range,
-        })
-
-        summary = await self._fetch_all(summary_query, {"symbol": symbol, "quote_date": trading_date})
+        atm_options = [row for row in rows if row["kind"] == "atm"]
+        summary = [row for row in rows if row["kind"] == "summary"]
 
         if not atm_options and not summary:
             raise HTTPException(404, f"No options data for {symbol}")
 
         # Calculate PCR
         if summary:
-            total_put_vol = sum(float(s["total_put_volume"]) for s in summary if s.get("total_put_volume"))
-            total_call_vol = sum(float(s["total_call_volume"]) for s in summary if s.get("total_call_volume"))
+            total_put_vol = sum(s["total_put_volume"] for s in summary if s["total_put_volume"])
+            total_call_vol = sum(s["total_call_volume"] for s in summary if s["total_call_volume"])
             pcr = total_put_vol / total_call_vol if total_call_vol > 0 else None
         else:
             pcr = None
 
-        if mode == CardMode.beginner:
-            next_exp = atm_options[0] if atm_options else None
-            return {
-                "symbol": symbol,
-                "current_price": f"${current_price:.2f}" if current_price else None,
-                "has_options": bool(atm_options),
-                "next_expiration": str(next_exp["expiration_date"]) if next_exp else None,
-                "days_to_expiration": (next_exp["expiration_date"] - trading_date).days if next_exp else None,
-                "atm_call_price": f"${float(next_exp['call_ask']):.2f}" if next_exp and next_exp.get("call_ask") else None,
-                "atm_put_price": f"${float(next_exp['put_ask']):.2f}" if next_exp and next_exp.get("put_ask") else None,
-                "put_call_ratio": round(pcr, 2) if pcr else None,
-                "pcr_interpretation": self._interpret_pcr_beginner(pcr) if pcr else "No data",
-                "educational_tip": "Options give right to buy (call) or sell (put) stock at set price. ATM = at-the-money (strike near current price). Options expire worthless if not in-the-money.",
-                "beginner_warning": "Options are complex and risky. Can lose 100% of premium. Paper trade first.",
-            }
-        elif mode == CardMode.intermediate:
-            return {
-                "symbol": symbol,
-                "current_price": round(current_price, 2) if current_price else None,
-                "atm_options_next_exp": [
-                    {
-                        "expiration": str(opt["expiration_date"]),
-                        "strike": round(float(opt["strike_price"]), 2) if opt.get("strike_price") else None,
-                        "call_bid_ask": f"${float(opt['call_bid']):.2f}/${float(opt['call_ask']):.2f}" if opt.get("call_bid") and opt.get("call_ask") else None,
-                        "put_bid_ask": f"${float(opt['put_bid']):.2f}/${float(opt['put_ask']):.2f}" if opt.get("put_bid") and opt.get("put_ask") else None,
-                        "call_iv": f"{float(opt['call_iv'])*100:.1f}%" if opt.get("call_iv") else None,
-                        "put_iv": f"{float(opt['put_iv'])*100:.1f}%" if opt.get("put_iv") else None,
-                    }
-                    for opt in atm_options[:5]
-                ],
-                "volume_analysis": {
-                    "put_call_ratio": round(pcr, 3) if pcr else None,
-                    "interpretation": self._interpret_pcr(pcr) if pcr else "Unknown",
-                },
-                "expiration_summary": [
-                    {
-                        "expiration": str(s["expiration_date"]),
-                        "call_volume": int(s["total_call_volume"]) if s.get("total_call_volume") else 0,
-                        "put_volume": int(s["total_put_volume"]) if s.get("total_put_volume") else 0,
-                        "call_oi": int(s["total_call_oi"]) if s.get("total_call_oi") else 0,
-                        "put_oi": int(s["total_put_oi"]) if s.get("total_put_oi") else 0,
-                    }
-                    for s in summary
-                ],
-            }
-        else:
-            return {
-                "symbol": symbol,
-                "underlying_price": round(current_price, 4) if current_price else None,
-                "atm_chain": [
-                    {
-                        "expiration_date": str(opt["expiration_date"]),
-                        "days_to_expiration": (opt["expiration_date"] - trading_date).days,
-                        "strike_price": round(float(opt["strike_price"]), 4) if opt.get("strike_price") else None,
-                        "moneyness": round((float(opt["strike_price"]) - current_price) / current_price * 100, 2) if opt.get("strike_price") and current_price else None,
-                        "call": {
-                            "bid": round(float(opt["call_bid"]), 4) if opt.get("call_bid") else None,
-                            "ask": round(float(opt["call_ask"]), 4) if opt.get("call_ask") else None,
-                            "volume": int(opt["call_volume"]) if opt.get("call_volume") else 0,
-                            "open_interest": int(opt["call_open_interest"]) if opt.get("call_open_interest") else 0,
-                            "implied_volatility": round(float(opt["call_iv"]), 6) if opt.get("call_iv") else None,
-                        },
-                        "put": {
-                            "bid": round(float(opt["put_bid"]), 4) if opt.get("put_bid") else None,
-                            "ask": round(float(opt["put_ask"]), 4) if opt.get("put_ask") else None,
-                            "volume": int(opt["put_volume"]) if opt.get("put_volume") else 0,
-                            "open_interest": int(opt["put_open_interest"]) if opt.get("put_open_interest") else 0,
-                            "implied_volatility": round(float(opt["put_iv"]), 6) if opt.get("put_iv") else None,
-                        },
-                    }
-                    for opt in atm_options
-                ],
-                "aggregate_metrics": {
-                    "put_call_volume_ratio": round(pcr, 6) if pcr else None,
-                    "sentiment": self._classify_pcr(pcr) if pcr else "Unknown",
-                },
-                "by_expiration": [
-                    {
-                        "expiration_date": str(s["expiration_date"]),
-                        "days_to_expiration": (s["expiration_date"] - trading_date).days,
-                        "metrics": {
-                            "total_call_volume": int(s["total_call_volume"]) if s.get("total_call_volume") else 0,
-                            "total_put_volume": int(s["total_put_volume"]) if s.get("total_put_volume") else 0,
-                            "total_call_oi": int(s["total_call_oi"]) if s.get("total_call_oi") else 0,
-                            "total_put_oi": int(s["total_put_oi"]) if s.get("total_put_oi") else 0,
-                            "put_call_volume_ratio": round(float(s["total_put_volume"]) / float(s["total_call_volume"]), 4) if s.get("total_call_volume") and float(s["total_call_volume"]) > 0 else None,
-                            "put_call_oi_ratio": round(float(s["total_put_oi"]) / float(s["total_call_oi"]), 4) if s.get("total_call_oi") and float(s["total_call_oi"]) > 0 else None,
-                        },
-                    }
-                    for s in summary
-                ],
-            }
-
-    @staticmethod
-    def _interpret_pcr_beginner(pcr: float) -> str:
+        return self._FORMATTERS[mode](
+            self, symbol, trading_date, current_price, pcr, atm_options, summary
+        )
+
+    def _format_beginner(
+        self,
+        symbol: str,
+        trading_date: date,
+        current_price: float,
+        pcr: Optional[float],
+        atm_options: list[Any],
+        summary: list[Any],
+    ) -> dict[str, Any]:
+        """Format for beginner mode - price, next expiration and a plain PCR reading."""
+        next_exp = atm_options[0] if atm_options else None
+        return {
+            "symbol": symbol,
+            "current_price": f"${current_price:.2f}" if current_price else None,
+            "has_options": bool(atm_options),
+            "next_expiration": str(next_exp["expiration_date"]) if next_exp else None,
+            "days_to_expiration": (
+                (next_exp["expiration_date"] - trading_date).days if next_exp else None
+            ),
+            "atm_call_price": (
+                f"${next_exp['call_ask']:.2f}" if next_exp and next_exp.get("call_ask") else None
+            ),
+            "atm_put_price": (
+                f"${next_exp['put_ask']:.2f}" if next_exp and next_exp.get("put_ask") else None
+            ),
+            "put_call_ratio": round(pcr, 2) if pcr else None,
+            "pcr_interpretation": self._interpret_pcr_beginner(pcr) if pcr else "No data",
+            "educational_tip": (
+                "Options give right to buy (call) or sell (put) stock at set price. "
+                "ATM = at-the-money (strike near current price). "
+                "Options expire worthless if not in-the-money."
+            ),
+            "beginner_warning": (
+                "Options are complex and risky. Can lose 100% of premium. Paper trade first."
+            ),
+        }
+
+    def _format_intermediate(
+        self,
+        symbol: str,
+        trading_date: date,
+        current_price: float,
+        pcr: Optional[float],
+        atm_options: list[Any],
+        summary: list[Any],
+    ) -> dict[str, Any]:
+        """Format for intermediate mode - ATM quotes, PCR and expiration totals."""
+        return {
+            "symbol": symbol,
+            "current_price": round(current_price, 2) if current_price else None,
+            "atm_options_next_exp": [
+                {
+                    "expiration": str(exp),
+                    "strike": round(strike, 2) if strike else None,
+                    "call_bid_ask": f"${cb:.2f}/${ca:.2f}" if cb and ca else None,
+                    "put_bid_ask": f"${pb:.2f}/${pa:.2f}" if pb and pa else None,
+                    "call_iv": f"{civ*100:.1f}%" if civ else None,
+                    "put_iv": f"{piv*100:.1f}%" if piv else None,
+                }
+                for exp, strike, cb, ca, cv, coi, civ, pb, pa, pv, poi, piv in map(
+                    _ATM_FIELDS, atm_options[:5]
+                )
+            ],
+            "volume_analysis": {
+                "put_call_ratio": round(pcr, 3) if pcr else None,
+                "interpretation": self._interpret_pcr(pcr) if pcr else "Unknown",
+            },
+            "expiration_summary": [
+                {
+                    "expiration": str(exp),
+                    "call_volume": call_vol or 0,
+                    "put_volume": put_vol or 0,
+                    "call_oi": call_oi or 0,
+                    "put_oi": put_oi or 0,
+                }
+                for exp, call_vol, put_vol, call_oi, put_oi in map(_SUMMARY_FIELDS, summary)
+            ],
+        }
+
+    def _format_advanced(
+        self,
+        symbol: str,
+        trading_date: date,
+        current_price: float,
+        pcr: Optional[float],
+        atm_options: list[Any],
+        summary: list[Any],
+    ) -> dict[str, Any]:
+        """Format for advanced mode - full ATM chain and per-expiration ratios."""
+        return {
+            "symbol": symbol,
+            "underlying_price": round(current_price, 4) if current_price else None,
+            "atm_chain": [
+                {
+                    "expiration_date": str(exp),
+                    "days_to_expiration": (exp - trading_date).days,
+                    "strike_price": round(strike, 4) if strike else None,
+                    "moneyness": (
+                        round((strike - current_price) / current_price * 100, 2)
+                        if strike and current_price
+                        else None
+                    ),
+                    "call": {
+                        "bid": round(cb, 4) if cb else None,
+                        "ask": round(ca, 4) if ca else None,
+                        "volume": cv or 0,
+                        "open_interest": coi or 0,
+                        "implied_volatility": round(civ, 6) if civ else None,
+                    },
+                    "put": {
+                        "bid": round(pb, 4) if pb else None,
+                        "ask": round(pa, 4) if pa else None,
+                        "volume": pv or 0,
+                        "open_interest": poi or 0,
+                        "implied_volatility": round(piv, 6) if piv else None,
+                    },
+                }
+                for exp, strike, cb, ca, cv, coi, civ, pb, pa, pv, poi, piv in map(
+                    _ATM_FIELDS, atm_options
+                )
+            ],
+            "aggregate_metrics": {
+                "put_call_volume_ratio": round(pcr, 6) if pcr else None,
+                "sentiment": self._classify_pcr(pcr) if pcr else "Unknown",
+            },
+            "by_expiration": [
+                {
+                    "expiration_date": str(exp),
+                    "days_to_expiration": (exp - trading_date).days,
+                    "metrics": {
+                        "total_call_volume": call_vol or 0,
+                        "total_put_volume": put_vol or 0,
+                        "total_call_oi": call_oi or 0,
+                        "total_put_oi": put_oi or 0,
+                        "put_call_volume_ratio": (
+                            round(put_vol / call_vol, 4) if call_vol and call_vol > 0 else None
+                        ),
+                        "put_call_oi_ratio": (
+                            round(put_oi / call_oi, 4) if call_oi and call_oi > 0 else None
+                        ),
+                    },
+                }
+                for exp, call_vol, put_vol, call_oi, put_oi in map(_SUMMARY_FIELDS, summary)
+            ],
+        }
+
+    # Mode -> formatter, resolved once at class creation
+    _FORMATTERS: Final[dict[CardMode, Callable[..., dict[str, Any]]]] = {
+        CardMode.beginner: _format_beginner,
+        CardMode.intermediate: _format_intermediate,
+        CardMode.advanced: _format_advanced,
+    }
+
+    @classmethod
+    def _interpret_pcr_beginner(cls, pcr: float) -> str:
         """Beginner interpretation of PCR."""
-        if pcr > 1.5:
-            return "Very bearish - many more puts than calls being traded"
-        elif pcr > 1.0:
-            return "Bearish - more puts than calls (fear/hedging)"
-        elif pcr > 0.7:
-            return "Neutral - balanced put/call activity"
-        else:
-            return "Bullish - more calls than puts (optimism)"
+        return cls._PCR_BEGINNER_LABELS[(pcr > 0.7) + (pcr > 1.0) + (pcr > 1.5)]
 
-    @staticmethod
-    def _interpret_pcr(pcr: float) -> str:
+    @classmethod
+    def _interpret_pcr(cls, pcr: float) -> str:
         """Intermediate interpretation of PCR."""
-        if pcr > 1.5:
-            return "Extremely bearish sentiment or heavy hedging"
-        elif pcr > 1.0:
-            return "Bearish/defensive positioning"
-        elif pcr > 0.7:
-            return "Neutral market sentiment"
-        elif pcr > 0.5:
-            return "Moderately bullish sentiment"
-        else:
-            return "Very bullish/speculative positioning"
+        return cls._PCR_INTERPRETATIONS[(pcr > 0.5) + (pcr > 0.7) + (pcr > 1.0) + (pcr > 1.5)]
 
-    @staticmethod
-    def _classify_pcr(pcr: float) -> str:
+    @classmethod
+    def _classify_pcr(cls, pcr: float) -> str:
         """Classify PCR level."""
-        if pcr > 1.2:
-            return "very_bearish"
-        elif pcr > 0.9:
-            return "bearish"
-        elif pcr > 0.7:
-            return "neutral"
-        elif pcr > 0.5:
-            return "bullish"
-        else:
-            return "very_bullish"
+        return cls._PCR_CLASSES[(pcr > 0.5) + (pcr > 0.7) + (pcr > 0.9) + (pcr > 1.2)]
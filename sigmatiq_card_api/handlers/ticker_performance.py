@@ -5,17 +5,60 @@ Provides single stock analysis: price change, volume, technical indicators.
 """
 
 from datetime import date
-from typing import Any, Optional
+from typing import Any, Final, Optional
 
 from fastapi import HTTPException
 
 from ..models.cards import CardMode
 from .base import BaseCardHandler
+from .cache import TTLCache, ttl_for_trading_date
+
+# End-of-day price, volume and indicator snapshot for one symbol (numerics cast
+# to float in SQL)
+_PERFORMANCE_QUERY: Final[str] = """
+    SELECT
+        symbol,
+        close::double precision AS close,
+        r_1d_pct::double precision AS r_1d_pct,
+        volume::bigint AS volume,
+        rvol::double precision AS rvol,
+        atr_pct::double precision AS atr_pct,
+        rsi_14::double precision AS rsi_14,
+        macd::double precision AS macd,
+        macd_signal::double precision AS macd_signal,
+        bb_position::double precision AS bb_position,
+        dist_ma20::double precision AS dist_ma20,
+        dist_ma50::double precision AS dist_ma50,
+        dist_ma200::double precision AS dist_ma200
+    FROM sb.symbol_derived_eod
+    WHERE symbol = $1 AND trading_date = $2
+"""
+
+# Formatted payloads keyed by (symbol, mode, trading_date); end-of-day rows for
+# today may still be rewritten, so those use the base CACHE_INTRADAY_TTL_SECONDS
+_RESPONSE_CACHE = TTLCache(maxsize=4096)
 
 
 class TickerPerformanceHandler(BaseCardHandler):
     """Handler for ticker performance card."""
 
+    # Beginner labels by band, indexed by the comparisons in _format_beginner
+    _PRICE_DIRECTIONS: Final[tuple[tuple[str, str], ...]] = (
+        ("down", "↓"),
+        ("flat", "→"),
+        ("up", "↑"),
+    )
+    _VOLUME_STATUSES: Final[tuple[tuple[str, str], ...]] = (
+        ("low", " (light trading)"),
+        ("normal", ""),
+        ("high", " (strong interest)"),
+    )
+    _MOMENTUM_STATUSES: Final[tuple[tuple[str, str], ...]] = (
+        ("oversold", "May be oversold (potential bounce)"),
+        ("neutral", "Momentum is neutral"),
+        ("overbought", "May be overbought (consider taking profits)"),
+    )
+
     async def fetch(
         self,
         mode: CardMode,
@@ -40,27 +83,22 @@ class TickerPerformanceHandler(BaseCardHandler):
         if not symbol:
             raise ValueError("Symbol is required for ticker_performance card")
 
-        # Query symbol-specific data
-        query = """
-            SELECT
-                symbol,
-                close,
-                r_1d_pct,
-                volume,
-                rvol,
-                atr_pct,
-                rsi_14,
-                macd,
-                macd_signal,
-                bb_position,
-                dist_ma20,
-                dist_ma50,
-                dist_ma200
-            FROM sb.symbol_derived_eod
-            WHERE symbol = $1 AND trading_date = $2
-        """
+        return await _RESPONSE_CACHE.get_or_set(
+            (symbol.upper(), mode, trading_date),
+            lambda: self._fetch_uncached(mode, symbol, trading_date),
+            ttl_for_trading_date(trading_date, intraday_ttl=self.CACHE_INTRADAY_TTL_SECONDS),
+        )
 
-        row = await self._fetch_one(query, {"symbol": symbol.upper(), "trading_date": trading_date})
+    async def _fetch_uncached(
+        self,
+        mode: CardMode,
+        symbol: str,
+        trading_date: date,
+    ) -> dict[str, Any]:
+        """Query and format performance data, bypassing the response cache."""
+        row = await self._fetch_one(
+            _PERFORMANCE_QUERY, {"symbol": symbol.upper(), "trading_date": trading_date}
+        )
 
         if not row:
             raise HTTPException(
@@ -68,101 +106,34 @@ class TickerPerformanceHandler(BaseCardHandler):
                 detail=f"No data available for {symbol} on {trading_date}",
             )
 
-        # Extract values
-        close = row["close"] or 0
-        r_1d_pct = row["r_1d_pct"] or 0
-        volume = row["volume"] or 0
-        rvol = row["rvol"] or 1.0
-        atr_pct = row["atr_pct"] or 0
-        rsi_14 = row["rsi_14"] or 50
-        macd = row["macd"] or 0
-        macd_signal = row["macd_signal"] or 0
-        bb_position = row["bb_position"] or 0.5
-        dist_ma20 = row["dist_ma20"] or 0
-        dist_ma50 = row["dist_ma50"] or 0
-        dist_ma200 = row["dist_ma200"] or 0
-
-        # Format based on mode
+        # Format based on mode; formatters read only the fields they use
         if mode == CardMode.beginner:
-            return self._format_beginner(
-                symbol=symbol.upper(),
-                close=close,
-                r_1d_pct=r_1d_pct,
-                volume=volume,
-                rvol=rvol,
-                rsi_14=rsi_14,
-                atr_pct=atr_pct,
-                dist_ma20=dist_ma20,
-                dist_ma50=dist_ma50,
-                macd=macd,
-                macd_signal=macd_signal,
-            )
+            return self._format_beginner(symbol.upper(), row)
 
         elif mode == CardMode.intermediate:
-            return self._format_intermediate(
-                symbol=symbol.upper(),
-                close=close,
-                r_1d_pct=r_1d_pct,
-                volume=volume,
-                rvol=rvol,
-                atr_pct=atr_pct,
-                rsi_14=rsi_14,
-                macd=macd,
-                macd_signal=macd_signal,
-                dist_ma20=dist_ma20,
-                dist_ma50=dist_ma50,
-            )
+            return self._format_intermediate(symbol.upper(), row)
 
         else:  # advanced
             return self._format_advanced(row)
 
-    def _format_beginner(
-        self,
-        symbol: str,
-        close: float,
-        r_1d_pct: float,
-        volume: int,
-        rvol: float,
-        rsi_14: float,
-        atr_pct: float,
-        dist_ma20: float,
-        dist_ma50: float,
-        macd: float,
-        macd_signal: float,
-    ) -> dict[str, Any]:
+    def _format_beginner(self, symbol: str, row: Any) -> dict[str, Any]:
         """Format for beginner mode (simplified, plain language)."""
-        # Determine price direction
-        if r_1d_pct > 0:
-            price_direction = "up"
-            price_emoji = "↑"
-        elif r_1d_pct < 0:
-            price_direction = "down"
-            price_emoji = "↓"
-        else:
-            price_direction = "flat"
-            price_emoji = "→"
+        close = row["close"] or 0
+        r_1d_pct = row["r_1d_pct"] or 0
+        volume = row["volume"] or 0
+        rvol = self._rvol(row)
+        rsi_14 = self._rsi(row)
 
-        # Volume assessment
-        if rvol > 1.5:
-            volume_status = "high"
-            volume_label = f"{rvol:.1f}x normal volume (strong interest)"
-        elif rvol < 0.7:
-            volume_status = "low"
-            volume_label = f"{rvol:.1f}x normal volume (light trading)"
-        else:
-            volume_status = "normal"
-            volume_label = f"{rvol:.1f}x normal volume"
+        # Price direction: down / flat / up by the sign of the change
+        price_direction, price_emoji = self._PRICE_DIRECTIONS[(r_1d_pct > 0) - (r_1d_pct < 0) + 1]
 
-        # RSI assessment
-        if rsi_14 > 70:
-            momentum = "overbought"
-            momentum_label = f"RSI {rsi_14:.0f} - May be overbought (consider taking profits)"
-        elif rsi_14 < 30:
-            momentum = "oversold"
-            momentum_label = f"RSI {rsi_14:.0f} - May be oversold (potential bounce)"
-        else:
-            momentum = "neutral"
-            momentum_label = f"RSI {rsi_14:.0f} - Momentum is neutral"
+        # Volume assessment: low below 0.7x, high above 1.5x
+        volume_status, volume_note = self._VOLUME_STATUSES[(rvol >= 0.7) + (rvol > 1.5)]
+        volume_label = f"{rvol:.1f}x normal volume{volume_note}"
+
+        # RSI assessment: oversold below 30, overbought above 70
+        momentum, momentum_note = self._MOMENTUM_STATUSES[(rsi_14 >= 30) + (rsi_14 > 70)]
+        momentum_label = f"RSI {rsi_14:.0f} - {momentum_note}"
 
         return {
             "symbol": symbol,
@@ -178,11 +149,11 @@ class TickerPerformanceHandler(BaseCardHandler):
             "action_block": self._build_action_block_beginner(
                 symbol=symbol,
                 rsi_14=rsi_14,
-                atr_pct=atr_pct,
-                dist_ma20=dist_ma20,
-                dist_ma50=dist_ma50,
-                macd=macd,
-                macd_signal=macd_signal,
+                atr_pct=row["atr_pct"] or 0,
+                dist_ma20=row["dist_ma20"] or 0,
+                dist_ma50=row["dist_ma50"] or 0,
+                macd=row["macd"] or 0,
+                macd_signal=row["macd_signal"] or 0,
                 rvol=rvol,
             ),
         }
@@ -227,21 +198,17 @@ class TickerPerformanceHandler(BaseCardHandler):
             "post_check": post_check,
         }
 
-    def _format_intermediate(
-        self,
-        symbol: str,
-        close: float,
-        r_1d_pct: float,
-        volume: int,
-        rvol: float,
-        atr_pct: float,
-        rsi_14: float,
-        macd: float,
-        macd_signal: float,
-        dist_ma20: float,
-        dist_ma50: float,
-    ) -> dict[str, Any]:
+    def _format_intermediate(self, symbol: str, row: Any) -> dict[str, Any]:
         """Format for intermediate mode (more technical terms)."""
+        r_1d_pct = row["r_1d_pct"] or 0
+        rvol = self._rvol(row)
+        atr_pct = row["atr_pct"] or 0
+        rsi_14 = self._rsi(row)
+        macd = row["macd"] or 0
+        macd_signal = row["macd_signal"] or 0
+        dist_ma20 = row["dist_ma20"] or 0
+        dist_ma50 = row["dist_ma50"] or 0
+
         # MACD interpretation
         macd_cross = macd - macd_signal
         if macd_cross > 0:
@@ -264,9 +231,9 @@ class TickerPerformanceHandler(BaseCardHandler):
 
         return {
             "symbol": symbol,
-            "price": close,
+            "price": row["close"] or 0,
             "r_1d_pct": r_1d_pct,
-            "volume": volume,
+            "volume": row["volume"] or 0,
             "rvol": rvol,
             "atr_pct": atr_pct,
             "volatility": "high" if atr_pct > 3 else "low" if atr_pct < 1 else "normal",
@@ -303,6 +270,18 @@ class TickerPerformanceHandler(BaseCardHandler):
             "dist_ma200": row["dist_ma200"],
         }
 
+    @staticmethod
+    def _rvol(row: Any) -> float:
+        """Relative volume, 1.0 (a normal day) when missing; a real 0 is kept."""
+        rvol = row["rvol"]
+        return rvol if rvol is not None else 1.0
+
+    @staticmethod
+    def _rsi(row: Any) -> float:
+        """RSI(14), neutral 50 when missing; a real 0 is kept."""
+        rsi_14 = row["rsi_14"]
+        return rsi_14 if rsi_14 is not None else 50
+
     def _get_intermediate_summary(
         self, r_1d_pct: float, rvol: float, rsi_14: float, macd_status: str, trend: str
     ) -> str:
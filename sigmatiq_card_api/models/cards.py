@@ -98,6 +98,24 @@ class CardResponse(BaseModel):
         }
 
 
+class CardBatchRequest(BaseModel):
+    """Request body for fetching one card for several symbols."""
+
+    symbols: list[str] = Field(
+        ..., min_length=1, max_length=50, description="Stock symbols (e.g., a watchlist)"
+    )
+
+
+class CardBatchResponse(BaseModel):
+    """Response format for batched ticker card requests."""
+
+    card_id: str = Field(..., description="Card identifier")
+    mode: CardMode = Field(..., description="Response complexity level")
+    data: dict[str, dict[str, Any]] = Field(..., description="Card data payloads keyed by symbol")
+    missing: list[str] = Field(default_factory=list, description="Requested symbols with no data")
+    meta: CardMeta = Field(..., description="Response metadata (symbol is None)")
+
+
 class CardCatalogEntry(BaseModel):
     """Card catalog entry from database."""
 
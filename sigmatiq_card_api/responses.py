@@ -0,0 +1,51 @@
+"""
+JSON response class for card endpoints.
+
+Renders payloads with orjson, which serializes dicts, floats, dates and
+datetimes natively in C and is several times faster than the stdlib encoder
+on the nested card payloads.
+"""
+
+import hashlib
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson does not serialize natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class CardJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def card_etag(card_id: str, mode: str, trading_date: date, data: Any) -> str:
+    """
+    Strong ETag for a card payload.
+
+    Args:
+        card_id: Card identifier
+        mode: Complexity level value
+        trading_date: Trading date the data was resolved to
+        data: Card data payload
+
+    Returns:
+        Quoted digest of the card identity and its data (key order ignored)
+    """
+    digest = hashlib.blake2b(
+        f"{card_id}|{mode}|{trading_date.isoformat()}|".encode(), digest_size=12
+    )
+    digest.update(
+        orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+    )
+    return f'"{digest.hexdigest()}"'
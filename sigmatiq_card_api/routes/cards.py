@@ -7,7 +7,7 @@ Provides endpoints for retrieving pre-formatted market data cards.
 from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Depends, Header, Query
+from fastapi import APIRouter, Body, Depends, Header, Query, Response
 
 from ..config import get_backfill_pool, get_cards_pool
 from ..handlers.economic_calendar import EconomicCalendarHandler
@@ -44,10 +44,11 @@ from ..handlers.ticker_volatility import VolatilitySnapshotHandler
 from ..handlers.unusual_options import UnusualOptionsHandler
 from ..handlers.volume_profile import VolumeProfileHandler
 from ..handlers.watchlist_stats import WatchlistStatsHandler
-from ..models.cards import CardMode, CardResponse
+from ..models.cards import CardBatchRequest, CardBatchResponse, CardMode, CardResponse
+from ..responses import CardJSONResponse, card_etag
 from ..services.card_service import CardService
 
-router = APIRouter(prefix="/cards", tags=["cards"])
+router = APIRouter(prefix="/cards", tags=["cards"], default_response_class=CardJSONResponse)
 
 
 async def get_card_service():
@@ -112,10 +113,14 @@ async def get_card_service():
 @router.get("/{card_id}", response_model=CardResponse)
 async def get_card(
     card_id: str,
+    response: Response,
     mode: CardMode = Query(CardMode.beginner, description="Complexity level"),
     symbol: Optional[str] = Query(None, description="Stock symbol (required for ticker cards)"),
     date_param: Optional[date] = Query(None, alias="date", description="Trading date (defaults to latest)"),
     x_user_id: str = Header(..., alias="X-User-Id", description="User identifier for analytics"),
+    if_none_match: Optional[str] = Header(
+        None, alias="If-None-Match", description="ETag of a cached copy"
+    ),
     card_service: CardService = Depends(get_card_service),
 ):
     """
@@ -129,6 +134,7 @@ async def get_card(
 
     ## Headers
     - **X-User-Id**: User identifier for usage tracking
+    - **If-None-Match**: ETag from a previous response; answered with 304 if the data is unchanged
 
     ## Example Requests
 
@@ -153,16 +159,73 @@ async def get_card(
     - **data**: Card-specific formatted data
     - **meta**: Metadata (trading date, fallback status, data source, timestamp)
 
+    The ETag header covers the card, mode, trading date and data, not the
+    per-request meta timestamp.
+
     ## Error Responses
+    - **304**: Not modified (If-None-Match matches the current ETag)
     - **400**: Bad request (e.g., missing required symbol parameter)
     - **403**: Card is disabled
     - **404**: Card not found or no data available for requested date
     - **500**: Internal server error
     """
-    return await card_service.get_card_data(
+    card = await card_service.get_card_data(
         card_id=card_id,
         mode=mode,
         symbol=symbol,
         date_param=date_param,
         user_id=x_user_id,
     )
+
+    etag = card_etag(card.card_id, card.mode.value, card.meta.trading_date, card.data)
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    return card
+
+
+@router.post("/{card_id}/batch", response_model=CardBatchResponse)
+async def get_card_batch(
+    card_id: str,
+    request: CardBatchRequest = Body(...),
+    mode: CardMode = Query(CardMode.beginner, description="Complexity level"),
+    date_param: Optional[date] = Query(
+        None, alias="date", description="Trading date (defaults to latest)"
+    ),
+    x_user_id: str = Header(..., alias="X-User-Id", description="User identifier for analytics"),
+    card_service: CardService = Depends(get_card_service),
+):
+    """
+    Get one ticker card for several symbols (e.g., a watchlist).
+
+    Cards with a batched handler (such as 'ticker_insider') are served in a
+    single database round-trip instead of one per symbol.
+
+    ## Example Request
+
+    ```bash
+    curl -X POST -H "X-User-Id: test" -H "Content-Type: application/json" \\
+      -d '{"symbols": ["AAPL", "MSFT", "NVDA"]}' \\
+      "http://localhost:8006/api/v1/cards/ticker_insider/batch?mode=intermediate"
+    ```
+
+    ## Response
+    Returns a CardBatchResponse with:
+    - **data**: Card data keyed by symbol
+    - **missing**: Requested symbols with no data for the date
+    - **meta**: Metadata (trading date, fallback status, data source, timestamp)
+
+    ## Error Responses
+    - **400**: Card does not take a symbol
+    - **403**: Card is disabled
+    - **404**: Card not found or no market data for requested date
+    - **422**: Empty symbol list or more than 50 symbols
+    """
+    return await card_service.get_card_batch(
+        card_id=card_id,
+        mode=mode,
+        symbols=request.symbols,
+        date_param=date_param,
+        user_id=x_user_id,
+    )
@@ -24,7 +24,16 @@ from fastapi import HTTPException
 from sigmatiq_shared.cache import get_kv_cache, simple_key
 
 from ..handlers.base import BaseCardHandler
-from ..models.cards import CardCatalogEntry, CardCategory, CardEducation, CardMeta, CardMode, CardResponse
+from ..handlers.cache import ttl_for_trading_date
+from ..models.cards import (
+    CardBatchResponse,
+    CardCatalogEntry,
+    CardCategory,
+    CardEducation,
+    CardMeta,
+    CardMode,
+    CardResponse,
+)
 from .usage_tracking import UsageTrackingService
 
 
@@ -33,7 +42,7 @@ class CardService:
 
     # Cache configuration
     CACHE_NAMESPACE = "cards:eod"
-    CACHE_TTL_SECONDS = 86400  # 24 hours for EOD data (doesn't change)
+    CACHE_TTL_SECONDS = 86400  # 24 hours once the trading date is settled
     CACHE_SWR_SECONDS = 120  # 2 minutes stale-while-revalidate
 
     def __init__(self, cards_pool: asyncpg.Pool, backfill_pool: asyncpg.Pool):
@@ -202,10 +211,16 @@ class CardService:
             # 5. Fetch data from handler with caching
             # Build cache key: card_id|mode|symbol|date
             cache_key = simple_key(card_id, mode.value, symbol or "", actual_date.isoformat())
+            # Today's data is still updating, so it follows the handler's intraday TTL
+            cache_ttl = ttl_for_trading_date(
+                actual_date,
+                intraday_ttl=handler.CACHE_INTRADAY_TTL_SECONDS,
+                settled_ttl=self.CACHE_TTL_SECONDS,
+            )
 
             # Try to get from cache first
             cached = await asyncio.get_event_loop().run_in_executor(
-                None, self.cache.get, self.CACHE_NAMESPACE, cache_key, self.CACHE_TTL_SECONDS
+                None, self.cache.get, self.CACHE_NAMESPACE, cache_key, cache_ttl
             )
 
             if cached is not None:
@@ -217,7 +232,7 @@ class CardService:
 
                 # Store in cache for future requests
                 await asyncio.get_event_loop().run_in_executor(
-                    None, self.cache.set, self.CACHE_NAMESPACE, cache_key, card_data, self.CACHE_TTL_SECONDS
+                    None, self.cache.set, self.CACHE_NAMESPACE, cache_key, card_data, cache_ttl
                 )
 
             # Remove cache metadata from card_data before building response
@@ -289,6 +304,132 @@ class CardService:
 
             raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
 
+    async def get_card_batch(
+        self,
+        card_id: str,
+        mode: CardMode,
+        symbols: list[str],
+        date_param: Optional[date],
+        user_id: str,
+    ) -> CardBatchResponse:
+        """
+        Get one ticker card for several symbols.
+
+        Handlers that implement fetch_many serve the whole batch in a single
+        round-trip; others are fetched per symbol concurrently.
+
+        Args:
+            card_id: Card identifier
+            mode: Complexity level
+            symbols: Stock symbols
+            date_param: Requested date (optional, defaults to today)
+            user_id: User identifier (for analytics)
+
+        Returns:
+            CardBatchResponse with per-symbol data and the symbols that had none
+
+        Raises:
+            HTTPException: If card not found, not a ticker card, or other errors
+        """
+        start_time = time.time()
+
+        try:
+            card_meta = await self.get_card_metadata(card_id)
+
+            if not card_meta.requires_symbol:
+                raise HTTPException(
+                    status_code=400, detail=f"Card '{card_id}' does not take a symbol"
+                )
+
+            if card_id not in self._handlers:
+                raise HTTPException(
+                    status_code=500, detail=f"Handler not registered for card '{card_id}'"
+                )
+
+            handler = self._handlers[card_id]
+            symbols = list(dict.fromkeys(s.upper() for s in symbols))
+
+            # One market-wide date for the whole batch
+            actual_date, fallback_applied = await self.resolve_trading_date(date_param)
+
+            fetch_many = getattr(handler, "fetch_many", None)
+            if fetch_many is not None:
+                data = await fetch_many(mode=mode, symbols=symbols, trading_date=actual_date)
+            else:
+                results = await asyncio.gather(
+                    *(
+                        handler.fetch(mode=mode, symbol=s, trading_date=actual_date)
+                        for s in symbols
+                    ),
+                    return_exceptions=True,
+                )
+                data = {}
+                for s, result in zip(symbols, results):
+                    if isinstance(result, HTTPException) and result.status_code == 404:
+                        continue
+                    if isinstance(result, BaseException):
+                        raise result
+                    data[s] = result
+
+            data = {
+                s: {k: v for k, v in card.items() if k != "_cache_metadata"}
+                for s, card in data.items()
+            }
+
+            meta = CardMeta(
+                card_id=card_id,
+                mode=mode,
+                title=card_meta.title,
+                category=CardCategory(card_meta.category),
+                trading_date=actual_date,
+                requested_date=date_param,
+                fallback_applied=fallback_applied,
+                data_source="postgresql",
+                timestamp=datetime.utcnow(),
+                skill_levels=card_meta.skill_levels or ["beginner"],
+                tags=card_meta.tags or [],
+            )
+
+            response = CardBatchResponse(
+                card_id=card_id,
+                mode=mode,
+                data=data,
+                missing=[s for s in symbols if s not in data],
+                meta=meta,
+            )
+
+            response_time_ms = int((time.time() - start_time) * 1000)
+            self.usage_tracking.log_card_request_background(
+                user_id=user_id,
+                card_id=card_id,
+                mode=mode,
+                symbol=None,
+                date_param=date_param,
+                actual_date=actual_date,
+                response_status=200,
+                response_time_ms=response_time_ms,
+            )
+
+            return response
+
+        except HTTPException:
+            raise
+
+        except Exception as e:
+            response_time_ms = int((time.time() - start_time) * 1000)
+            self.usage_tracking.log_card_request_background(
+                user_id=user_id,
+                card_id=card_id,
+                mode=mode,
+                symbol=None,
+                date_param=date_param,
+                actual_date=date.today(),
+                response_status=500,
+                response_time_ms=response_time_ms,
+            )
+
+            raise HTTPException(status_code=500, detail=f"Internal error: {str(e)}")
+
     async def _resolve_trading_date_for_symbol(
         self, symbol: str, target_date: Optional[date]
     ) -> Optional[tuple[date, bool]]:
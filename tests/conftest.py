@@ -0,0 +1,47 @@
+import pytest
+
+
+@pytest.fixture
+def make_handler():
+    """
+    Factory for card handlers with the database replaced by canned results.
+
+    Call it with the handler class and the module cache it fills; the cache is
+    cleared before and after the test. _fetch_one returns ``row`` and
+    _fetch_all returns ``rows`` (or ``rows(query, params)`` when callable).
+    When ``query``/``params`` are given every fetch asserts them, and each
+    fetch is recorded on ``handler.calls`` as a (query, params) pair.
+    """
+    caches = []
+
+    def factory(handler_cls, cache=None, *, row=None, rows=None, query=None, params=None):
+        if cache is not None:
+            cache.clear()
+            caches.append(cache)
+
+        h = handler_cls(db_pool=None)
+        h.calls = []
+
+        def record(q, p):
+            if query is not None:
+                assert q == query
+            if params is not None:
+                assert p == params
+            h.calls.append((q, p))
+
+        async def fake_fetch_one(q, p):
+            record(q, p)
+            return row
+
+        async def fake_fetch_all(q, p):
+            record(q, p)
+            return rows(q, p) if callable(rows) else rows
+
+        h._fetch_one = fake_fetch_one
+        h._fetch_all = fake_fetch_all
+        return h
+
+    yield factory
+
+    for cache in caches:
+        cache.clear()
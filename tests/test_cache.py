@@ -0,0 +1,59 @@
+import asyncio
+
+from sigmatiq_card_api.handlers.cache import TTLCache
+
+
+async def test_ttl_cache_coalesces_concurrent_misses():
+    cache = TTLCache(maxsize=8)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": calls}
+
+    results = await asyncio.gather(*(cache.get_or_set("k", factory, ttl=60) for _ in range(5)))
+    assert calls == 1
+    assert all(r == {"value": 1} for r in results)
+
+
+async def test_ttl_cache_serves_hits_without_calling_the_factory():
+    cache = TTLCache(maxsize=8)
+    calls = []
+
+    async def factory():
+        calls.append(1)
+        return {"value": len(calls)}
+
+    first = await cache.get_or_set(("AAPL", "beginner"), factory, ttl=60)
+    again = await cache.get_or_set(("AAPL", "beginner"), factory, ttl=60)
+    other = await cache.get_or_set(("AAPL", "advanced"), factory, ttl=60)
+
+    assert again is first
+    assert other == {"value": 2}
+    assert len(calls) == 2
+
+
+async def test_ttl_cache_does_not_store_none_results():
+    cache = TTLCache(maxsize=1)
+    cache.set("row", 1, ttl=60)
+
+    async def factory():
+        return None
+
+    assert await cache.get_or_set("missing", factory, ttl=60) is None
+    assert cache.get("row") == 1
+
+
+def test_ttl_cache_expiry_and_lru_eviction():
+    cache = TTLCache(maxsize=2)
+    cache.set("expired", 1, ttl=0)
+    assert cache.get("expired") is None
+
+    cache.set("a", 1, ttl=60)
+    cache.set("b", 2, ttl=60)
+    cache.get("a")  # "b" becomes least recently used
+    cache.set("c", 3, ttl=60)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
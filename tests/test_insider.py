@@ -0,0 +1,109 @@
+from datetime import date
+
+from sigmatiq_card_api.handlers import ticker_insider
+from sigmatiq_card_api.handlers.ticker_insider import InsiderTransactionsHandler
+from sigmatiq_card_api.models.cards import CardMode
+
+
+def _row(tt, value, name="Jane Doe", title="CEO", direct=True, day=1):
+    return {
+        "transaction_date": date(2025, 10, day),
+        "filing_date": date(2025, 10, day),
+        "owner_name": name,
+        "owner_title": title,
+        "transaction_type": tt,
+        "shares": 100,
+        "price_per_share": 10.0,
+        "value": value,
+        "shares_owned_after": 1000,
+        "is_direct_ownership": direct,
+    }
+
+
+def _totals(**overrides):
+    totals = {
+        "transaction_count": 5,
+        "buy_count": 3,
+        "sell_count": 1,
+        "award_count": 1,
+        "exercise_count": 0,
+        "direct_count": 4,
+        "buy_value": 1700,
+        "sell_value": 300,
+        "exec_count": 4,
+        "exec_buy_count": 2,
+        "exec_sell_count": 1,
+        "exec_net_value": 900,
+        "board_count": 1,
+        "first_buy_value": 1000,
+        "first_buy_owner": "Jane Doe",
+        "first_buy_date": date(2025, 10, 20),
+    }
+    totals.update(overrides)
+    return totals
+
+
+def test_insider_aggregate_combines_sql_totals_with_rows():
+    h = InsiderTransactionsHandler(db_pool=None)
+    rows = [
+        _row("P", 1000.0, day=20),
+        _row("P", 500.0, name="John Roe", title="Director", direct=False, day=15),
+        _row("S", 300.0, day=10),
+        _row("A", None, day=5),
+        _row("P", 200.0, day=2),
+    ]
+    agg = h._aggregate(_totals(), rows)
+    assert agg["buy_values"] == [1000.0, 500.0, 200.0]
+    assert agg["sale_dates"] == [date(2025, 10, 10)]
+    assert agg["columns"]["value"] == [1000.0, 500.0, 300.0, None, 200.0]
+    assert agg["columns"]["transaction_date"][0] == "2025-10-20"
+    assert agg["buy_value"] == 1700.0 and isinstance(agg["buy_value"], float)
+    assert agg["first_buy"]["owner_name"] == "Jane Doe"
+    assert agg["buyer_counts"]["Jane Doe"] == 2
+    assert h._analyze_patterns(agg)["repeat_buyers"] == 1
+
+
+def test_insider_beginner_activity_skips_awards_and_exercises():
+    h = InsiderTransactionsHandler(db_pool=None)
+    rows = [_row("A", None, day=28 - i) for i in range(5)] + [
+        _row("P", 1000.0, day=10),
+        _row("S", 2_500_000.0, day=5),
+    ]
+    agg = h._aggregate(_totals(), rows)
+    card = h._format_beginner("AAPL", agg, "bullish", 1400.0)
+    assert [a["action"] for a in card["recent_activity"]] == ["Bought", "Sold"]
+    assert card["recent_activity"][1]["value"] == "$2.5M"
+
+
+async def test_insider_fetch_many_groups_rows_by_symbol(make_handler):
+    rows = [
+        {"symbol": "AAPL", **_row("P", 1000.0, day=20)},
+        {"symbol": "AAPL", **_row("S", 300.0, day=10)},
+        {"symbol": "MSFT", **_row("S", 500.0, day=12)},
+    ]
+    totals = [
+        {"symbol": "AAPL", **_totals(transaction_count=2, buy_count=1, sell_count=1)},
+        {"symbol": "MSFT", **_totals(transaction_count=1, buy_count=0, sell_count=1)},
+    ]
+    h = make_handler(
+        InsiderTransactionsHandler,
+        ticker_insider._RESPONSE_CACHE,
+        rows=lambda query, params: totals if "GROUP BY symbol" in query else rows,
+    )
+    cards = await h.fetch_many(CardMode.beginner, ["AAPL", "MSFT", "TSLA"], date(2025, 10, 24))
+
+    assert all(params["symbols"] == ["AAPL", "MSFT", "TSLA"] for _, params in h.calls)
+    assert list(cards) == ["AAPL", "MSFT"]
+    assert cards["AAPL"]["symbol"] == "AAPL"
+    assert len(cards["AAPL"]["recent_activity"]) == 2
+    assert cards["MSFT"]["recent_activity"][0]["action"] == "Sold"
+
+
+def test_insider_advanced_skips_pattern_analysis_for_thin_history():
+    h = InsiderTransactionsHandler(db_pool=None)
+    rows = [_row("S", 300.0, day=10)]
+    agg = h._aggregate(_totals(transaction_count=1, buy_count=0, sell_count=1), rows)
+    card = h._format_advanced("AAPL", agg, "bearish", date(2025, 10, 24))
+    assert card["timing_analysis"] == {"pattern": "insufficient_data"}
+    assert card["patterns"]["pattern_type"] == "insufficient_data"
+    assert len(card["all_transactions"]) == 1
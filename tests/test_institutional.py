@@ -0,0 +1,55 @@
+from datetime import date
+
+from sigmatiq_card_api.handlers import ticker_institutional
+from sigmatiq_card_api.handlers.ticker_institutional import InstitutionalOwnershipHandler
+from sigmatiq_card_api.models.cards import CardMode
+
+TRADING_DATE = date(2025, 10, 24)
+
+
+def _holding(rn, name, shares, pct, change):
+    return {
+        "report_date": date(2025, 9, 30),
+        "institution_name": name,
+        "shares_held": shares,
+        "pct_of_shares": pct,
+        "change_in_shares": change,
+        "change_pct": 1.5 if change else None,
+        "rn": rn,
+        "total_institutional_shares": 6_000_000,
+        "institution_count": 12,
+        "position_count": 12,
+        "total_pct": 72.5,
+        "top_5_pct": 30.25,
+        "top_10_pct": 55.5,
+        "increasing": 7,
+        "decreasing": 2,
+        "data_age_days": 24,
+    }
+
+
+async def test_institutional_reads_report_totals_from_sql(make_handler):
+    rows = [
+        _holding(1, "Vanguard", 3_000_000, 12.5, 1000),
+        _holding(2, "BlackRock", 2_000_000, 8.0, -500),
+    ]
+    h = make_handler(InstitutionalOwnershipHandler, ticker_institutional._RESPONSE_CACHE, rows=rows)
+    card = await h.fetch(CardMode.advanced, "AAPL", TRADING_DATE)
+
+    assert card["summary_metrics"]["total_institutional_ownership_pct"] == 72.5
+    assert card["concentration_analysis"]["top_10_pct"] == 55.5
+    assert card["concentration_analysis"]["concentration_level"] == "High"
+    assert card["activity_analysis"]["stable_positions"] == 3
+    assert card["data_quality"]["data_age_days"] == 24
+    holders = [h["institution_name"] for h in card["institutional_holders"]]
+    assert holders == ["Vanguard", "BlackRock"]
+
+
+async def test_institutional_beginner_mode(make_handler):
+    rows = [_holding(1, "Vanguard", 3_000_000, 12.5, 1000)]
+    h = make_handler(InstitutionalOwnershipHandler, ticker_institutional._RESPONSE_CACHE, rows=rows)
+    card = await h.fetch(CardMode.beginner, "AAPL", TRADING_DATE)
+
+    assert card["ownership_level"] == "High"
+    assert card["recent_trend"] == "Increasing"
+    assert card["report_date"] == "2025-09-30"
@@ -0,0 +1,50 @@
+from datetime import date
+
+from sigmatiq_card_api.handlers.ticker_liquidity import LiquidityHandler
+from sigmatiq_card_api.models.cards import CardMode
+
+TRADING_DATE = date(2025, 10, 24)
+
+
+def _row(rank):
+    return {
+        "trading_date": TRADING_DATE,
+        "symbol": "AAPL",
+        "liq_dollar_rank_20": rank,
+        "rvol_pctile_20": 55.0,
+        "volume": 1_000_000,
+        "rvol": 1.25,
+        "close": 50.0,
+    }
+
+
+async def test_liquidity_classes_by_rank_thresholds(make_handler):
+    classes = []
+    for rank in (None, 10.0, 40.0, 79.9, 80.0):
+        h = make_handler(LiquidityHandler, row=_row(rank))
+        classes.append((await h.fetch(CardMode.advanced, "AAPL", TRADING_DATE))["classification"])
+
+    assert classes == ["unknown", "low", "moderate", "moderate", "high"]
+
+
+async def test_liquidity_beginner_mode(make_handler):
+    h = make_handler(LiquidityHandler, row=_row(85.0))
+    card = await h.fetch(CardMode.beginner, "AAPL", TRADING_DATE)
+
+    assert card["liquidity_label"] == "High Liquidity"
+    assert card["dollar_volume"] == 50_000_000
+    assert card["dollar_volume_label"] == "$50.0M daily volume"
+    assert card["sizing_hint"] == "Normal sizing"
+
+
+async def test_liquidity_fetch_many_keys_cards_by_symbol(make_handler):
+    rows = [{**_row(85.0), "symbol": "AAPL"}, {**_row(20.0), "symbol": "TINY"}]
+    h = make_handler(
+        LiquidityHandler,
+        rows=rows,
+        params={"symbols": ["AAPL", "TINY", "NONE"], "trading_date": TRADING_DATE},
+    )
+    cards = await h.fetch_many(CardMode.intermediate, ["AAPL", "TINY", "NONE"], TRADING_DATE)
+
+    classes = {s: c["liquidity_classification"] for s, c in cards.items()}
+    assert classes == {"AAPL": "high", "TINY": "low"}
@@ -0,0 +1,77 @@
+from datetime import date
+
+from sigmatiq_card_api.handlers import ticker_momentum
+from sigmatiq_card_api.handlers.ticker_momentum import MomentumPulseHandler
+from sigmatiq_card_api.models.cards import CardMode
+
+TRADING_DATE = date(2025, 10, 24)
+
+
+def _row(rsi, macd_hist, stoch_k):
+    return {
+        "rsi_14": rsi,
+        "macd": 1.5,
+        "macd_signal": 1.2,
+        "macd_histogram": macd_hist,
+        "stoch_k": stoch_k,
+        "stoch_d": 55.0,
+    }
+
+
+def test_momentum_classification_by_indicator_votes():
+    classify = MomentumPulseHandler._classify_momentum
+    assert classify(65.0, 0.3, 70.0) == "Strong Bullish"
+    assert classify(65.0, -0.3, 70.0) == "Moderate Bullish"
+    assert classify(50.0, 0.0, 50.0) == "Weak"
+    assert classify(35.0, -0.3, 50.0) == "Bearish"
+    assert classify(65.0, -0.3, 50.0) == "Neutral"
+    assert classify(None, None, None) == "Neutral"
+
+
+async def test_momentum_intermediate_mode(make_handler):
+    h = make_handler(MomentumPulseHandler, ticker_momentum._ROW_CACHE, row=_row(65.0, 0.25, 70.0))
+    card = await h.fetch(CardMode.intermediate, "AAPL", TRADING_DATE)
+    assert card["momentum_classification"] == "Strong Bullish"
+    assert card["momentum_score"] == 74
+    assert card["indicators"]["rsi"]["signal"] == "Strong"
+    assert card["indicators"]["macd"]["signal_type"] == "Bullish"
+
+
+async def test_momentum_fetch_many_keys_cards_by_symbol(make_handler):
+    rows = [
+        {**_row(65.0, 0.25, 70.0), "symbol": "AAPL"},
+        {**_row(35.0, -0.1, 30.0), "symbol": "SLOW"},
+    ]
+    h = make_handler(MomentumPulseHandler, ticker_momentum._ROW_CACHE, rows=rows)
+    cards = await h.fetch_many(CardMode.advanced, ["AAPL", "SLOW", "AAPL", "NONE"], TRADING_DATE)
+
+    assert h.calls[0][1]["symbols"] == ["AAPL", "SLOW", "NONE"]
+    classes = {s: c["classification"] for s, c in cards.items()}
+    assert classes == {"AAPL": "Strong Bullish", "SLOW": "Bearish"}
+
+
+async def test_momentum_rows_are_cached_across_modes(make_handler):
+    h = make_handler(MomentumPulseHandler, ticker_momentum._ROW_CACHE, row=_row(65.0, 0.25, 70.0))
+    for mode in CardMode:
+        await h.fetch(mode, "AAPL", TRADING_DATE)
+
+    assert len(h.calls) == 1
+
+
+async def test_momentum_zero_macd_histogram_reads_neutral_in_every_mode(make_handler):
+    h = make_handler(MomentumPulseHandler, ticker_momentum._ROW_CACHE, row=_row(50.0, 0.0, 50.0))
+    intermediate = await h.fetch(CardMode.intermediate, "AAPL", TRADING_DATE)
+    advanced = await h.fetch(CardMode.advanced, "AAPL", TRADING_DATE)
+
+    assert intermediate["indicators"]["macd"]["signal_type"] == "Neutral"
+    assert advanced["raw_indicators"]["macd"]["crossover"] == "Neutral"
+    assert advanced["signal_analysis"]["macd"]["trend"] == "Neutral"
+
+
+async def test_momentum_without_indicators_reads_neutral(make_handler):
+    h = make_handler(MomentumPulseHandler, ticker_momentum._ROW_CACHE, row=_row(None, None, None))
+    card = await h.fetch(CardMode.advanced, "NEWCO", TRADING_DATE)
+    assert card["classification"] == "Neutral"
+    assert card["composite_score"] == 50
+    assert card["raw_indicators"]["macd"]["value"] == 1.5
+    assert card["signal_analysis"]["rsi"]["signal"] == "No data"
@@ -0,0 +1,75 @@
+from datetime import UTC, date, datetime
+
+from sigmatiq_card_api.handlers import ticker_news
+from sigmatiq_card_api.handlers.ticker_news import NewsSentimentHandler
+from sigmatiq_card_api.models.cards import CardMode
+
+TRADING_DATE = date(2025, 10, 24)
+PARAMS = {"symbol": "AAPL", "start_date": date(2025, 10, 17), "end_date": TRADING_DATE}
+
+_SUMMARY = {
+    "avg_sentiment": 0.225,
+    "weighted_sentiment": 0.2714285714,
+    "positive": 2,
+    "neutral": 1,
+    "negative": 1,
+}
+_SOURCES = {"Reuters": (2, 0.2), "Bloomberg": (1, 0.4), "CNBC": (1, 0.1)}
+
+
+def _article(rn, source, score, label, relevance=0.8):
+    count, avg = _SOURCES[source]
+    return {
+        "published_at": datetime(2025, 10, 23, 16 - rn, tzinfo=UTC),
+        "title": f"{source} headline {rn}",
+        "source": source,
+        "sentiment_score": score,
+        "sentiment_label": label,
+        "relevance_score": relevance,
+        "url": f"https://news.example/{rn}",
+        "rn": rn,
+        **_SUMMARY,
+        "source_article_count": count,
+        "source_avg_sentiment": avg,
+    }
+
+
+ARTICLES = [
+    _article(1, "Bloomberg", 0.4, "positive"),
+    _article(2, "Reuters", 0.6, "positive"),
+    _article(3, "Reuters", -0.2, "negative", relevance=0.4),
+    _article(4, "CNBC", 0.1, "neutral"),
+]
+
+
+async def test_news_intermediate_reads_aggregates_from_sql(make_handler):
+    h = make_handler(
+        NewsSentimentHandler,
+        ticker_news._RESPONSE_CACHE,
+        rows=ARTICLES,
+        query=ticker_news._NEWS_QUERY,
+        params=PARAMS,
+    )
+    card = await h.fetch(CardMode.intermediate, "AAPL", TRADING_DATE)
+
+    assert card["sentiment_metrics"]["overall_sentiment"] == "positive"
+    assert card["sentiment_metrics"]["article_count_7d"] == 4
+    assert card["sentiment_distribution"]["positive_pct"] == 50.0
+    assert card["sources"] == [
+        {"name": "Reuters", "count": 2},
+        {"name": "Bloomberg", "count": 1},
+        {"name": "CNBC", "count": 1},
+    ]
+
+
+async def test_news_advanced_uses_weighted_sentiment_and_source_averages(make_handler):
+    h = make_handler(NewsSentimentHandler, ticker_news._RESPONSE_CACHE, rows=ARTICLES)
+    card = await h.fetch(CardMode.advanced, "AAPL", TRADING_DATE)
+
+    assert card["sentiment_analysis"]["weighted_sentiment_score"] == 0.2714285714
+    assert card["source_analysis"][0] == {
+        "source": "Reuters",
+        "article_count": 2,
+        "avg_sentiment": 0.2,
+    }
+    assert len(card["all_articles"]) == 4
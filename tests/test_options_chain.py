@@ -0,0 +1,74 @@
+from datetime import date
+
+from sigmatiq_card_api.handlers import ticker_options_chain
+from sigmatiq_card_api.handlers.ticker_options_chain import OptionsChainHandler
+from sigmatiq_card_api.models.cards import CardMode
+
+TRADING_DATE = date(2025, 10, 24)
+PARAMS = {"symbol": "AAPL", "trading_date": TRADING_DATE}
+
+ATM = [
+    {
+        "kind": "atm",
+        "rn": 1,
+        "expiration_date": date(2025, 10, 31),
+        "strike_price": 100.0,
+        "call_bid": 2.10,
+        "call_ask": 2.20,
+        "call_volume": 500,
+        "call_open_interest": 1000,
+        "call_iv": 0.25,
+        "put_bid": 1.90,
+        "put_ask": 2.00,
+        "put_volume": 400,
+        "put_open_interest": 900,
+        "put_iv": 0.27,
+    },
+]
+SUMMARY = [
+    {
+        "kind": "summary",
+        "rn": 1,
+        "expiration_date": date(2025, 10, 31),
+        "total_call_volume": 1000,
+        "total_put_volume": 800,
+        "total_call_oi": 5000,
+        "total_put_oi": 4000,
+    },
+    {
+        "kind": "summary",
+        "rn": 2,
+        "expiration_date": date(2025, 11, 7),
+        "total_call_volume": 1000,
+        "total_put_volume": 700,
+        "total_call_oi": None,
+        "total_put_oi": 100,
+    },
+]
+CHAIN_ROWS = [{"close": 101.5, **row} for row in ATM + SUMMARY]
+
+
+async def test_options_chain_splits_one_result_set_by_kind(make_handler):
+    h = make_handler(
+        OptionsChainHandler,
+        ticker_options_chain._RESPONSE_CACHE,
+        rows=CHAIN_ROWS,
+        query=ticker_options_chain._CHAIN_QUERY,
+        params=PARAMS,
+    )
+    card = await h.fetch(CardMode.intermediate, "AAPL", TRADING_DATE)
+
+    assert len(h.calls) == 1
+    assert card["current_price"] == 101.5
+    assert len(card["atm_options_next_exp"]) == 1
+    assert [s["expiration"] for s in card["expiration_summary"]] == ["2025-10-31", "2025-11-07"]
+    assert card["volume_analysis"]["put_call_ratio"] == 0.75
+
+
+async def test_options_chain_advanced_ratios(make_handler):
+    h = make_handler(OptionsChainHandler, ticker_options_chain._RESPONSE_CACHE, rows=CHAIN_ROWS)
+    card = await h.fetch(CardMode.advanced, "AAPL", TRADING_DATE)
+
+    assert card["aggregate_metrics"] == {"put_call_volume_ratio": 0.75, "sentiment": "neutral"}
+    assert card["atm_chain"][0]["moneyness"] == -1.48
+    assert card["by_expiration"][1]["metrics"]["put_call_oi_ratio"] is None
@@ -0,0 +1,55 @@
+from datetime import date
+
+from sigmatiq_card_api.handlers import ticker_performance
+from sigmatiq_card_api.handlers.ticker_performance import TickerPerformanceHandler
+from sigmatiq_card_api.models.cards import CardMode
+
+TRADING_DATE = date(2025, 10, 24)
+PARAMS = {"symbol": "AAPL", "trading_date": TRADING_DATE}
+
+ROW = {
+    "symbol": "AAPL",
+    "close": 150.0,
+    "r_1d_pct": 1.25,
+    "volume": 1_000_000,
+    "rvol": 1.8,
+    "atr_pct": 2.0,
+    "rsi_14": 72.0,
+    "macd": 1.2,
+    "macd_signal": 0.8,
+    "bb_position": 0.9,
+    "dist_ma20": 3.0,
+    "dist_ma50": 5.0,
+    "dist_ma200": 12.0,
+}
+
+
+async def test_performance_beginner_labels(make_handler):
+    h = make_handler(TickerPerformanceHandler, ticker_performance._RESPONSE_CACHE, row=ROW)
+    card = await h.fetch(CardMode.beginner, "AAPL", TRADING_DATE)
+
+    assert card["price_label"] == "+1.25% up today"
+    assert card["volume_status"] == "high"
+    assert card["momentum"] == "overbought"
+    assert card["action_block"]["confidence"] == 80
+
+
+async def test_performance_payloads_are_cached_by_upper_case_symbol(make_handler):
+    h = make_handler(
+        TickerPerformanceHandler, ticker_performance._RESPONSE_CACHE, row=ROW, params=PARAMS
+    )
+    first = await h.fetch(CardMode.intermediate, "aapl", TRADING_DATE)
+    again = await h.fetch(CardMode.intermediate, "AAPL", TRADING_DATE)
+
+    assert again is first
+    assert first["trend"] == "uptrend"
+    assert len(h.calls) == 1
+
+
+async def test_performance_keeps_real_zero_readings(make_handler):
+    row = {**ROW, "rvol": 0.0, "rsi_14": None}
+    h = make_handler(TickerPerformanceHandler, ticker_performance._RESPONSE_CACHE, row=row)
+    card = await h.fetch(CardMode.beginner, "AAPL", TRADING_DATE)
+
+    assert card["volume_label"] == "0.0x normal volume (light trading)"
+    assert card["momentum_label"] == "RSI 50 - Momentum is neutral"
@@ -0,0 +1,17 @@
+from datetime import date
+from decimal import Decimal
+
+from sigmatiq_card_api.responses import card_etag
+
+TRADING_DATE = date(2025, 10, 24)
+CARD_ID = "ticker_performance"
+
+
+def test_card_etag_ignores_key_order_and_tracks_data():
+    etag = card_etag(CARD_ID, "beginner", TRADING_DATE, {"a": 1, "b": Decimal("2.5")})
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == card_etag(CARD_ID, "beginner", TRADING_DATE, {"b": 2.5, "a": 1})
+    assert etag != card_etag(CARD_ID, "beginner", TRADING_DATE, {"a": 1, "b": 2.6})
+    assert etag != card_etag(CARD_ID, "advanced", TRADING_DATE, {"a": 1, "b": 2.5})
+    assert etag != card_etag(CARD_ID, "beginner", date(2025, 10, 23), {"a": 1, "b": 2.5})